@@ -0,0 +1,200 @@
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from config_manager import app_config
+from perf import metrics
+from resilience import STATE_CLOSED, CircuitBreaker, RetryBudget, backoff_delay
+
+# Timeouts (conexão, leitura) em segundos por endpoint
+DEFAULT_TIMEOUT = (5, 15)
+ENDPOINT_TIMEOUTS = {
+    'tenant': (5, 15),
+    'get-symbols': (5, 30),
+    'auth': (5, 15),
+    'user-info': (5, 10),
+    'storage': (5, 20),
+}
+
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 10
+
+# Novas tentativas: só métodos idempotentes, em falha de rede ou nestes status
+MAX_RETRIES = 2
+RETRY_METHODS = ('GET', 'HEAD')
+RETRY_STATUSES = (502, 503, 504)
+
+# Disjuntor por endpoint: falhas seguidas para abrir e segundos aberto
+BREAKER_FAILURES = 5
+BREAKER_RESET = 15.0
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Chamada recusada sem ir à rede porque o disjuntor do endpoint está aberto"""
+
+
+class ApiClient:
+    """
+    Cliente HTTP único para o backend
+
+    Mantém uma requests.Session com pool de conexões e keep-alive, de forma que
+    chamadas repetidas reaproveitam conexões TCP/TLS já abertas. O header
+    'token' fica nos headers padrão da sessão e as URLs são montadas a partir
+    de app_config.api_url.
+
+    Toda chamada tem timeout de conexão e leitura por endpoint e passa pelo
+    disjuntor do endpoint: com o backend fora, as chamadas falham na hora
+    (CircuitOpenError) em vez de acumular threads presas. Chamadas GET são
+    repetidas com espera exponencial e jitter, dentro de um orçamento de
+    novas tentativas compartilhado.
+    """
+
+    def __init__(self):
+        self._session = None
+        self._token = None
+        self._lock = threading.Lock()
+        self.breakers = {}
+        self.retry_budget = RetryBudget()
+
+    @property
+    def session(self):
+        """Retorna a sessão compartilhada, criando-a na primeira chamada"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        if self._token != app_config.token:
+            self._token = app_config.token
+            self._session.headers['token'] = self._token
+        return self._session
+
+    @staticmethod
+    def _create_session():
+        """Cria a sessão com o pool de conexões dimensionado"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update({
+            'Accept': 'application/json',
+            'Connection': 'keep-alive',
+        })
+        return session
+
+    def url(self, endpoint):
+        """Monta a URL completa de um endpoint relativo à API"""
+        if endpoint.startswith(('http://', 'https://')):
+            return endpoint
+        return app_config.api_url + endpoint.lstrip('/')
+
+    def storage_url(self, path):
+        """Monta a URL de um arquivo em 'storage/' do backend"""
+        return app_config.api_url.replace('/api/v1', '') + 'storage/' + path
+
+    @staticmethod
+    def endpoint_name(endpoint):
+        """
+        Nome do endpoint usado nos timeouts e nas métricas: o primeiro
+        segmento do caminho relativo à API ('user-info/abc' -> 'user-info')
+        """
+        if endpoint.startswith(('http://', 'https://')):
+            api_url = app_config.api_url
+            if api_url and endpoint.startswith(api_url):
+                endpoint = endpoint[len(api_url):]
+            else:
+                endpoint = urlparse(endpoint).path
+        return endpoint.strip('/').split('/', 1)[0]
+
+    @classmethod
+    def timeout_for(cls, endpoint):
+        """Retorna o timeout configurado para o endpoint"""
+        return ENDPOINT_TIMEOUTS.get(cls.endpoint_name(endpoint), DEFAULT_TIMEOUT)
+
+    def breaker(self, name):
+        """Disjuntor do endpoint, criado no primeiro uso"""
+        breaker = self.breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.setdefault(name, CircuitBreaker(name, BREAKER_FAILURES, BREAKER_RESET))
+        return breaker
+
+    def breaker_states(self):
+        """Estado dos disjuntores que não estão fechados ({endpoint: estado})"""
+        return {name: breaker.state for name, breaker in list(self.breakers.items())
+                if breaker.state != STATE_CLOSED}
+
+    def request(self, method, endpoint, timeout=None, retries=None, **kwargs):
+        """
+        Executa uma requisição usando a sessão compartilhada (medida em api.<endpoint>)
+
+        Falhas de rede e respostas 5xx contam para o disjuntor do endpoint;
+        4xx não (o backend respondeu). retries=None usa MAX_RETRIES para
+        métodos idempotentes e nenhuma nova tentativa para os demais.
+        """
+        name = self.endpoint_name(endpoint)
+        if timeout is None:
+            timeout = self.timeout_for(endpoint)
+        if retries is None:
+            retries = MAX_RETRIES if method in RETRY_METHODS else 0
+        breaker = self.breaker(name)
+        self.retry_budget.deposit()
+
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                raise CircuitOpenError(f"{name}: servidor indisponível, nova tentativa em {breaker.retry_in():.0f}s")
+            error = response = None
+            try:
+                with metrics.span(f'api.{name}'):
+                    response = self.session.request(method, self.url(endpoint), timeout=timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                breaker.record_failure()
+                error = e
+            except Exception:
+                # Libera também a chamada de teste do meio-aberto
+                breaker.record_failure()
+                raise
+            else:
+                if response.status_code < 500:
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if response.status_code not in RETRY_STATUSES:
+                    return response
+
+            if attempt >= retries or not self.retry_budget.withdraw():
+                if error is not None:
+                    raise error
+                return response
+            if response is not None:
+                response.close()
+            attempt += 1
+            delay = backoff_delay(attempt)
+            metrics.record(f'api.{name}.retry', delay)
+            time.sleep(delay)
+
+    def get(self, endpoint, **kwargs):
+        return self.request('GET', endpoint, **kwargs)
+
+    def post(self, endpoint, **kwargs):
+        return self.request('POST', endpoint, **kwargs)
+
+    def get_storage(self, path, **kwargs):
+        """Baixa um arquivo de 'storage/' do backend"""
+        kwargs.setdefault('timeout', ENDPOINT_TIMEOUTS['storage'])
+        return self.request('GET', self.storage_url(path), **kwargs)
+
+    def close(self):
+        """Fecha as conexões abertas do pool"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+                self._token = None
+
+
+# Variável global para acesso fácil
+api_client = ApiClient()
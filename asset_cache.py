@@ -0,0 +1,270 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from urllib.parse import urlparse
+
+from api_client import api_client
+
+# Limite de espaço em disco dos arquivos em cache
+MAX_BYTES = 50 * 1024 * 1024
+
+# Downloads simultâneos na pré-carga
+PREFETCH_WORKERS = 4
+
+# Assinaturas dos formatos de imagem servidos pelo backend
+SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', '.png'),
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'GIF87a', '.gif'),
+    (b'GIF89a', '.gif'),
+    (b'\x00\x00\x01\x00', '.ico'),
+)
+
+
+def guess_extension(content, path=''):
+    """Extensão pelo conteúdo (assinatura do formato) ou, se desconhecido, pelo caminho"""
+    for signature, ext in SIGNATURES:
+        if content.startswith(signature):
+            return ext
+    if content[:4] == b'RIFF' and content[8:12] == b'WEBP':
+        return '.webp'
+    ext = os.path.splitext(urlparse(path).path)[1].lower()
+    return ext if 0 < len(ext) <= 5 else '.bin'
+
+
+class AssetCache:
+    """
+    Cache em disco dos arquivos de 'storage/' do backend (logo, ícone...)
+
+    Os arquivos são gravados pelo hash do conteúdo (<sha256>.<ext>), então o
+    mesmo conteúdo nunca é gravado duas vezes, mesmo vindo de caminhos
+    diferentes, e baixar de novo não cria cópias. Um índice em JSON liga cada
+    caminho remoto ao hash e guarda ETag/Last-Modified para revalidação
+    condicional. Acima de max_bytes os arquivos usados há mais tempo são
+    removidos (LRU).
+
+    Como no ResponseCache, um arquivo em cache é entregue na hora e
+    revalidado depois em segundo plano (revalidate_stale).
+    """
+
+    def __init__(self, cache_dir=os.path.join("cache", "assets"), max_bytes=MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stale = set()
+        self._lock = threading.RLock()
+        self._index = None
+
+    # ---- Índice ----
+
+    @property
+    def index_path(self):
+        return os.path.join(self.cache_dir, "index.json")
+
+    def _load_index(self):
+        if self._index is None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+            self._index.setdefault('entries', {})
+            self._index.setdefault('files', {})
+        return self._index
+
+    def _save_index(self):
+        """Grava o índice de forma atômica (arquivo temporário + rename)"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.index-', suffix='.tmp', dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _file_path(self, name):
+        return os.path.join(self.cache_dir, name)
+
+    def lookup(self, path):
+        """Caminho local do arquivo em cache para o caminho remoto, ou None"""
+        with self._lock:
+            entry = self._load_index()['entries'].get(path)
+            if entry is None:
+                return None
+            local = self._file_path(entry['file'])
+            return local if os.path.exists(local) else None
+
+    def _touch(self, name):
+        info = self._index['files'].get(name)
+        if info is not None:
+            info['used_at'] = time.time()
+
+    # ---- Busca ----
+
+    def get(self, path):
+        """
+        Retorna o caminho local do arquivo, priorizando a cópia em cache
+
+        Se houver cache, o arquivo é marcado para revalidação posterior;
+        caso contrário é baixado na hora.
+        """
+        with self._lock:
+            local = self.lookup(path)
+            if local is not None:
+                self._touch(self._index['entries'][path]['file'])
+                self._save_index()
+                self.stale.add(path)
+                return local
+        local, _ = self.fetch(path)
+        return local
+
+    def fetch(self, path):
+        """
+        Baixa o arquivo com requisição condicional
+
+        Retorna (caminho_local, mudou). Um 304 ou um conteúdo com o mesmo hash
+        contam como "não mudou".
+        """
+        with self._lock:
+            entry = dict(self._load_index()['entries'].get(path) or {})
+        if entry and not os.path.exists(self._file_path(entry['file'])):
+            entry = {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        response = api_client.get_storage(path, headers=headers)
+        if response.status_code == 304 and entry:
+            return self._store_entry(path, entry, response, entry['file']), False
+        response.raise_for_status()
+
+        content = response.content
+        name = sha256(content).hexdigest() + guess_extension(content, path)
+        changed = entry.get('file') != name
+        local = self._file_path(name)
+        if not os.path.exists(local):
+            self._write_file(local, content)
+        return self._store_entry(path, entry, response, name, len(content)), changed
+
+    def _write_file(self, local, content):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.asset-', suffix='.tmp', dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, local)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _store_entry(self, path, entry, response, name, size=None):
+        now = time.time()
+        with self._lock:
+            index = self._load_index()
+            index['entries'][path] = {
+                'file': name,
+                'etag': response.headers.get('ETag') or entry.get('etag'),
+                'last_modified': response.headers.get('Last-Modified') or entry.get('last_modified'),
+                'checked_at': now,
+            }
+            info = index['files'].setdefault(name, {'size': size or 0})
+            if size is not None:
+                info['size'] = size
+            info['used_at'] = now
+            # Conteúdo substituído no servidor: o arquivo antigo não é mais referenciado
+            previous = entry.get('file')
+            if previous and previous != name and all(e['file'] != previous for e in index['entries'].values()):
+                self._remove_file(previous)
+            self._evict(keep=name)
+            self._save_index()
+        return self._file_path(name)
+
+    def _remove_file(self, name):
+        self._index['files'].pop(name, None)
+        try:
+            os.remove(self._file_path(name))
+        except OSError:
+            pass
+
+    def _evict(self, keep=None):
+        """Remove os arquivos usados há mais tempo até caber em max_bytes"""
+        files = self._index['files']
+        total = sum(info['size'] for info in files.values())
+        if total <= self.max_bytes:
+            return
+        for name in sorted(files, key=lambda n: files[n]['used_at']):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            total -= files[name]['size']
+            self._remove_file(name)
+        entries = self._index['entries']
+        for path in [path for path, entry in entries.items() if entry['file'] not in files]:
+            del entries[path]
+
+    def prefetch(self, paths, workers=PREFETCH_WORKERS):
+        """
+        Obtém vários arquivos em paralelo
+
+        Retorna {caminho_remoto: caminho_local}; None para os que falharam.
+        """
+        paths = [path for path in dict.fromkeys(paths) if path]
+        results = {}
+
+        def fetch_one(path):
+            try:
+                return path, self.get(path)
+            except Exception as e:
+                print(f"Erro ao baixar {path}: {e}")
+                return path, None
+
+        if not paths:
+            return results
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            for path, local in executor.map(fetch_one, paths):
+                results[path] = local
+        return results
+
+    def revalidate_stale(self, on_change=None):
+        """
+        Revalida em segundo plano os arquivos servidos do cache
+
+        Parâmetros:
+        - on_change: callback({caminho_remoto: caminho_local}) chamado se algum conteúdo mudou
+        """
+        with self._lock:
+            paths = sorted(self.stale)
+            self.stale.clear()
+        if not paths:
+            return None
+
+        def worker():
+            changed = {}
+            for path in paths:
+                try:
+                    local, did_change = self.fetch(path)
+                    if did_change:
+                        changed[path] = local
+                except Exception as e:
+                    print(f"Erro ao revalidar {path}: {e}")
+            if changed and on_change:
+                on_change(changed)
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        return thread
+
+
+# Variável global para acesso fácil
+asset_cache = AssetCache()
@@ -0,0 +1,69 @@
+import os
+from hashlib import sha256
+from io import BytesIO
+
+from PIL import Image
+
+# Tamanhos de miniatura usados pela interface
+THUMBNAIL_SIZES = {
+    'login_logo': (150, 150),
+}
+THUMBNAIL_DIR = os.path.join("assets", "thumbs")
+
+
+def content_hash(content):
+    """Retorna o hash SHA-256 do conteúdo"""
+    return sha256(content).hexdigest()
+
+
+def open_image(content):
+    """Abre a imagem a partir dos bytes (a decodificação completa é preguiçosa)"""
+    return Image.open(BytesIO(content))
+
+
+def thumbnail_path(digest, size):
+    """Caminho da miniatura de um conteúdo num tamanho"""
+    return os.path.join(THUMBNAIL_DIR, f"{digest}_{size[0]}x{size[1]}.png")
+
+
+def generate_thumbnails(content, image=None, sizes=None):
+    """
+    Gera as miniaturas de um conteúdo, indexadas pelo hash dos bytes
+
+    A imagem é decodificada uma única vez (reaproveitando `image` se já foi
+    aberta) e cada tamanho só é gerado se ainda não existir em disco. As
+    miniaturas são PNG com compressão leve, pois são pequenas e lidas muitas
+    vezes.
+
+    Retorna um dicionário {nome: caminho}.
+    """
+    sizes = sizes or THUMBNAIL_SIZES
+    digest = content_hash(content)
+    paths = {name: thumbnail_path(digest, size) for name, size in sizes.items()}
+    missing = {name: sizes[name] for name, path in paths.items() if not os.path.exists(path)}
+    if not missing:
+        return paths
+
+    os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+    if image is None:
+        image = open_image(content)
+    image.load()
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA')
+
+    for name, size in missing.items():
+        tmp_path = paths[name] + '.tmp'
+        image.resize(size, Image.LANCZOS).save(tmp_path, 'PNG', compress_level=1)
+        os.replace(tmp_path, paths[name])
+    return paths
+
+
+def thumbnail_for(path, name):
+    """
+    Retorna a miniatura pronta de um arquivo local, gerando-a se necessário
+
+    Usado para o logo obtido pelo cache de arquivos e para o logo padrão.
+    """
+    with open(path, 'rb') as f:
+        content = f.read()
+    return generate_thumbnails(content, sizes={name: THUMBNAIL_SIZES[name]})[name]
@@ -0,0 +1,85 @@
+"""
+Microbenchmark de leitura e escrita do ConfigManager
+
+Leitura: compara o get() indexado com a resolução antiga (split + percurso
+dos dicionários a cada chamada) para as chaves mais usadas pela interface.
+
+Escrita: set_config com gravação atômica a cada chamada, agrupado em
+batch() e com valor inalterado, com catálogos de símbolos de tamanhos
+diferentes (a gravação serializa o config.json inteiro).
+
+Uso:
+    python benchmarks/bench_config_manager.py
+"""
+import timeit
+
+from common import use_workdir
+from stub_backend import make_symbols
+
+# O ConfigManager grava config.json no diretório atual: roda num diretório temporário
+use_workdir('bench-config-')
+
+from config_manager import app_config  # noqa: E402
+
+HOT_KEYS = ['api', 'token', 'user.uuid', 'user.wallet.balance', 'user.name', 'user.phone_number']
+NUMBER = 200_000
+WRITES = 200
+SINGLE_WRITES = 5
+SYMBOL_SIZES = (0, 1_000, 10_000, 50_000)
+
+
+def main():
+    app_config.set_config('user', {
+        'uuid': 'bench-uuid',
+        'name': 'Bench',
+        'last_name': 'User',
+        'phone_code': '55',
+        'phone_number': '11999999999',
+        'wallet': {'balance': 1234.56},
+    })
+
+    def uncached():
+        for key in HOT_KEYS:
+            app_config._resolve(key)
+
+    def cached():
+        for key in HOT_KEYS:
+            app_config.get(key)
+
+    def accessors():
+        app_config.api_url
+        app_config.token
+        app_config.user_uuid
+
+    for name, fn, keys in (('resolve (antigo)', uncached, len(HOT_KEYS)),
+                           ('get indexado', cached, len(HOT_KEYS)),
+                           ('acessores tipados', accessors, 3)):
+        best = min(timeit.repeat(fn, number=NUMBER, repeat=5))
+        print(f"{name:<20} {best / (NUMBER * keys) * 1e9:8.1f} ns/leitura")
+
+    print()
+    for size in SYMBOL_SIZES:
+        app_config.set_config('symbols', make_symbols(size))
+        counter = iter(range(10 ** 9))
+
+        def write():
+            app_config.set_config('bench.counter', next(counter))
+
+        def batched():
+            with app_config.batch():
+                for _ in range(WRITES):
+                    write()
+
+        def unchanged():
+            app_config.set_config('bench.fixed', 1)
+
+        per_write = min(timeit.repeat(write, number=SINGLE_WRITES, repeat=3)) / SINGLE_WRITES
+        per_batch = min(timeit.repeat(batched, number=1, repeat=3)) / WRITES
+        per_noop = min(timeit.repeat(unchanged, number=WRITES, repeat=3)) / WRITES
+        print(f"{size:>6} símbolos  set_config {per_write * 1e3:8.3f} ms/escrita  "
+              f"em batch {per_batch * 1e6:8.1f} µs/escrita  "
+              f"sem mudança {per_noop * 1e6:6.1f} µs")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark do histórico de operações por tamanho (1 mil, 10 mil e 100 mil linhas)
+
+- HistoryStore: inserção em lote, leitura paginada por cursor (o custo por
+  página deve ser o mesmo em qualquer ponto do histórico) e contagem
+- TradeStats: recarga completa das estatísticas (NumPy, se instalado) e
+  atualização incremental por operação liquidada
+- VirtualTreeview: inserção de todas as linhas, rolagem para posições
+  aleatórias e carga de páginas antigas (extend_older); só roda com display
+
+Uso:
+    python benchmarks/bench_history.py
+    python benchmarks/bench_history.py --sizes 1000 10000
+"""
+import argparse
+import random
+import time
+
+from common import latency_summary, timed, use_workdir
+
+use_workdir('bench-history-')
+
+from history_store import HistoryStore  # noqa: E402
+from trade_stats import TradeStats, numpy  # noqa: E402
+
+SIZES = (1_000, 10_000, 100_000)
+PAGE_SIZE = 200
+SCROLLS = 300
+COLUMNS = ("market", "type", "time", "value", "result", "entry_time", "date")
+
+
+def make_operations(count, seed=42):
+    rng = random.Random(seed)
+    start = int(time.time()) - count * 60
+    operations = []
+    for i in range(count):
+        entry = start + i * 60
+        minutes = rng.choice((1, 5, 15, 60))
+        value = round(rng.uniform(10, 1000), 2)
+        operations.append({
+            'id': f"op-{i}",
+            'user': 'bench-user',
+            'symbol': rng.choice(('EURUSD', 'GBPUSD', 'USDJPY', 'BTCUSD')),
+            'market': None,
+            'type': rng.choice(('CALL', 'PUT')),
+            'time_minutes': minutes,
+            'value': value,
+            'entry_time': entry,
+            'expiry_time': entry + minutes * 60,
+            'status': 'settled',
+            'result': round(value * rng.uniform(-1, 0.9), 2),
+        })
+    return operations
+
+
+def row_values(op):
+    return (op['symbol'], op['type'], op['time_minutes'], f"${op['value']:.2f}",
+            f"{op['result']:+.2f}", op['entry_time'], op['expiry_time'])
+
+
+def bench_store(size, operations):
+    store = HistoryStore(f"history-{size}.db")
+    insert, _ = timed(store.add_many, operations)
+
+    pages, cursor = [], None
+    while True:
+        elapsed, (_, cursor) = timed(store.page, 'bench-user', cursor, PAGE_SIZE)
+        pages.append(elapsed)
+        if cursor is None:
+            break
+    count, _ = timed(store.count, 'bench-user')
+    settled, (_, symbols, minutes, results) = timed(store.settled, 'bench-user')
+    store.close()
+
+    print(f"  SQLite    inserção {insert * 1000:9.1f} ms ({insert / size * 1e6:.1f} µs/linha)  "
+          f"contagem {count * 1000:.2f} ms")
+    print(f"            página de {PAGE_SIZE} ({len(pages)} páginas)  {latency_summary(pages)}  "
+          f"primeira {pages[0] * 1000:.3f} ms")
+
+    # Importa o NumPy antes de medir
+    engine = "NumPy" if numpy() else "Python puro"
+    stats = TradeStats()
+    reload, _ = timed(stats.reload, symbols, minutes, results)
+    incremental, _ = timed(lambda: [stats.add(s, m, r) for s, m, r in zip(symbols, minutes, results)])
+    print(f"  Estatíst. leitura {settled * 1000:8.1f} ms  recarga ({engine}) {reload * 1000:8.1f} ms  "
+          f"incremental {incremental / size * 1e6:.2f} µs/operação")
+
+
+def bench_table(root, size, operations):
+    from virtual_tree import VirtualTreeview
+
+    table = VirtualTreeview(root, columns=COLUMNS)
+    table.pack(expand=True, fill="both")
+    root.update()
+
+    # Metade como linhas recentes e metade como páginas antigas, como no app
+    half = size // 2
+    recent = [(op['id'], row_values(op)) for op in operations[half:]]
+    older = [(op['id'], row_values(op)) for op in reversed(operations[:half])]
+
+    insert, _ = timed(table.extend, recent)
+    older_pages = [timed(table.extend_older, older[i:i + PAGE_SIZE])[0]
+                   for i in range(0, len(older), PAGE_SIZE)]
+    root.update()
+
+    rng = random.Random(7)
+    scrolls = []
+    for _ in range(SCROLLS):
+        start = time.perf_counter()
+        table.scroll_to(rng.randrange(len(table)))
+        root.update_idletasks()
+        scrolls.append(time.perf_counter() - start)
+    table.destroy()
+
+    print(f"  Tabela    inserção {insert * 1000:9.1f} ms ({len(recent)} linhas)  "
+          f"página antiga {latency_summary(older_pages)}")
+    print(f"            rolagem  {latency_summary(scrolls)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do histórico de operações")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    args = parser.parse_args(argv)
+
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+        root.geometry("1000x600")
+    except Exception as e:
+        root = None
+        print(f"Sem display ({e}): apenas o SQLite será medido")
+
+    for size in args.sizes:
+        operations = make_operations(size)
+        print(f"\n{size} operações")
+        bench_store(size, operations)
+        if root is not None:
+            bench_table(root, size, operations)
+
+    if root is not None:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
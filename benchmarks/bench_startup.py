@@ -0,0 +1,139 @@
+"""
+Benchmark de inicialização da interface
+
+Mede, de fora do processo, o tempo desde o spawn até a tela de carregamento
+aparecer e até a tela de login ficar pronta, usando as linhas que o robo.py
+imprime nesses dois momentos (só com ROBO_STARTUP_TIMING definida). Roda o script (python robo.py) e, se existir,
+o executável gerado pelo PyInstaller.
+
+Por padrão cada alvo roda num diretório temporário apontado para o backend
+local (stub_backend.py): a primeira execução é a fria (sem cache, baixa o
+logo) e é reportada à parte; as demais usam o cache e entram na mediana.
+Com --live o app roda no diretório do projeto contra o backend configurado.
+
+Também confere que requests e PIL não são importados antes da tela de
+carregamento.
+
+Requer um display (no Linux sem interface: xvfb-run).
+
+Uso:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 10 --exe dist/robo/robo
+    python benchmarks/bench_startup.py --symbols 50000 --latency 50
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from common import ROOT
+from stub_backend import StubBackend
+
+SPLASH_MARKER = "Tempo até a tela de carregamento"
+LOGIN_MARKER = "Tempo até a tela de login"
+HEAVY_MODULES = ('requests', 'PIL', 'screens', 'order_queue', 'history_store')
+
+
+def default_executable():
+    """Caminho padrão do build do PyInstaller (onedir ou onefile)"""
+    name = 'robo.exe' if os.name == 'nt' else 'robo'
+    for path in (os.path.join(ROOT, 'dist', 'robo', name), os.path.join(ROOT, 'dist', name)):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def run_once(command, timeout, cwd=ROOT):
+    """
+    Executa um processo até a tela de login e o encerra
+
+    Retorna (segundos_até_carregamento, segundos_até_login); None onde o
+    marcador não apareceu dentro do timeout.
+    """
+    # ROBO_STARTUP_TIMING faz o robo.py imprimir os marcadores lidos abaixo
+    env = dict(os.environ, PYTHONUNBUFFERED='1', PYTHONIOENCODING='utf-8', ROBO_STARTUP_TIMING='1')
+    started = time.perf_counter()
+    process = subprocess.Popen(command, cwd=cwd, env=env, stdout=subprocess.PIPE,
+                               stderr=subprocess.STDOUT, text=True, encoding='utf-8')
+    times = {}
+
+    def read():
+        for line in process.stdout:
+            for marker in (SPLASH_MARKER, LOGIN_MARKER):
+                if line.startswith(marker) and marker not in times:
+                    times[marker] = time.perf_counter() - started
+            if LOGIN_MARKER in times:
+                return
+
+    reader = threading.Thread(target=read, daemon=True)
+    reader.start()
+    reader.join(timeout)
+    process.kill()
+    process.wait()
+    return times.get(SPLASH_MARKER), times.get(LOGIN_MARKER)
+
+
+def summarize(label, samples):
+    cold, warm = samples[0], samples[1:]
+    print(f"\n{label}")
+    for index, name in enumerate(("tela de carregamento", "tela de login")):
+        cold_value = cold[index]
+        values = [sample[index] for sample in warm if sample[index] is not None]
+        line = f"  {name:<22} frio: {cold_value:.3f}s" if cold_value is not None else f"  {name:<22} frio: -"
+        if values:
+            line += (f"  quente: mediana {statistics.median(values):.3f}s"
+                     f"  min {min(values):.3f}s  max {max(values):.3f}s  (n={len(values)})")
+        print(line)
+
+
+def check_imports():
+    """Lista os módulos pesados carregados só por importar o robo.py"""
+    code = (
+        "import sys; import robo; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    output = subprocess.run([sys.executable, '-c', code], cwd=tempfile.mkdtemp(prefix='bench-imports-'),
+                            env=env, capture_output=True, text=True).stdout.strip()
+    print(f"Módulos pesados importados antes da tela de carregamento: {output or 'nenhum'}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o tempo de inicialização da interface")
+    parser.add_argument('--runs', type=int, default=5, help="execuções por alvo (a primeira é a fria)")
+    parser.add_argument('--exe', default=default_executable(), help="executável do PyInstaller")
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--live', action='store_true', help="usa o backend e o cache do projeto")
+    parser.add_argument('--symbols', type=int, default=200, help="símbolos servidos pelo backend local")
+    parser.add_argument('--latency', type=float, default=0.0, help="atraso do backend local por requisição (ms)")
+    args = parser.parse_args(argv)
+
+    check_imports()
+
+    targets = [("script (python robo.py)", [sys.executable, os.path.join(ROOT, 'robo.py')])]
+    if args.exe:
+        targets.append((f"PyInstaller ({os.path.relpath(args.exe, ROOT)})", [args.exe]))
+    else:
+        print("Executável do PyInstaller não encontrado (gere com: pyinstaller robo.py)")
+
+    if args.live:
+        for label, command in targets:
+            samples = [run_once(command, args.timeout) for _ in range(max(1, args.runs))]
+            summarize(label, samples)
+        return
+
+    with StubBackend(symbols=args.symbols, latency=args.latency / 1000) as backend:
+        print(f"Backend local: {backend.api_url} ({args.symbols} símbolos)")
+        for label, command in targets:
+            workdir = tempfile.mkdtemp(prefix='bench-startup-')
+            backend.write_config(workdir)
+            samples = [run_once(command, args.timeout, workdir) for _ in range(max(1, args.runs))]
+            summarize(label, samples)
+
+
+if __name__ == "__main__":
+    main()
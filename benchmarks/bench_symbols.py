@@ -0,0 +1,72 @@
+"""
+Benchmark do catálogo de símbolos por tamanho
+
+Para cada tamanho (10 a 50 mil símbolos), contra o backend local:
+- inicialização fria: tenant + get-symbols pela rede e gravação local
+- inicialização quente: as mesmas respostas servidas do cache em disco
+- montagem do índice de busca (SymbolIndex)
+- latência da busca do campo de mercado (prefixos e erros de digitação)
+
+Uso:
+    python benchmarks/bench_symbols.py
+    python benchmarks/bench_symbols.py --sizes 10 1000 --latency 20
+"""
+import argparse
+import random
+import shutil
+
+from common import latency_summary, timed, use_workdir
+from stub_backend import StubBackend
+
+use_workdir('bench-symbols-')
+
+import bootstrap  # noqa: E402
+from config_manager import app_config  # noqa: E402
+from response_cache import response_cache  # noqa: E402
+from symbol_index import SymbolIndex  # noqa: E402
+
+SIZES = (10, 100, 1_000, 10_000, 50_000)
+QUERIES = 300
+SUGGESTIONS = 20
+
+
+def sample_queries(symbols, count=QUERIES, seed=42):
+    """Textos digitados: prefixos de 1 a 4 letras e códigos com uma transposição"""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        label, code = rng.choice(symbols)
+        if rng.random() < 0.8:
+            queries.append(label[:rng.randint(1, 4)])
+        elif len(code) >= 4:
+            i = rng.randrange(len(code) - 1)
+            queries.append(code[:i] + code[i + 1] + code[i] + code[i + 2:])
+        else:
+            queries.append(code)
+    return queries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do catálogo de símbolos")
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--latency', type=float, default=0.0, help="atraso do backend por requisição (ms)")
+    args = parser.parse_args(argv)
+
+    print(f"{'símbolos':>8}  {'frio':>9}  {'cache':>9}  {'índice':>9}  busca")
+    for size in args.sizes:
+        with StubBackend(symbols=size, latency=args.latency / 1000) as backend:
+            app_config.set_config('api', backend.api_url)
+            shutil.rmtree(response_cache.cache_dir, ignore_errors=True)
+
+            cold, _ = timed(bootstrap.config_pipeline().run)
+            warm, _ = timed(bootstrap.config_pipeline().run)
+            build, index = timed(SymbolIndex, app_config.symbols)
+            searches = [timed(index.search, query, SUGGESTIONS)[0]
+                        for query in sample_queries(index.symbols)]
+
+        print(f"{size:>8}  {cold * 1000:7.1f}ms  {warm * 1000:7.1f}ms  {build * 1000:7.1f}ms  "
+              f"{latency_summary(searches)}")
+
+
+if __name__ == "__main__":
+    main()
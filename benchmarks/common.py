@@ -0,0 +1,43 @@
+"""Utilitários compartilhados pelos benchmarks"""
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def use_workdir(prefix):
+    """
+    Coloca o projeto no sys.path e muda para um diretório temporário
+
+    config.json, cache/ e history.db são relativos ao diretório atual, então
+    cada benchmark roda isolado sem tocar nos arquivos do projeto. Deve ser
+    chamado antes de importar config_manager.
+    """
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+    directory = tempfile.mkdtemp(prefix=prefix)
+    os.chdir(directory)
+    return directory
+
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def latency_summary(samples):
+    """p50/p95/máx em milissegundos"""
+    return (f"p50 {percentile(samples, 50) * 1000:8.3f} ms  "
+            f"p95 {percentile(samples, 95) * 1000:8.3f} ms  "
+            f"máx {max(samples) * 1000:8.3f} ms")
+
+
+def timed(func, *args, **kwargs):
+    """Executa func e retorna (segundos, resultado)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
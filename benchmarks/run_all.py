@@ -0,0 +1,42 @@
+"""
+Executa todos os benchmarks em sequência, cada um no seu processo
+
+Uso:
+    python benchmarks/run_all.py            (todos)
+    python benchmarks/run_all.py --quick    (tamanhos menores, para conferência rápida)
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+BENCHMARKS = (
+    ('ConfigManager', 'bench_config_manager.py', []),
+    ('Catálogo de símbolos', 'bench_symbols.py', ['--sizes', '10', '1000']),
+    ('Histórico', 'bench_history.py', ['--sizes', '1000', '10000']),
+    ('Inicialização', 'bench_startup.py', ['--runs', '3']),
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executa a suíte de benchmarks")
+    parser.add_argument('--quick', action='store_true', help="usa tamanhos menores")
+    args = parser.parse_args(argv)
+
+    failed = []
+    for title, script, quick_args in BENCHMARKS:
+        print(f"\n=== {title} ===", flush=True)
+        command = [sys.executable, os.path.join(HERE, script)] + (quick_args if args.quick else [])
+        if subprocess.run(command).returncode != 0:
+            failed.append(title)
+
+    if failed:
+        print(f"\nFalharam: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
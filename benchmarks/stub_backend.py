@@ -0,0 +1,202 @@
+"""
+Backend local para os benchmarks
+
+Responde os endpoints usados na inicialização e no login com dados
+sintéticos, sem rede externa:
+- GET  /api/v1/tenant/            configurações do tenant
+- GET  /api/v1/get-symbols/       catálogo com N símbolos
+- POST /api/v1/auth               qualquer email/senha não vazios
+- GET  /api/v1/user-info/<uuid>   dados do usuário (com ETag / 304)
+- GET  /storage/logo.png          PNG gerado na hora
+
+Uso:
+    python benchmarks/stub_backend.py --port 8766 --symbols 10000 --latency 20
+
+e aponte o app com "api": "http://127.0.0.1:8766/api/v1/" no config.json.
+"""
+import argparse
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+API_PREFIX = '/api/v1/'
+USER_UUID = 'bench-user'
+
+FX_CURRENCIES = ('EUR', 'USD', 'GBP', 'JPY', 'AUD', 'CAD', 'CHF', 'NZD', 'BRL', 'MXN')
+
+
+def make_symbols(count):
+    """Catálogo sintético: pares de moedas primeiro, depois ativos numerados"""
+    symbols = []
+    for base in FX_CURRENCIES:
+        for quote in FX_CURRENCIES:
+            if base != quote and len(symbols) < count:
+                symbols.append({'label': f"{base}/{quote}", 'code': f"{base}{quote}"})
+    i = 0
+    while len(symbols) < count:
+        symbols.append({'label': f"Ativo {i} Index", 'code': f"AT{i:05d}"})
+        i += 1
+    return symbols
+
+
+def make_png(width=300, height=300, color=(32, 160, 96)):
+    """PNG RGB de cor sólida, gerado sem PIL"""
+    def chunk(kind, data):
+        body = kind + data
+        return struct.pack('>I', len(data)) + body + struct.pack('>I', zlib.crc32(body) & 0xffffffff)
+
+    row = b'\x00' + bytes(color) * width
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(row * height))
+            + chunk(b'IEND', b''))
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    backend = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, body, content_type='application/json', status=200, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_cached(self, body, content_type='application/json'):
+        """Responde com ETag e 304 quando o cliente já tem a versão atual"""
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        self.send_body(body, content_type, headers={'ETag': etag})
+
+    def do_GET(self):
+        self.backend.delay()
+        path = urlparse(self.path).path
+        if path == API_PREFIX + 'tenant/':
+            self.send_cached(self.backend.tenant)
+        elif path == API_PREFIX + 'get-symbols/':
+            self.send_cached(self.backend.symbols)
+        elif path.startswith(API_PREFIX + 'user-info/'):
+            self.send_cached(self.backend.user_info)
+        elif path == '/storage/logo.png':
+            self.send_cached(self.backend.logo, 'image/png')
+        elif path == '/storage/favicon.png':
+            self.send_cached(self.backend.fav_icon, 'image/png')
+        else:
+            self.send_body(b'{"error": "not found"}', status=404)
+
+    def do_POST(self):
+        self.backend.delay()
+        length = int(self.headers.get('Content-Length') or 0)
+        payload = json.loads(self.rfile.read(length) or b'{}')
+        if urlparse(self.path).path.rstrip('/') != API_PREFIX + 'auth':
+            self.send_body(b'{"error": "not found"}', status=404)
+        elif payload.get('email') and payload.get('password'):
+            self.send_body(self.backend.user_info)
+        else:
+            self.send_body(b'{"error": "invalid"}', status=401)
+
+
+class StubBackend:
+    """Servidor HTTP local em thread própria (porta 0 = qualquer porta livre)"""
+
+    def __init__(self, symbols=200, latency=0.0, host='127.0.0.1', port=0):
+        self.latency = latency
+        self.symbol_list = make_symbols(symbols)
+        self.tenant = json.dumps({'setting': {
+            'name': 'Bench',
+            'dominio': 'bench.local',
+            'min_deposit': 10, 'max_deposit': 10000,
+            'min_withdrawal': 10, 'max_withdrawal': 10000,
+            'min_bet': 1, 'max_bet': 5000,
+            'fav_icon': 'favicon.png',
+            'link_support': 'https://bench.local/suporte',
+            'logo': 'logo.png',
+        }}).encode()
+        self.symbols = json.dumps(self.symbol_list).encode()
+        self.user_info = json.dumps({'data': {
+            'uuid': USER_UUID,
+            'name': 'Bench',
+            'last_name': 'User',
+            'phone_code': '55',
+            'phone_number': '11999999999',
+            'wallet': {'balance': 1000.0},
+        }}).encode()
+        self.logo = make_png()
+        self.fav_icon = make_png(32, 32)
+
+        handler = type('BoundStubHandler', (StubHandler,), {'backend': self})
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def api_url(self):
+        return self.base_url + API_PREFIX.lstrip('/')
+
+    def delay(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def write_config(self, directory):
+        """Grava um config.json apontando para este backend e retorna o caminho"""
+        path = os.path.join(directory, 'config.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'token': 'bench-token', 'api': self.api_url, 'site': self.base_url}, f)
+        return path
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backend local para benchmarks")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--symbols', type=int, default=200, help="tamanho do catálogo de símbolos")
+    parser.add_argument('--latency', type=float, default=0.0, help="atraso por requisição (ms)")
+    args = parser.parse_args()
+
+    backend = StubBackend(args.symbols, args.latency / 1000, args.host, args.port)
+    print(f"Backend local em {backend.api_url}")
+    try:
+        backend.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Inicialização sem interface gráfica
+
+Funções compartilhadas pela tela de carregamento e pelo modo headless para
+obter as configurações do tenant, gravá-las localmente e autenticar o
+usuário. Este módulo não importa tkinter nem PIL.
+"""
+from api_client import api_client
+from asset_cache import asset_cache
+from config_manager import app_config
+from response_cache import response_cache
+from startup_pipeline import StartupPipeline
+
+
+def fetch_tenant():
+    return response_cache.get('tenant/')['setting']
+
+
+def fetch_symbols():
+    return response_cache.get('get-symbols/')
+
+
+def update_local_config(api_config):
+    """Atualiza configurações locais com base na API"""
+    try:
+        with app_config.batch():
+            app_config.set_config('name', "Robo (" + api_config['name'] + ")")
+            app_config.set_config('dominio', api_config['dominio'])
+            app_config.set_config('min_deposit', api_config['min_deposit'])
+            app_config.set_config('max_deposit', api_config['max_deposit'])
+            app_config.set_config('min_withdrawal', api_config['min_withdrawal'])
+            app_config.set_config('max_withdrawal', api_config['max_withdrawal'])
+            app_config.set_config('min_bet', api_config['min_bet'])
+            app_config.set_config('max_bet', api_config['max_bet'])
+            app_config.set_config('fav_icon', api_config['fav_icon'])
+            app_config.set_config('link_support', api_config['link_support'])
+            app_config.set_config('logo', api_config['logo'])
+            app_config.set_config('symbols', api_config['symbols'])
+        return True
+    except Exception as e:
+        print(f"Erro ao atualizar configurações locais: {e}")
+        return False
+
+
+def apply_config(tenant, symbols):
+    info = dict(tenant, symbols=symbols)
+    if not update_local_config(info):
+        raise ValueError("configurações do servidor incompletas")
+    return info
+
+
+def on_remote_config_changed(endpoints):
+    """Aplica as configurações revalidadas em segundo plano que mudaram no servidor"""
+    tenant = response_cache.load('tenant/')
+    symbols = response_cache.load('get-symbols/')
+    if tenant and symbols:
+        update_local_config(dict(tenant['body']['setting'], symbols=symbols['body']))
+
+
+def config_pipeline():
+    """
+    Grafo com as tarefas de configuração: tenant e símbolos em paralelo
+    (do cache local quando existir) e a gravação local depois dos dois
+    """
+    pipeline = StartupPipeline()
+    pipeline.add('tenant', fetch_tenant, label="Conectando ao servidor...")
+    pipeline.add('symbols', fetch_symbols, label="Carregando mercados...")
+    pipeline.add('config', apply_config, deps=('tenant', 'symbols'),
+                 label="Atualizando configurações locais...")
+    return pipeline
+
+
+def revalidate_config():
+    """Revalida em segundo plano as respostas e os arquivos servidos do cache"""
+    asset_cache.revalidate_stale(on_change=on_assets_changed)
+    return response_cache.revalidate_stale(on_change=on_remote_config_changed)
+
+
+# Arquivos de 'storage/' referenciados pelo tenant -> chave do caminho local
+TENANT_ASSETS = {
+    'logo': 'local_logo',
+    'fav_icon': 'local_fav_icon',
+}
+
+
+def fetch_assets(info):
+    """
+    Obtém em paralelo os arquivos do tenant (do cache local quando existir)
+    e grava os caminhos locais; retorna {chave: caminho_local ou None}
+    """
+    remote = {key: info[key] for key in TENANT_ASSETS if info.get(key)}
+    local = asset_cache.prefetch(remote.values())
+    return store_assets({key: local.get(path) for key, path in remote.items()})
+
+
+def store_assets(files):
+    """Grava os caminhos locais; se o logo mudou, a miniatura antiga deixa de valer"""
+    with app_config.batch():
+        for key, path in files.items():
+            if path is None or app_config.get(TENANT_ASSETS[key]) == path:
+                continue
+            app_config.set_config(TENANT_ASSETS[key], path)
+            if key == 'logo':
+                app_config.set_config('local_logo_thumb', None)
+    return files
+
+
+def on_assets_changed(changed):
+    """Aplica os arquivos revalidados em segundo plano que mudaram no servidor"""
+    keys = {app_config.get(key): key for key in TENANT_ASSETS}
+    store_assets({keys[path]: local for path, local in changed.items() if path in keys})
+
+
+def authenticate(email, password):
+    """Autentica no backend e retorna os dados do usuário"""
+    request_user = api_client.post('auth', json={'email': email, 'password': password})
+    if request_user.status_code != 200:
+        raise ValueError("Email ou senha incorretos!")
+    return request_user.json()['data']
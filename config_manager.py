@@ -1,15 +1,27 @@
 import json
 import os
+import tempfile
+import threading
+from contextlib import contextmanager
 from hashlib import sha256
 
+_MISSING = object()
+_NOT_FOUND = object()
+
 class ConfigManager:
     _instance = None
     _config = None
     _config_path = "config.json"
+    _dirty = False
+    _last_saved = None
+    _generation = 0
     
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(ConfigManager, cls).__new__(cls)
+            cls._instance._index = {}
+            cls._instance._lock = threading.RLock()
+            cls._instance._local = threading.local()
             cls._instance._load_config()
         return cls._instance
     
@@ -20,7 +32,10 @@ class ConfigManager:
                 self._create_default_config()
             
             with open(self._config_path, 'r', encoding='utf-8') as f:
-                self._config = json.load(f)
+                content = f.read()
+            self._config = json.loads(content)
+            self._last_saved = content
+            self._invalidate()
                 
             if 'tenantID' not in self._config:
                 self._generate_tenant_id()
@@ -36,6 +51,7 @@ class ConfigManager:
                 "api": "https://backoffice.fybrokers.online/api/v1/",
                 "site": "https://fybrokers.online"
         }
+        self._invalidate()
         self._save_config()
     
     def _generate_tenant_id(self):
@@ -48,11 +64,77 @@ class ConfigManager:
         """Gera um hash SHA-256 único"""
         import uuid
         return sha256(str(uuid.uuid4()).encode()).hexdigest()
+
+    def _invalidate(self):
+        """Descarta o índice de leituras; a nova geração impede que um get em andamento grave valores antigos"""
+        with self._lock:
+            self._generation += 1
+            self._index.clear()
+
+    @property
+    def _batch_depth(self):
+        """Profundidade de batch() da thread atual (cada thread agrupa só as próprias alterações)"""
+        return getattr(self._local, 'batch_depth', 0)
+
+    @_batch_depth.setter
+    def _batch_depth(self, value):
+        self._local.batch_depth = value
     
     def _save_config(self):
-        """Salva o arquivo de configuração"""
-        with open(self._config_path, 'w', encoding='utf-8') as f:
-            json.dump(self._config, f, indent=4, ensure_ascii=False)
+        """
+        Salva o arquivo de configuração de forma atômica
+
+        O conteúdo é gravado num arquivo temporário no mesmo diretório e depois
+        renomeado por cima do config.json, assim uma falha no meio da escrita
+        nunca deixa o arquivo truncado. Se o conteúdo não mudou desde a última
+        gravação, nada é escrito.
+        """
+        if self._batch_depth:
+            self._dirty = True
+            return
+
+        with self._lock:
+            content = json.dumps(self._config, indent=4, ensure_ascii=False)
+            self._dirty = False
+            if content == self._last_saved:
+                return
+
+            directory = os.path.dirname(os.path.abspath(self._config_path))
+            fd, tmp_path = tempfile.mkstemp(prefix='.config-', suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self._config_path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self._last_saved = content
+
+    @contextmanager
+    def batch(self):
+        """
+        Agrupa várias alterações de configuração numa única gravação
+
+        Uso:
+            with app_config.batch():
+                app_config.set_config('a', 1)
+                app_config.set_config('b', 2)
+
+        As chamadas a set_config/_save_config dentro do bloco só alteram a
+        memória; o arquivo é gravado uma única vez ao sair do bloco mais
+        externo, e apenas se algo mudou. A contagem de blocos é por thread:
+        um batch() aberto numa thread não adia as gravações das outras.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._save_config()
     
     def set_config(self, key, value, auto_save=True):
         """
@@ -65,18 +147,27 @@ class ConfigManager:
         """
         try:
             keys = key.split('.')
-            current_level = self._config
-            
-            for k in keys[:-1]:
-                if k not in current_level:
-                    current_level[k] = {}
-                current_level = current_level[k]
-            
-            current_level[keys[-1]] = value
-            
-            if auto_save:
-                self._save_config()
-            
+            with self._lock:
+                current_level = self._config
+
+                for k in keys[:-1]:
+                    if k not in current_level:
+                        current_level[k] = {}
+                    current_level = current_level[k]
+
+                # Valor idêntico ao atual: nada a gravar (o mesmo dict/list pode
+                # ter sido alterado no lugar, então nesse caso grava mesmo assim)
+                current = current_level.get(keys[-1], _MISSING)
+                if current == value and (current is not value or not isinstance(value, (dict, list))):
+                    return True
+
+                current_level[keys[-1]] = value
+                self._dirty = True
+                self._invalidate()
+
+                if auto_save:
+                    self._save_config()
+
             return True
         except Exception as e:
             print(f"Erro ao atualizar configuração: {e}")
@@ -89,19 +180,79 @@ class ConfigManager:
     
     @property
     def config(self):
-        """Retorna toda a configuração"""
+        """Retorna toda a configuração (alterações diretas devem passar por set_config)"""
         return self._config
+
+    @property
+    def api_url(self):
+        """Retorna a URL base da API"""
+        return str(self.get('api', ''))
+
+    @property
+    def token(self):
+        """Retorna o token do tenant enviado nas requisições"""
+        return str(self.get('token', ''))
+
+    @property
+    def site(self):
+        """Retorna a URL do site do tenant"""
+        return str(self.get('site', ''))
+
+    @property
+    def app_name(self):
+        """Retorna o nome da aplicação exibido nas janelas"""
+        return str(self.get('name', ''))
+
+    @property
+    def user_uuid(self):
+        """Retorna o uuid do usuário logado ou None"""
+        return self.get('user.uuid')
+
+    @property
+    def min_bet(self):
+        """Retorna o valor mínimo de operação como float"""
+        return float(self.get('min_bet') or 0)
+
+    @property
+    def max_bet(self):
+        """Retorna o valor máximo de operação como float (0 = sem limite)"""
+        return float(self.get('max_bet') or 0)
+
+    @property
+    def symbols(self):
+        """Retorna a lista de símbolos do tenant"""
+        return self.get('symbols') or []
     
     def get(self, key, default=None):
-        """Obtém um valor de configuração"""
-        keys = key.split('.')
+        """
+        Obtém um valor de configuração
+
+        O caminho resolvido de cada chave fica num índice em memória, então
+        leituras repetidas custam uma única consulta de dicionário. O índice é
+        descartado sempre que a configuração muda via set_config.
+
+        A leitura não trava: o valor resolvido só entra no índice se nenhuma
+        alteração (nova geração) aconteceu enquanto ele era resolvido, senão
+        um valor antigo poderia ficar no índice depois de um set_config.
+        """
+        value = self._index.get(key, _MISSING)
+        if value is _MISSING:
+            generation = self._generation
+            value = self._resolve(key)
+            with self._lock:
+                if generation == self._generation:
+                    self._index[key] = value
+        return default if value is _NOT_FOUND else value
+
+    def _resolve(self, key):
+        """Percorre os níveis da configuração para uma chave 'nivel1.nivel2'"""
         value = self._config
         try:
-            for k in keys:
+            for k in key.split('.'):
                 value = value[k]
             return value
         except (KeyError, TypeError):
-            return default
+            return _NOT_FOUND
 
 # Variável global para acesso fácil
 app_config = ConfigManager()
\ No newline at end of file
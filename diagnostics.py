@@ -0,0 +1,109 @@
+import tkinter as tk
+from tkinter import ttk
+
+from api_client import api_client
+from perf import PERCENTILES, metrics, session_path
+from resilience import STATE_LABELS
+from theme import DARK_BG, DARK_BUTTON, DARK_FG, DARK_HOVER
+
+# Intervalo de atualização da tabela de métricas (ms)
+REFRESH_MS = 1000
+
+COLUMNS = ('metric', 'count') + tuple(f'p{p}' for p in PERCENTILES) + ('max',)
+HEADINGS = ("Métrica", "N") + tuple(f"p{p} (ms)" for p in PERCENTILES) + ("Máx (ms)",)
+
+BREAKER_COLUMNS = ('endpoint', 'state', 'failures', 'rejected', 'retry_in')
+BREAKER_HEADINGS = ("Endpoint", "Disjuntor", "Falhas seguidas", "Recusadas", "Reabre em (s)")
+
+
+class DiagnosticsPanel:
+    """
+    Painel oculto com os histogramas de desempenho (Ctrl+Shift+D)
+
+    Mostra contagem, percentis e máximo de cada métrica, o estado dos
+    disjuntores de cada endpoint e o orçamento de novas tentativas, e permite
+    gravar o resumo em JSON. As tabelas são atualizadas a cada REFRESH_MS
+    enquanto o painel estiver aberto, reaproveitando as linhas existentes.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.window = tk.Toplevel(root)
+        self.window.title("Diagnóstico")
+        self.window.geometry("720x560")
+        self.window.configure(bg=DARK_BG)
+        self.job = None
+        self.create_widgets()
+        self.window.bind("<Destroy>", self.on_destroy)
+        self.refresh()
+
+    def create_widgets(self):
+        main_frame = tk.Frame(self.window, bg=DARK_BG, padx=10, pady=10)
+        main_frame.pack(expand=True, fill=tk.BOTH)
+
+        self.tree = ttk.Treeview(main_frame, columns=COLUMNS, show="headings")
+        for column, heading in zip(COLUMNS, HEADINGS):
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=260 if column == 'metric' else 80,
+                             anchor='w' if column == 'metric' else 'e')
+        self.tree.pack(expand=True, fill=tk.BOTH)
+
+        self.breaker_tree = ttk.Treeview(main_frame, columns=BREAKER_COLUMNS, show="headings", height=5)
+        for column, heading in zip(BREAKER_COLUMNS, BREAKER_HEADINGS):
+            self.breaker_tree.heading(column, text=heading)
+            self.breaker_tree.column(column, width=160 if column == 'endpoint' else 110,
+                                     anchor='w' if column in ('endpoint', 'state') else 'e')
+        self.breaker_tree.pack(fill=tk.X, pady=(10, 0))
+        self.budget_label = tk.Label(main_frame, text="", font=("Arial", 9), fg=DARK_FG, bg=DARK_BG, anchor='w')
+        self.budget_label.pack(fill=tk.X, pady=(5, 0))
+
+        bottom = tk.Frame(main_frame, bg=DARK_BG)
+        bottom.pack(fill=tk.X, pady=(10, 0))
+        save_button = tk.Button(
+            bottom,
+            text="Salvar JSON",
+            font=("Arial", 10),
+            bg=DARK_BUTTON,
+            fg=DARK_FG,
+            activebackground=DARK_HOVER,
+            activeforeground=DARK_FG,
+            relief=tk.FLAT,
+            command=self.save
+        )
+        save_button.pack(side=tk.LEFT)
+        self.status_label = tk.Label(bottom, text="", font=("Arial", 9), fg=DARK_FG, bg=DARK_BG)
+        self.status_label.pack(side=tk.LEFT, padx=10)
+
+    def refresh(self):
+        for name, summary in metrics.snapshot().items():
+            values = (name, summary['count']) + tuple(
+                summary.get(f'p{p}_ms', '') for p in PERCENTILES
+            ) + (summary.get('max_ms', ''),)
+            if self.tree.exists(name):
+                self.tree.item(name, values=values)
+            else:
+                self.tree.insert('', tk.END, iid=name, values=values)
+        self.refresh_breakers()
+        self.job = self.root.after(REFRESH_MS, self.refresh)
+
+    def refresh_breakers(self):
+        for name, breaker in sorted(dict(api_client.breakers).items()):
+            state = breaker.snapshot()
+            values = (name, STATE_LABELS[state['state']], state['failures'], state['rejected'],
+                      state['retry_in'] or '')
+            if self.breaker_tree.exists(name):
+                self.breaker_tree.item(name, values=values)
+            else:
+                self.breaker_tree.insert('', tk.END, iid=name, values=values)
+        budget = api_client.retry_budget
+        self.budget_label.config(text=f"Orçamento de novas tentativas: {budget.available():.1f} "
+                                      f"(esgotado {budget.exhausted}x)")
+
+    def save(self):
+        path = metrics.dump(session_path('-metrics.json'))
+        self.status_label.config(text=f"Gravado em {path}")
+
+    def on_destroy(self, event):
+        if event.widget is self.window and self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
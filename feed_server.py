@@ -0,0 +1,115 @@
+"""
+Servidor local de cotações para testes
+
+Simula o backend de cotações com passeio aleatório por símbolo:
+- GET /quotes/stream?symbols=A,B  linhas 'CODIGO,epoch,preço' sem parar
+- GET /quotes?symbols=A,B         último tick de cada símbolo em JSON
+
+Uso:
+    python feed_server.py --port 8765 --rate 5000
+
+e aponte o cliente com app_config.set_config('quote_feed', 'http://127.0.0.1:8765/').
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+class RandomWalk:
+    """Preços simulados por símbolo"""
+
+    def __init__(self):
+        self.prices = {}
+        self._lock = threading.Lock()
+
+    def next(self, code):
+        with self._lock:
+            price = self.prices.get(code) or random.uniform(0.5, 150.0)
+            price = max(0.0001, price * (1 + random.gauss(0, 0.0002)))
+            self.prices[code] = price
+            return price
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.0"
+    walk = None
+    rate = 5000
+
+    def log_message(self, format, *args):
+        pass
+
+    def _symbols(self, query):
+        value = parse_qs(query).get('symbols', [''])[0]
+        return [code for code in value.split(',') if code]
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path.rstrip('/')
+        symbols = self._symbols(parsed.query)
+        if path.endswith('/quotes/stream') or path == '/quotes/stream':
+            self.stream(symbols)
+        elif path.endswith('/quotes') or path == '/quotes':
+            now = time.time()
+            body = json.dumps({'data': [
+                {'symbol': code, 'time': now, 'price': self.walk.next(code)} for code in symbols
+            ]}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_error(404)
+
+    def stream(self, symbols):
+        """Envia ticks em lotes a cada 10 ms até o cliente desconectar"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')
+        self.end_headers()
+        if not symbols:
+            return
+        per_batch = max(1, self.rate // 100)
+        try:
+            while True:
+                started = time.monotonic()
+                now = time.time()
+                lines = []
+                for i in range(per_batch):
+                    code = symbols[i % len(symbols)]
+                    lines.append(f"{code},{now:.3f},{self.walk.next(code):.5f}\n")
+                self.wfile.write(''.join(lines).encode())
+                self.wfile.flush()
+                time.sleep(max(0.0, 0.01 - (time.monotonic() - started)))
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def serve(host="127.0.0.1", port=8765, rate=5000):
+    """Cria o servidor (sem iniciar o loop) e retorna a instância"""
+    handler = type('Handler', (FeedHandler,), {'walk': RandomWalk(), 'rate': rate})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local de cotações para testes")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--rate', type=int, default=5000, help="ticks por segundo por conexão")
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, args.rate)
+    print(f"Servidor de cotações em http://{args.host}:{args.port}/ ({args.rate} ticks/s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
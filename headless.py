@@ -0,0 +1,252 @@
+"""
+Modo headless: executa uma lista de operações agendadas sem interface
+
+Reaproveita a inicialização das configurações e o login da interface, envia
+cada operação pela fila de envio pouco antes do horário de entrada e
+acompanha a liquidação no vencimento. Os eventos são escritos como JSON
+lines. Não importa tkinter nem PIL.
+
+Arquivo de operações (mesmo formato da importação de sinais):
+    market,type,expiry,entry_time,value
+    EURUSD,CALL,5,25/10/2026 14:30,10
+    GBP/USD,PUT,1 hora,2026-10-25 15:00,25.50
+
+Uso:
+    python headless.py operacoes.csv --email usuario@exemplo.com --password ...
+    (ou ROBO_EMAIL / ROBO_PASSWORD no ambiente)
+"""
+import argparse
+import heapq
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+
+import bootstrap
+from config_manager import app_config
+from order_queue import SPOOL_DIR, STATUS_LABELS, STATUS_REJECTED, STATUS_SENT, OrderQueue, order_payload
+from settlement import DEFAULT_PAYOUT, QuoteOrBackendResolver, SettlementEngine
+from signal_import import SignalValidator, read_rows
+from startup_pipeline import PipelineError
+
+# Antecedência (s) com que cada operação é enviada antes do horário de entrada
+SUBMIT_LEAD = 60
+
+
+class ScheduledOperation:
+    """Operação aguardando o envio; __slots__ mantém milhares delas baratas em memória"""
+
+    __slots__ = ('entry_time', 'symbol', 'type', 'minutes', 'value', 'line')
+
+    def __init__(self, entry_time, symbol, op_type, minutes, value, line):
+        self.entry_time = entry_time
+        self.symbol = symbol
+        self.type = op_type
+        self.minutes = minutes
+        self.value = value
+        self.line = line
+
+    def __lt__(self, other):
+        return self.entry_time < other.entry_time
+
+
+class JsonLinesReporter:
+    """Escreve eventos como uma linha JSON cada (seguro entre threads)"""
+
+    def __init__(self, out):
+        self.out = out
+        self._lock = threading.Lock()
+
+    def emit(self, event, **fields):
+        fields = dict(event=event, ts=round(time.time(), 3), **fields)
+        line = json.dumps(fields, ensure_ascii=False)
+        with self._lock:
+            self.out.write(line + '\n')
+            self.out.flush()
+
+
+class HeadlessRunner:
+    """Carrega, agenda e acompanha as operações de um arquivo"""
+
+    def __init__(self, reporter, lead=SUBMIT_LEAD):
+        self.reporter = reporter
+        self.lead = lead
+        self.errors = 0
+        self._heap = []
+        self._outstanding = set()
+        # Operações enviadas e ainda sem confirmação do backend
+        self._unsent = {}
+        # Spool próprio da execução: não reenvia o que a interface gravou nem deixa sobras para ela
+        self.spool_path = os.path.join(SPOOL_DIR, f"headless-{uuid.uuid4().hex}.jsonl")
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    def load(self, path):
+        """
+        Lê e valida o arquivo linha a linha (mesmas regras da importação de
+        sinais); só as operações válidas ficam em memória
+        """
+        validator = SignalValidator(app_config.symbols, app_config.min_bet, app_config.max_bet,
+                                    min_lead=max(60, self.lead))
+        with open(path, newline='', encoding='utf-8') as f:
+            for line, row in read_rows(f):
+                signal, errors = validator.validate(row)
+                if signal is None:
+                    self.errors += 1
+                    self.reporter.emit('invalid', line=line, errors=errors)
+                    continue
+                heapq.heappush(self._heap, ScheduledOperation(
+                    signal['entry_time'], signal['symbol'], signal['type'],
+                    signal['time_minutes'], signal['value'], line
+                ))
+        self.reporter.emit('loaded', operations=len(self._heap), invalid=self.errors)
+        return len(self._heap)
+
+    def run(self):
+        """Envia as operações no horário e espera todas terminarem"""
+        payout = float(app_config.get('payout', DEFAULT_PAYOUT))
+        self.settlement = SettlementEngine(QuoteOrBackendResolver(lambda symbol: None, payout), self.on_settled)
+        self.order_queue = OrderQueue(on_status=self.on_status, spool_path=self.spool_path)
+        self.settlement.start()
+        self.order_queue.start()
+
+        try:
+            while True:
+                # Retirar do heap e marcar como pendente sob a mesma trava: um
+                # _finish entre os dois veria heap e pendentes vazios e
+                # encerraria a execução com a última operação ainda por enviar
+                with self._lock:
+                    if not self._heap:
+                        break
+                    wait = self._heap[0].entry_time - self.lead - time.time()
+                    if wait <= 0:
+                        scheduled = heapq.heappop(self._heap)
+                        op = self.operation_for(scheduled)
+                        self._outstanding.add(op['id'])
+                if wait > 0:
+                    time.sleep(min(wait, 1.0))
+                    continue
+                self.submit(scheduled, op)
+
+            with self._lock:
+                if not self._outstanding:
+                    self._done.set()
+            self._done.wait()
+        finally:
+            self.order_queue.stop()
+            self.settlement.stop()
+            self.discard_spool()
+
+    def discard_spool(self):
+        """
+        Informa como não enviadas as operações que ficaram no spool ao encerrar
+        (ex.: execução interrompida) e remove o arquivo da execução
+        """
+        for op_id in sorted(self.order_queue.spooled_ids()):
+            self.reporter.emit('unsent', id=op_id)
+        try:
+            os.remove(self.spool_path)
+        except OSError:
+            pass
+
+    @staticmethod
+    def operation_for(scheduled):
+        return {
+            'id': uuid.uuid4().hex,
+            'user': app_config.user_uuid,
+            'symbol': scheduled.symbol,
+            'type': scheduled.type,
+            'time_minutes': scheduled.minutes,
+            'value': scheduled.value,
+            'entry_time': scheduled.entry_time,
+            'expiry_time': scheduled.entry_time + scheduled.minutes * 60,
+        }
+
+    def submit(self, scheduled, op):
+        """Envia uma operação já registrada em _outstanding"""
+        self.reporter.emit('submitted', id=op['id'], line=scheduled.line, symbol=op['symbol'],
+                           type=op['type'], expiry=scheduled.minutes, value=op['value'],
+                           entry_time=op['entry_time'])
+        with self._lock:
+            self._unsent[op['id']] = op
+        self.order_queue.submit(order_payload(op))
+
+    def on_status(self, op_id, status, detail):
+        """
+        Acompanha o envio: só operações confirmadas (STATUS_SENT) entram na
+        liquidação. As que vão para o spool continuam pendentes e são
+        reenviadas pela fila até serem aceitas ou perderem o horário de entrada.
+        """
+        fields = {'id': op_id, 'status': status, 'label': STATUS_LABELS.get(status, status)}
+        if isinstance(detail, (str, dict)):
+            fields['detail'] = detail
+        self.reporter.emit('status', **fields)
+        if status not in (STATUS_SENT, STATUS_REJECTED):
+            return
+        with self._lock:
+            op = self._unsent.pop(op_id, None)
+        if op is None:
+            return
+        if status == STATUS_REJECTED:
+            self._finish([op_id])
+        elif isinstance(detail, dict) and detail.get('result') is not None:
+            # Já liquidada pelo backend na resposta do envio
+            self.on_settled([(op, float(detail['result']))])
+        else:
+            self.settlement.add(op)
+
+    def on_settled(self, settled):
+        for op, result in settled:
+            self.reporter.emit('settled', id=op['id'], symbol=op['symbol'], result=result)
+        self._finish([op['id'] for op, _ in settled])
+
+    def _finish(self, ids):
+        with self._lock:
+            self._outstanding.difference_update(ids)
+            if not self._outstanding and not self._heap:
+                self._done.set()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executa operações agendadas sem interface gráfica")
+    parser.add_argument('operations', help="arquivo CSV com as operações")
+    parser.add_argument('--email', default=os.environ.get('ROBO_EMAIL'))
+    parser.add_argument('--password', default=os.environ.get('ROBO_PASSWORD'))
+    parser.add_argument('--output', help="arquivo de saída JSON lines (padrão: stdout)")
+    parser.add_argument('--lead', type=int, default=SUBMIT_LEAD,
+                        help="segundos de antecedência do envio em relação à entrada")
+    args = parser.parse_args(argv)
+    if not args.email or not args.password:
+        parser.error("informe --email e --password (ou ROBO_EMAIL/ROBO_PASSWORD)")
+
+    out = open(args.output, 'a', encoding='utf-8') if args.output else sys.stdout
+    reporter = JsonLinesReporter(out)
+    try:
+        try:
+            bootstrap.config_pipeline().run()
+        except PipelineError as e:
+            reporter.emit('error', stage='config', error=str(e))
+            return 2
+        bootstrap.revalidate_config()
+
+        try:
+            app_config.set_config('user', bootstrap.authenticate(args.email, args.password))
+        except Exception as e:
+            reporter.emit('error', stage='login', error=str(e))
+            return 2
+        reporter.emit('login', user=app_config.user_uuid)
+
+        runner = HeadlessRunner(reporter, lead=args.lead)
+        runner.load(args.operations)
+        runner.run()
+        reporter.emit('finished', invalid=runner.errors)
+        return 1 if runner.errors else 0
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS operations (
+    id TEXT PRIMARY KEY,
+    user TEXT,
+    symbol TEXT NOT NULL,
+    market TEXT,
+    type TEXT NOT NULL,
+    time_minutes INTEGER NOT NULL,
+    value REAL NOT NULL,
+    entry_time INTEGER NOT NULL,
+    expiry_time INTEGER NOT NULL,
+    status TEXT,
+    result REAL,
+    created_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_operations_user_entry ON operations (user, entry_time);
+CREATE INDEX IF NOT EXISTS idx_operations_symbol_entry ON operations (symbol, entry_time);
+CREATE INDEX IF NOT EXISTS idx_operations_result ON operations (result);
+"""
+
+COLUMNS = ('id', 'user', 'symbol', 'market', 'type', 'time_minutes', 'value',
+           'entry_time', 'expiry_time', 'status', 'result', 'created_at')
+
+
+class HistoryStore:
+    """
+    Histórico local de operações em SQLite (modo WAL)
+
+    Os horários são guardados como epoch em segundos. A listagem é paginada
+    por cursor (entry_time, rowid), do mais recente para o mais antigo, de
+    modo que cada página custa o mesmo independente do tamanho do histórico.
+    """
+
+    def __init__(self, path="history.db"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def add(self, operation):
+        """Grava uma operação (dicionário com as chaves de COLUMNS)"""
+        self.add_many([operation])
+
+    def add_many(self, operations):
+        """Grava várias operações numa única transação"""
+        now = int(time.time())
+        rows = []
+        for op in operations:
+            row = {column: op.get(column) for column in COLUMNS}
+            row['created_at'] = row['created_at'] or now
+            rows.append(row)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO operations ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join(':' + c for c in COLUMNS)})",
+                rows
+            )
+
+    def update_status(self, op_id, status, result=None):
+        """Atualiza o estado (e o resultado, se informado) de uma operação"""
+        with self._lock, self._conn:
+            if result is None:
+                self._conn.execute("UPDATE operations SET status = ? WHERE id = ?", (status, op_id))
+            else:
+                self._conn.execute("UPDATE operations SET status = ?, result = ? WHERE id = ?",
+                                   (status, result, op_id))
+
+    def settle_many(self, results):
+        """Grava o resultado de várias operações numa única transação ((id, status, resultado))"""
+        with self._lock, self._conn:
+            self._conn.executemany("UPDATE operations SET status = ?, result = ? WHERE id = ?",
+                                   [(status, result, op_id) for op_id, status, result in results])
+
+    def open_operations(self, user=None, exclude_status=()):
+        """Operações ainda sem resultado (usa o índice de result)"""
+        sql = "SELECT * FROM operations WHERE result IS NULL"
+        params = []
+        if user is not None:
+            sql += " AND user = ?"
+            params.append(user)
+        if exclude_status:
+            sql += f" AND status NOT IN ({', '.join('?' for _ in exclude_status)})"
+            params.extend(exclude_status)
+        with self._lock:
+            return [self._to_dict(row) for row in self._conn.execute(sql, params)]
+
+    def page(self, user=None, cursor=None, limit=100):
+        """
+        Retorna uma página do histórico, do mais recente para o mais antigo
+
+        Parâmetros:
+        - user: uuid do usuário (None = todos)
+        - cursor: valor retornado pela página anterior (None = primeira página)
+        - limit: tamanho da página
+
+        Retorna (linhas, próximo_cursor); próximo_cursor é None na última página.
+        """
+        where, params = [], []
+        if user is not None:
+            where.append("user = ?")
+            params.append(user)
+        if cursor is not None:
+            where.append("(entry_time, rowid) < (?, ?)")
+            params.extend(cursor)
+        sql = "SELECT rowid AS _rowid, * FROM operations"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY entry_time DESC, rowid DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        next_cursor = (rows[-1]['entry_time'], rows[-1]['_rowid']) if len(rows) == limit else None
+        return [self._to_dict(row) for row in rows], next_cursor
+
+    def between(self, start, end, symbol=None, user=None):
+        """Operações com entrada em [start, end) (epoch), opcionalmente filtradas por símbolo/usuário"""
+        sql = "SELECT * FROM operations WHERE entry_time >= ? AND entry_time < ?"
+        params = [int(start), int(end)]
+        if symbol is not None:
+            sql += " AND symbol = ?"
+            params.append(symbol)
+        if user is not None:
+            sql += " AND user = ?"
+            params.append(user)
+        sql += " ORDER BY entry_time"
+        with self._lock:
+            return [self._to_dict(row) for row in self._conn.execute(sql, params)]
+
+    def today(self, symbol=None, user=None):
+        """Operações com entrada no dia de hoje (horário local)"""
+        start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        end = start + timedelta(days=1)
+        return self.between(start.timestamp(), end.timestamp(), symbol, user)
+
+    def settled(self, user=None):
+        """
+        Operações com resultado, em ordem de vencimento, como colunas
+
+        Retorna (ids, símbolos, minutos, resultados); usado para recalcular as
+        estatísticas sem montar um dicionário por operação.
+        """
+        sql = "SELECT id, symbol, time_minutes, result FROM operations WHERE result IS NOT NULL"
+        params = []
+        if user is not None:
+            sql += " AND user = ?"
+            params.append(user)
+        sql += " ORDER BY expiry_time, rowid"
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            cursor.row_factory = None
+            rows = cursor.fetchall()
+        if not rows:
+            return (), (), (), ()
+        return tuple(zip(*rows))
+
+    def count(self, user=None):
+        with self._lock:
+            if user is None:
+                return self._conn.execute("SELECT COUNT(*) FROM operations").fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM operations WHERE user = ?", (user,)).fetchone()[0]
+
+    @staticmethod
+    def _to_dict(row):
+        return {column: row[column] for column in COLUMNS}
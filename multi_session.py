@@ -0,0 +1,386 @@
+"""
+Sessões simultâneas de várias contas num único processo
+
+Cada conta é uma AccountSession com autenticação, saldo e fila de
+operações próprios; nada passa pelo usuário global do app_config. Todas as
+sessões são corrotinas do mesmo loop asyncio. As chamadas HTTP continuam
+usando o ApiClient (requests, síncrono) e rodam num pool de threads de
+tamanho fixo compartilhado, limitado por um semáforo: centenas de contas
+ocupam no máximo MAX_CONCURRENCY threads e conexões, e cada conta espera
+a sua vez sem bloquear as outras.
+
+Arquivo de contas (CSV):
+    email,password,signals
+    conta1@exemplo.com,senha1,sinais/conta1.csv
+    conta2@exemplo.com,senha2,sinais/conta2.csv
+
+Os arquivos de sinais usam o mesmo formato da importação de sinais e do
+modo headless. Os eventos são escritos como JSON lines com o email da conta.
+
+Uso:
+    python multi_session.py contas.csv [--output eventos.jsonl] [--concurrency 10]
+"""
+import argparse
+import asyncio
+import csv
+import heapq
+import itertools
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+import bootstrap
+from api_client import POOL_MAXSIZE
+from config_manager import app_config
+from headless import JsonLinesReporter
+from order_queue import STATUS_QUEUED, STATUS_REJECTED, STATUS_RETRYING, STATUS_SENT, batch_results, order_payload, post_batch
+from signal_import import SignalValidator, read_rows
+from startup_pipeline import PipelineError
+from user_poller import UserInfoPoller
+
+# Chamadas HTTP simultâneas (uma por conexão do pool do ApiClient)
+MAX_CONCURRENCY = POOL_MAXSIZE
+
+# Antecedência (s) do envio em relação ao horário de entrada
+SUBMIT_LEAD = 60
+BATCH_SIZE = 20
+MAX_RETRIES = 3
+RETRY_DELAY = 1.0
+
+# Estados de uma sessão
+SESSION_IDLE = 'idle'
+SESSION_AUTHENTICATING = 'authenticating'
+SESSION_ACTIVE = 'active'
+SESSION_FAILED = 'failed'
+SESSION_STOPPED = 'stopped'
+
+
+class AccountSession:
+    """
+    Uma conta: usuário autenticado, saldo, operações agendadas e enviadas
+
+    Só é usada a partir do loop asyncio do SessionManager.
+    """
+
+    def __init__(self, manager, email, password):
+        self.manager = manager
+        self.email = email
+        self._password = password
+        self.user = None
+        self.balance = None
+        self.status = SESSION_IDLE
+        self.error = None
+        self.poller = UserInfoPoller()
+        self.next_poll = 0.0
+        self.open_operations = {}     # id -> operação enviada aguardando o vencimento
+        self._scheduled = []          # heap (entry_time, seq, operação)
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+
+    @property
+    def uuid(self):
+        return self.user['uuid'] if self.user else None
+
+    @property
+    def active(self):
+        """Há operações enviadas ainda sem vencimento (o saldo deve mudar em breve)"""
+        return bool(self.open_operations)
+
+    def schedule(self, signals):
+        """Agenda sinais já validados (dicionários do SignalValidator)"""
+        for signal in signals:
+            operation = dict(signal, id=uuid.uuid4().hex, status=STATUS_QUEUED)
+            heapq.heappush(self._scheduled, (operation['entry_time'], next(self._seq), operation))
+        self._wakeup.set()
+
+    def wake(self):
+        self._wakeup.set()
+
+    def pending(self):
+        """Operações ainda não enviadas"""
+        return len(self._scheduled)
+
+    async def login(self):
+        """Autentica a conta; erros de rede são repetidos, credenciais inválidas não"""
+        self.status = SESSION_AUTHENTICATING
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                self.user = await self.manager.call(bootstrap.authenticate, self.email, self._password)
+            except requests.exceptions.RequestException as e:
+                if attempt == MAX_RETRIES:
+                    return self._fail(e)
+                await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
+                continue
+            except Exception as e:
+                return self._fail(e)
+
+            self.status = SESSION_ACTIVE
+            self._set_balance(self.user)
+            self.manager.emit(self, 'login', user=self.uuid, balance=self.balance)
+            return True
+
+    def _fail(self, error):
+        self.status = SESSION_FAILED
+        self.error = str(error)
+        self.manager.emit(self, 'error', stage='login', error=self.error)
+        return False
+
+    def _set_balance(self, user):
+        balance = (user.get('wallet') or {}).get('balance')
+        if balance != self.balance:
+            self.balance = balance
+            return True
+        return False
+
+    async def refresh(self):
+        """Consulta user-info da conta e agenda a próxima consulta"""
+        try:
+            data = await self.manager.call(self.poller.fetch, self.uuid)
+        except Exception as e:
+            self.next_poll = time.time() + self.poller.next_delay(self.active, error=True)
+            self.manager.emit(self, 'error', stage='user-info', error=str(e))
+            return
+
+        if data is not None:
+            self.user = data
+            if self._set_balance(data):
+                self.manager.emit(self, 'balance', balance=self.balance)
+
+        # Operações vencidas já estão refletidas no saldo consultado
+        now = time.time()
+        for op_id in [op_id for op_id, op in self.open_operations.items() if op['expiry_time'] <= now]:
+            del self.open_operations[op_id]
+        self.next_poll = now + self.poller.next_delay(self.active, changed=data is not None)
+
+    async def submit(self, operations):
+        """Envia um lote da conta com tentativas limitadas"""
+        for operation in operations:
+            operation['user'] = self.uuid
+        batch = [order_payload(operation) for operation in operations]
+
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = await self.manager.call(post_batch, batch)
+            except requests.exceptions.RequestException as e:
+                if attempt == MAX_RETRIES or self.manager.stopping:
+                    for operation in operations:
+                        self.manager.emit(self, 'status', id=operation['id'], status=STATUS_REJECTED,
+                                          detail=f"não enviada: {e}")
+                    return
+                for operation in operations:
+                    self.manager.emit(self, 'status', id=operation['id'], status=STATUS_RETRYING, detail=str(e))
+                await asyncio.sleep(RETRY_DELAY * (2 ** attempt))
+                continue
+
+            by_id = {operation['id']: operation for operation in operations}
+            for op_id, status, detail in batch_results(batch, response):
+                if status == STATUS_SENT:
+                    self.open_operations[op_id] = by_id[op_id]
+                fields = {'detail': detail} if isinstance(detail, (str, dict)) else {}
+                self.manager.emit(self, 'status', id=op_id, status=status, **fields)
+            # Operações abertas: a próxima consulta do saldo vem no intervalo rápido
+            self.next_poll = min(self.next_poll, time.time() + self.poller.active_interval)
+            return
+
+    async def run(self):
+        """Autentica e então envia as operações no horário e acompanha o saldo"""
+        if not await self.login():
+            return
+        self.next_poll = time.time() + self.poller.next_delay(False, changed=True)
+        lead = self.manager.lead
+
+        while not self.manager.stopping:
+            now = time.time()
+            due = []
+            while self._scheduled and self._scheduled[0][0] - lead <= now:
+                due.append(heapq.heappop(self._scheduled)[2])
+            for start in range(0, len(due), BATCH_SIZE):
+                await self.submit(due[start:start + BATCH_SIZE])
+
+            if time.time() >= self.next_poll:
+                await self.refresh()
+
+            if self.manager.until_idle and not self._scheduled and not self.open_operations:
+                break
+
+            deadline = self.next_poll
+            if self._scheduled:
+                deadline = min(deadline, self._scheduled[0][0] - lead)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), max(0.0, deadline - time.time()))
+            except asyncio.TimeoutError:
+                pass
+
+        self.status = SESSION_STOPPED
+        self.manager.emit(self, 'stopped', balance=self.balance)
+
+
+class SessionManager:
+    """
+    Conjunto de sessões de contas rodando no mesmo loop asyncio
+
+    on_event(email, evento, campos) é chamado no loop para cada login,
+    mudança de saldo, mudança de estado de operação e erro.
+    """
+
+    def __init__(self, on_event=None, max_concurrency=MAX_CONCURRENCY, lead=SUBMIT_LEAD):
+        self.on_event = on_event
+        self.max_concurrency = max_concurrency
+        self.lead = lead
+        self.sessions = {}
+        self.stopping = False
+        self.until_idle = False
+        self._loop = None
+        self._executor = None
+        self._semaphore = None
+
+    def add(self, email, password):
+        """Registra uma conta (antes ou durante run())"""
+        session = self.sessions.get(email)
+        if session is None:
+            session = self.sessions[email] = AccountSession(self, email, password)
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._start_session, session)
+        return session
+
+    def schedule(self, email, signals):
+        """Agenda sinais para uma conta; seguro a partir de outras threads durante run()"""
+        session = self.sessions[email]
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(session.schedule, signals)
+        else:
+            session.schedule(signals)
+
+    def emit(self, session, event, **fields):
+        if self.on_event:
+            try:
+                self.on_event(session.email, event, fields)
+            except Exception as e:
+                print(f"Erro ao notificar evento da conta {session.email}: {e}")
+
+    async def call(self, func, *args):
+        """Executa uma chamada bloqueante (HTTP) no pool compartilhado"""
+        async with self._semaphore:
+            return await self._loop.run_in_executor(self._executor, func, *args)
+
+    def _start_session(self, session):
+        self._tasks.append(asyncio.ensure_future(session.run()))
+
+    async def run(self, until_idle=False):
+        """
+        Executa todas as sessões até stop() (ou, com until_idle, até todas
+        terminarem de enviar e verem o vencimento das suas operações)
+        """
+        self._loop = asyncio.get_running_loop()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='session')
+        self.until_idle = until_idle
+        self.stopping = False
+        self._tasks = []
+        for session in self.sessions.values():
+            self._start_session(session)
+        try:
+            # Sessões adicionadas durante a execução entram em _tasks; o
+            # timeout garante que elas passem a ser acompanhadas também
+            while True:
+                pending = [task for task in self._tasks if not task.done()]
+                if not pending:
+                    break
+                await asyncio.wait(pending, timeout=1.0)
+            for task in self._tasks:
+                if task.exception() is not None:
+                    print(f"Erro na sessão: {task.exception()}")
+        finally:
+            self._executor.shutdown(wait=False)
+            self._loop = None
+
+    def stop(self):
+        """Pede o encerramento de todas as sessões (seguro a partir de outras threads)"""
+        self.stopping = True
+        if self._loop is not None:
+            for session in self.sessions.values():
+                self._loop.call_soon_threadsafe(session.wake)
+
+    def snapshot(self):
+        """Resumo por conta: estado, saldo e operações pendentes/abertas"""
+        return [{
+            'email': session.email,
+            'user': session.uuid,
+            'status': session.status,
+            'balance': session.balance,
+            'scheduled': session.pending(),
+            'open': len(session.open_operations),
+            'error': session.error,
+        } for session in self.sessions.values()]
+
+
+def load_accounts(path, manager, validator, reporter):
+    """Lê o arquivo de contas e agenda os sinais de cada uma"""
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            email, password = row.get('email', '').strip(), row.get('password', '')
+            if not email or not password:
+                continue
+            manager.add(email, password)
+            signals_path = (row.get('signals') or '').strip()
+            if not signals_path:
+                continue
+            signals = []
+            with open(signals_path, newline='', encoding='utf-8') as signals_file:
+                for line, signal_row in read_rows(signals_file):
+                    signal, errors = validator.validate(signal_row)
+                    if signal is None:
+                        reporter.emit('invalid', account=email, line=line, errors=errors)
+                    else:
+                        signals.append(signal)
+            manager.schedule(email, signals)
+            reporter.emit('loaded', account=email, operations=len(signals))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Executa várias contas ao mesmo tempo sem interface gráfica")
+    parser.add_argument('accounts', help="CSV com email,password,signals")
+    parser.add_argument('--output', help="arquivo de saída JSON lines (padrão: stdout)")
+    parser.add_argument('--concurrency', type=int, default=MAX_CONCURRENCY,
+                        help="chamadas HTTP simultâneas entre todas as contas")
+    parser.add_argument('--lead', type=int, default=SUBMIT_LEAD,
+                        help="segundos de antecedência do envio em relação à entrada")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, 'a', encoding='utf-8') if args.output else sys.stdout
+    reporter = JsonLinesReporter(out)
+    try:
+        try:
+            bootstrap.config_pipeline().run()
+        except PipelineError as e:
+            reporter.emit('error', stage='config', error=str(e))
+            return 2
+        bootstrap.revalidate_config()
+
+        manager = SessionManager(
+            on_event=lambda email, event, fields: reporter.emit(event, account=email, **fields),
+            max_concurrency=args.concurrency,
+            lead=args.lead,
+        )
+        validator = SignalValidator(app_config.symbols, app_config.min_bet, app_config.max_bet,
+                                    min_lead=max(60, args.lead))
+        load_accounts(args.accounts, manager, validator, reporter)
+
+        try:
+            asyncio.run(manager.run(until_idle=True))
+        except KeyboardInterrupt:
+            manager.stop()
+        failed = [s for s in manager.snapshot() if s['status'] == SESSION_FAILED]
+        reporter.emit('finished', accounts=len(manager.sessions), failed=len(failed))
+        return 1 if failed else 0
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
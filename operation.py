@@ -0,0 +1,126 @@
+"""
+Definições comuns das operações, sem dependência da interface
+"""
+from datetime import datetime
+from functools import lru_cache
+
+# Tempos de expiração (rótulo -> minutos)
+TIME_OPTIONS = {
+    "1 minuto": 1,
+    "5 minutos": 5,
+    "10 minutos": 10,
+    "15 minutos": 15,
+    "30 minutos": 30,
+    "1 hora": 60,
+}
+TIME_LABELS = {minutes: label for label, minutes in TIME_OPTIONS.items()}
+
+OPERATION_TYPES = ("CALL", "PUT")
+
+# Formato de data/hora usado na interface
+DATETIME_FORMAT = "%d/%m/%Y %H:%M"
+
+# Estados de uma operação no pipeline de envio
+STATUS_QUEUED = 'queued'
+STATUS_SENDING = 'sending'
+STATUS_SENT = 'sent'
+STATUS_RETRYING = 'retrying'
+STATUS_SPOOLED = 'spooled'
+STATUS_REJECTED = 'rejected'
+STATUS_SETTLED = 'settled'
+
+STATUS_LABELS = {
+    STATUS_QUEUED: "Na fila",
+    STATUS_SENDING: "Enviando...",
+    STATUS_SENT: "Enviada",
+    STATUS_RETRYING: "Reenviando...",
+    STATUS_SPOOLED: "Pendente (offline)",
+    STATUS_REJECTED: "Recusada",
+    STATUS_SETTLED: "Liquidada",
+}
+
+
+class Operation:
+    """
+    Registro compacto de uma operação
+
+    Guarda apenas números e epochs (segundos); a formatação para a tabela é
+    feita só na renderização, para as linhas visíveis. Com __slots__ cada
+    registro ocupa bem menos memória que um dicionário, o que conta em
+    históricos grandes. Aceita leitura no estilo de dicionário (op['value'],
+    op.get(...), dict(op)) para funcionar com o HistoryStore, o OrderQueue e
+    o motor de liquidação sem conversões.
+    """
+
+    __slots__ = ('id', 'user', 'symbol', 'market', 'type', 'time_minutes', 'value',
+                 'entry_time', 'expiry_time', 'status', 'result', 'created_at')
+
+    def __init__(self, id, symbol, type, time_minutes, value, entry_time, expiry_time=None,
+                 user=None, market=None, status=None, result=None, created_at=None):
+        self.id = id
+        self.user = user
+        self.symbol = symbol
+        self.market = market
+        # CALL/PUT são sempre o mesmo objeto de string
+        self.type = _TYPES.get(type, type)
+        self.time_minutes = int(time_minutes)
+        self.value = float(value)
+        self.entry_time = int(entry_time)
+        self.expiry_time = int(expiry_time) if expiry_time is not None else self.entry_time + self.time_minutes * 60
+        self.status = status
+        self.result = float(result) if result is not None else None
+        self.created_at = created_at
+
+    @classmethod
+    def from_dict(cls, data):
+        """Cria o registro a partir de um dicionário (linha do HistoryStore, sinal validado)"""
+        return cls(**{name: data[name] for name in cls.__slots__ if data.get(name) is not None})
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    # ---- Acesso no estilo de dicionário ----
+
+    def keys(self):
+        return self.__slots__
+
+    def __getitem__(self, name):
+        try:
+            return getattr(self, name)
+        except (AttributeError, TypeError):
+            raise KeyError(name) from None
+
+    def get(self, name, default=None):
+        return getattr(self, name, default)
+
+    def __repr__(self):
+        return f"Operation({self.id!r}, {self.symbol!r}, {self.type}, {self.value:.2f}, status={self.status!r})"
+
+    # ---- Formatação (somente na renderização) ----
+
+    def result_text(self):
+        """Valor do resultado quando já existe, senão o rótulo do estado do envio"""
+        if self.result is not None:
+            return f"{self.result:+.2f}"
+        return STATUS_LABELS.get(self.status, self.status or "")
+
+    def row_values(self):
+        """Colunas da tabela de histórico"""
+        return (
+            self.market or self.symbol,
+            self.type,
+            TIME_LABELS.get(self.time_minutes) or f"{self.time_minutes} minutos",
+            f"${self.value:.2f}",
+            self.result_text(),
+            format_time(self.entry_time),
+            format_time(self.expiry_time),
+        )
+
+
+_TYPES = {name: name for name in OPERATION_TYPES}
+
+
+@lru_cache(maxsize=4096)
+def format_time(epoch):
+    """Epoch -> texto no formato da interface (em cache: muitas operações compartilham o minuto)"""
+    return datetime.fromtimestamp(epoch).strftime(DATETIME_FORMAT)
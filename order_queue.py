@@ -0,0 +1,267 @@
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+
+import requests
+
+from api_client import api_client
+from config_manager import app_config
+from operation import (STATUS_LABELS, STATUS_QUEUED, STATUS_REJECTED, STATUS_RETRYING,  # noqa: F401
+                       STATUS_SENDING, STATUS_SENT, STATUS_SETTLED, STATUS_SPOOLED)
+
+SUBMIT_ENDPOINT = 'operations'
+SPOOL_DIR = "spool"
+ENTRY_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def spool_path_for(user_uuid):
+    """Spool do usuário: operações de um usuário nunca são reenviadas na sessão de outro"""
+    return os.path.join(SPOOL_DIR, f"operations-{user_uuid or 'anonymous'}.jsonl")
+
+
+def order_payload(operation):
+    """Corpo enviado ao backend para uma operação do histórico (horários em epoch)"""
+    return {
+        'id': operation['id'],
+        'user': operation['user'],
+        'symbol': operation['symbol'],
+        'type': operation['type'],
+        'time': operation['time_minutes'],
+        'value': operation['value'],
+        'entry_time': datetime.fromtimestamp(operation['entry_time']).strftime(ENTRY_TIME_FORMAT),
+    }
+
+
+def is_expired(payload, now=None):
+    """True se o horário de entrada da operação (corpo de order_payload) já passou"""
+    try:
+        entry_time = datetime.strptime(payload['entry_time'], ENTRY_TIME_FORMAT).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return False
+    return entry_time <= (time.time() if now is None else now)
+
+
+def post_batch(batch):
+    """
+    Envia um lote de operações numa única requisição
+
+    Respostas 5xx viram HTTPError para serem tratadas como falha temporária.
+    """
+    response = api_client.post(SUBMIT_ENDPOINT, json={'operations': batch})
+    if response.status_code >= 500:
+        raise requests.exceptions.HTTPError(f"HTTP {response.status_code}", response=response)
+    return response
+
+
+def batch_results(batch, response):
+    """Retorna (id, estado, detalhe) de cada operação do lote a partir da resposta"""
+    if response.status_code >= 400:
+        return [(operation['id'], STATUS_REJECTED, f"HTTP {response.status_code}") for operation in batch]
+    try:
+        results = {item.get('id'): item for item in response.json().get('data', [])}
+    except (ValueError, AttributeError):
+        results = {}
+    return [(operation['id'], STATUS_SENT, results.get(operation['id'])) for operation in batch]
+
+
+class OrderQueue:
+    """
+    Pipeline de envio de operações para o backend
+
+    As operações entram numa fila em memória e são enviadas em lotes por
+    threads de trabalho usando a sessão compartilhada do ApiClient. Falhas de
+    rede são repetidas algumas vezes com espera crescente; o que ainda assim
+    não puder ser enviado vai para um spool local (JSON lines) que é reenviado
+    quando a conexão volta. O spool é por usuário (spool_path_for); sem
+    spool_path explícito o do usuário logado é escolhido em start().
+
+    on_status(id, status, detalhe) é chamado a cada mudança de estado, na
+    thread de trabalho.
+    """
+
+    def __init__(self, on_status=None, spool_path=None,
+                 batch_size=20, max_retries=3, retry_delay=1.0, flush_interval=30.0, workers=1):
+        self.on_status = on_status
+        self.spool_path = spool_path
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.flush_interval = flush_interval
+        self.workers = workers
+        self._queue = queue.Queue()
+        self._spool_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+        self._last_flush = 0.0
+
+    def start(self):
+        """Inicia as threads de envio e reenvia o que ficou no spool"""
+        if self._threads:
+            return
+        self._resolve_spool_path()
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"order-queue-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self.flush_spool()
+
+    def stop(self):
+        """Para as threads e grava no spool as operações ainda não enviadas"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=1)
+        self._threads = []
+        leftovers = []
+        while True:
+            try:
+                leftovers.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if leftovers:
+            self._spool(leftovers)
+
+    def submit(self, operation):
+        """Coloca uma operação na fila de envio e retorna o seu id"""
+        operation = dict(operation)
+        operation.setdefault('id', uuid.uuid4().hex)
+        self._queue.put(operation)
+        self._notify(operation['id'], STATUS_QUEUED)
+        return operation['id']
+
+    def submit_many(self, operations):
+        """Coloca várias operações na fila de uma vez e retorna os ids"""
+        ids = []
+        for operation in operations:
+            operation = dict(operation)
+            operation.setdefault('id', uuid.uuid4().hex)
+            self._queue.put(operation)
+            ids.append(operation['id'])
+        for op_id in ids:
+            self._notify(op_id, STATUS_QUEUED)
+        return ids
+
+    def pending_spool(self):
+        """Quantidade de operações aguardando no spool"""
+        return len(self._read_spool())
+
+    def spooled_ids(self):
+        """Ids das operações aguardando no spool"""
+        with self._spool_lock:
+            return {operation.get('id') for operation in self._read_spool()}
+
+    def _notify(self, op_id, status, detail=None):
+        if self.on_status:
+            try:
+                self.on_status(op_id, status, detail)
+            except Exception as e:
+                print(f"Erro ao notificar status da operação: {e}")
+
+    def _run(self):
+        while not self._stop.is_set():
+            batch = self._next_batch()
+            if batch:
+                self._send(batch)
+            elif time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush_spool()
+
+    def _next_batch(self):
+        """Espera a primeira operação e junta as que já estiverem na fila"""
+        try:
+            batch = [self._queue.get(timeout=1)]
+        except queue.Empty:
+            return []
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _send(self, batch):
+        """Envia um lote com tentativas limitadas; se falhar, manda para o spool"""
+        for operation in batch:
+            self._notify(operation['id'], STATUS_SENDING)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = post_batch(batch)
+            except requests.exceptions.RequestException as e:
+                if attempt == self.max_retries or self._stop.is_set():
+                    print(f"Erro ao enviar operações, gravando no spool: {e}")
+                    self._spool(batch)
+                    return
+                for operation in batch:
+                    self._notify(operation['id'], STATUS_RETRYING, str(e))
+                self._stop.wait(self.retry_delay * (2 ** attempt))
+                continue
+
+            self._handle_response(batch, response)
+            # Conexão de volta: aproveita para reenviar o spool
+            if os.path.exists(self.spool_path):
+                self.flush_spool()
+            return
+
+    def _handle_response(self, batch, response):
+        for op_id, status, detail in batch_results(batch, response):
+            self._notify(op_id, status, detail)
+
+    def _resolve_spool_path(self):
+        if self.spool_path is None:
+            self.spool_path = spool_path_for(app_config.user_uuid)
+        return self.spool_path
+
+    def _read_spool(self):
+        if self.spool_path is None:
+            return []
+        try:
+            with open(self.spool_path, 'r', encoding='utf-8') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except (OSError, ValueError):
+            return []
+
+    def _spool(self, operations):
+        """Acrescenta operações ao spool local"""
+        with self._spool_lock:
+            os.makedirs(os.path.dirname(self._resolve_spool_path()) or '.', exist_ok=True)
+            with open(self.spool_path, 'a', encoding='utf-8') as f:
+                for operation in operations:
+                    f.write(json.dumps(operation, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        for operation in operations:
+            self._notify(operation['id'], STATUS_SPOOLED)
+
+    def flush_spool(self):
+        """
+        Move as operações do spool de volta para a fila de envio
+
+        As que perderam o horário de entrada enquanto estavam no spool não são
+        reenviadas (abririam num horário diferente do escolhido): saem como
+        rejeitadas. Retorna quantas voltaram para a fila.
+        """
+        self._last_flush = time.monotonic()
+        with self._spool_lock:
+            operations = self._read_spool()
+            if not operations:
+                return 0
+            # Esvazia o spool de forma atômica antes de reenfileirar
+            directory = os.path.dirname(self.spool_path) or '.'
+            fd, tmp_path = tempfile.mkstemp(prefix='.spool-', suffix='.tmp', dir=directory)
+            os.close(fd)
+            os.replace(tmp_path, self.spool_path)
+        now = time.time()
+        queued = 0
+        for operation in operations:
+            if is_expired(operation, now):
+                self._notify(operation['id'], STATUS_REJECTED, "expirada")
+                continue
+            self._queue.put(operation)
+            self._notify(operation['id'], STATUS_QUEUED)
+            queued += 1
+        return queued
@@ -0,0 +1,191 @@
+"""
+Instrumentação de desempenho em processo
+
+Intervalos de tempo (spans) alimentam histogramas por nome com baldes em
+escala logarítmica: registrar uma amostra custa um log e um incremento, a
+memória é fixa por métrica e os percentis (p50/p95/p99) saem dos baldes com
+erro relativo de no máximo BUCKET_GROWTH. Nomes usados pela aplicação:
+
+- startup.<tarefa>, startup.splash, startup.login_screen: inicialização
+- api.<endpoint>: chamadas ao backend (api.<endpoint>.error quando falham)
+- ui.<tela>: atualizações da interface na thread do Tk
+
+Uso:
+    with metrics.span('api.tenant'):
+        ...
+    metrics.record('startup.splash', segundos)
+    metrics.dump('diagnostics/metrics.json')
+"""
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+DIAGNOSTICS_DIR = "diagnostics"
+
+# Baldes de 10 µs a ~100 s, cada um 10% maior que o anterior
+BUCKET_MIN = 1e-5
+BUCKET_GROWTH = 1.1
+BUCKET_COUNT = 170
+PERCENTILES = (50, 95, 99)
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+
+
+class Histogram:
+    """Histograma de latências (segundos) com baldes logarítmicos fixos"""
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts = [0] * (BUCKET_COUNT + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds):
+        if seconds <= BUCKET_MIN:
+            bucket = 0
+        else:
+            bucket = min(BUCKET_COUNT, int(math.log(seconds / BUCKET_MIN) / _LOG_GROWTH) + 1)
+        self.counts[bucket] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p):
+        """Limite superior do balde que contém o percentil p (limitado ao máximo observado)"""
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * p / 100)
+        seen = 0
+        for bucket, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self.max, BUCKET_MIN * BUCKET_GROWTH ** bucket)
+        return self.max
+
+    def summary(self):
+        """Resumo em milissegundos"""
+        summary = {'count': self.count}
+        if self.count:
+            summary.update(
+                mean_ms=round(self.total / self.count * 1000, 3),
+                min_ms=round(self.min * 1000, 3),
+                max_ms=round(self.max * 1000, 3),
+            )
+            for p in PERCENTILES:
+                summary[f'p{p}_ms'] = round(self.percentile(p) * 1000, 3)
+        return summary
+
+
+class Metrics:
+    """Conjunto de histogramas por nome, seguro entre threads"""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        """Registra uma duração (s) na métrica"""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.record(seconds)
+
+    @contextmanager
+    def span(self, name, error_suffix='.error'):
+        """
+        Mede o bloco e registra em `name`
+
+        Se o bloco lançar uma exceção, a duração vai para `name + error_suffix`,
+        para que timeouts não distorçam a latência das chamadas bem-sucedidas.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.record(name + error_suffix, time.perf_counter() - start)
+            raise
+        self.record(name, time.perf_counter() - start)
+
+    def timed(self, name):
+        """Decorator equivalente a span(name) em volta da função"""
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self):
+        """Retorna {métrica: resumo} ordenado pelo nome"""
+        with self._lock:
+            return {name: self._histograms[name].summary() for name in sorted(self._histograms)}
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.started_at = time.time()
+
+    def dump(self, path):
+        """Grava o resumo em JSON (arquivo temporário + rename) e retorna o caminho"""
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        content = {
+            'started_at': self.started_at,
+            'dumped_at': time.time(),
+            'metrics': self.snapshot(),
+        }
+        fd, tmp_path = tempfile.mkstemp(prefix='.metrics-', suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(content, f, indent=2)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return path
+
+
+# Variável global para acesso fácil
+metrics = Metrics()
+
+
+def session_path(suffix, directory=DIAGNOSTICS_DIR):
+    """Caminho de um arquivo de diagnóstico identificado pelo horário de início da sessão"""
+    stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(metrics.started_at))
+    return os.path.join(directory, f"session-{stamp}{suffix}")
+
+
+def write_profile(profiler, directory=DIAGNOSTICS_DIR, top=40):
+    """
+    Grava o resultado de uma sessão com --profile
+
+    - session-<horário>.prof: dados brutos do cProfile (snakeviz, pstats)
+    - session-<horário>.txt: as `top` funções por tempo acumulado
+    - session-<horário>-metrics.json: os histogramas da sessão
+
+    Retorna o caminho do .prof.
+    """
+    import pstats
+
+    profiler.disable()
+    os.makedirs(directory, exist_ok=True)
+    prof_path = session_path('.prof', directory)
+    profiler.dump_stats(prof_path)
+    with open(session_path('.txt', directory), 'w', encoding='utf-8') as f:
+        pstats.Stats(prof_path, stream=f).sort_stats('cumulative').print_stats(top)
+    metrics.dump(session_path('-metrics.json', directory))
+    return prof_path
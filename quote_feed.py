@@ -0,0 +1,221 @@
+import threading
+import time
+from array import array
+
+import requests
+
+from api_client import api_client
+from config_manager import app_config
+
+STREAM_ENDPOINT = 'quotes/stream'
+POLL_ENDPOINT = 'quotes'
+
+# Teto (s) do intervalo entre consultas enquanto elas falham seguidamente
+MAX_POLL_BACKOFF = 60.0
+
+
+def is_not_found(error):
+    """True se o erro é um HTTP 404 (endpoint inexistente neste backend)"""
+    response = getattr(error, 'response', None)
+    return response is not None and response.status_code == 404
+
+
+class TickRing:
+    """
+    Buffer circular de ticks de um símbolo
+
+    Horários e preços ficam em dois array('d') de tamanho fixo, então gravar
+    um tick não aloca objetos: apenas sobrescreve a posição mais antiga.
+    """
+
+    __slots__ = ('capacity', 'times', 'prices', 'head', 'count')
+
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.times = array('d', bytes(8 * capacity))
+        self.prices = array('d', bytes(8 * capacity))
+        self.head = 0
+        self.count = 0
+
+    def push(self, timestamp, price):
+        head = self.head
+        self.times[head] = timestamp
+        self.prices[head] = price
+        self.head = (head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def latest(self):
+        """Retorna (horário, preço) do último tick ou None"""
+        if not self.count:
+            return None
+        i = (self.head - 1) % self.capacity
+        return self.times[i], self.prices[i]
+
+    def window(self, n=None):
+        """Retorna (horários, preços) dos últimos n ticks, do mais antigo para o mais novo"""
+        n = self.count if n is None else min(n, self.count)
+        start = (self.head - n) % self.capacity
+        if start + n <= self.capacity:
+            return self.times[start:start + n], self.prices[start:start + n]
+        return (self.times[start:] + self.times[:self.head],
+                self.prices[start:] + self.prices[:self.head])
+
+
+class QuoteFeed:
+    """
+    Assinatura de cotações dos símbolos selecionados
+
+    Tenta primeiro uma conexão de streaming (linhas 'CODIGO,epoch,preço');
+    se ela falhar, passa a consultar o endpoint de cotações periodicamente e
+    volta a tentar o streaming depois de stream_retry segundos. Os ticks vão
+    para um TickRing por símbolo; a interface lê latest()/window() no seu
+    próprio ritmo, sem receber um evento por tick.
+
+    Falhas seguidas da consulta dobram o intervalo (até MAX_POLL_BACKOFF) e
+    só a primeira é impressa. Um 404 indica que o backend não tem o endpoint:
+    no streaming ele deixa de ser tentado; na consulta o feed é desativado
+    (disabled) e latest() passa a retornar sempre None.
+    """
+
+    def __init__(self, base_url=None, capacity=1024, poll_interval=1.0, stream_retry=30.0):
+        self.base_url = base_url
+        self.capacity = capacity
+        self.poll_interval = poll_interval
+        self.stream_retry = stream_retry
+        self.rings = {}
+        self.ticks_received = 0
+        self.mode = None
+        self.disabled = False
+        self.poll_failures = 0
+        self._codes = ()
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._response = None
+
+    def _url(self, endpoint):
+        base = self.base_url or app_config.get('quote_feed') or app_config.api_url
+        return base.rstrip('/') + '/' + endpoint
+
+    def subscribe(self, codes):
+        """Define os códigos assinados e reinicia a conexão se mudaram"""
+        codes = tuple(sorted(set(codes)))
+        with self._lock:
+            if codes == self._codes:
+                return
+            self._codes = codes
+            self._generation += 1
+            for code in codes:
+                if code not in self.rings:
+                    self.rings[code] = TickRing(self.capacity)
+            response = self._response
+        # Fecha o streaming atual para que a thread reconecte com a nova lista
+        if response is not None:
+            response.close()
+        self.start()
+
+    def start(self):
+        if self.disabled:
+            return
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="quote-feed", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._response is not None:
+            self._response.close()
+
+    def latest(self, code):
+        """Último (horário, preço) do símbolo ou None"""
+        ring = self.rings.get(code)
+        return ring.latest() if ring else None
+
+    def window(self, code, n=None):
+        """Últimos n ticks do símbolo como (horários, preços)"""
+        ring = self.rings.get(code)
+        return ring.window(n) if ring else (array('d'), array('d'))
+
+    def _run(self):
+        next_stream_try = 0.0
+        while not self._stop.is_set():
+            if not self._codes:
+                self._stop.wait(0.2)
+                continue
+            if time.monotonic() >= next_stream_try:
+                generation = self._generation
+                try:
+                    self._stream(generation)
+                    continue
+                except requests.exceptions.RequestException as e:
+                    if self._stop.is_set() or generation != self._generation:
+                        # Conexão encerrada de propósito (parada ou nova assinatura)
+                        continue
+                    if is_not_found(e):
+                        print("Streaming de cotações não existe neste servidor, usando consulta periódica")
+                        next_stream_try = float('inf')
+                    else:
+                        if self.mode != 'poll':
+                            print(f"Streaming de cotações indisponível, usando consulta periódica: {e}")
+                        next_stream_try = time.monotonic() + self.stream_retry
+            self._poll_once()
+            if self.disabled:
+                return
+            self._stop.wait(min(MAX_POLL_BACKOFF, self.poll_interval * 2 ** min(self.poll_failures, 10)))
+
+    def _stream(self, generation):
+        """Consome o streaming até a conexão cair ou a assinatura mudar"""
+        response = api_client.get(self._url(STREAM_ENDPOINT), params={'symbols': ','.join(self._codes)},
+                                  stream=True, timeout=(5, 30))
+        response.raise_for_status()
+        self._response = response
+        self.mode = 'stream'
+        rings = self.rings
+        try:
+            for line in response.iter_lines(chunk_size=8192):
+                if self._stop.is_set() or generation != self._generation:
+                    break
+                if not line:
+                    continue
+                try:
+                    code, timestamp, price = line.split(b',')
+                    ring = rings.get(code.decode())
+                    if ring is not None:
+                        ring.push(float(timestamp), float(price))
+                        self.ticks_received += 1
+                except ValueError:
+                    continue
+        except AttributeError:
+            # Conexão fechada por subscribe()/stop() durante a leitura
+            pass
+        finally:
+            self._response = None
+            response.close()
+
+    def _poll_once(self):
+        self.mode = 'poll'
+        try:
+            response = api_client.get(self._url(POLL_ENDPOINT), params={'symbols': ','.join(self._codes)},
+                                      timeout=(5, 10))
+            response.raise_for_status()
+            for item in response.json().get('data', []):
+                ring = self.rings.get(item['symbol'])
+                if ring is not None:
+                    ring.push(float(item['time']), float(item['price']))
+                    self.ticks_received += 1
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            if is_not_found(e):
+                print("Cotações não disponíveis neste servidor: feed desativado")
+                self.disabled = True
+                self.mode = None
+                return
+            if not self.poll_failures:
+                print(f"Erro ao consultar cotações (novas tentativas com intervalo crescente): {e}")
+            self.poll_failures += 1
+            return
+        if self.poll_failures:
+            print("Consulta de cotações restabelecida")
+        self.poll_failures = 0
@@ -0,0 +1,138 @@
+"""
+Políticas de resiliência das chamadas ao backend: disjuntor por endpoint,
+orçamento de novas tentativas e espera com jitter
+
+Sem dependência de requests ou da interface; usado pelo ApiClient.
+"""
+import random
+import threading
+import time
+
+# Estados do disjuntor
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+STATE_LABELS = {
+    STATE_CLOSED: "Normal",
+    STATE_OPEN: "Indisponível",
+    STATE_HALF_OPEN: "Testando",
+}
+
+
+def backoff_delay(attempt, base=0.2, cap=2.0):
+    """Espera antes da tentativa `attempt` (1, 2...): exponencial com jitter completo"""
+    return random.uniform(0, min(cap, base * (2 ** (attempt - 1))))
+
+
+class CircuitBreaker:
+    """
+    Disjuntor de um endpoint
+
+    Depois de failure_threshold falhas seguidas o circuito abre e as chamadas
+    falham na hora, sem ocupar conexão nem thread, por reset_timeout
+    segundos. Passado esse tempo uma única chamada de teste é liberada
+    (meio-aberto): sucesso fecha o circuito, falha o abre de novo.
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=15.0, clock=time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.rejected = 0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Indica se uma chamada pode ser feita agora"""
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return True
+            if self.state == STATE_OPEN and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = STATE_HALF_OPEN
+                self._trial = False
+            if self.state == STATE_HALF_OPEN and not self._trial:
+                self._trial = True
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = STATE_CLOSED
+            self.failures = 0
+            self.opened_at = None
+            self._trial = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == STATE_HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = STATE_OPEN
+                self.opened_at = self.clock()
+                self._trial = False
+
+    def retry_in(self):
+        """Segundos até a próxima chamada de teste (0 se o circuito não está aberto)"""
+        with self._lock:
+            if self.state != STATE_OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (self.clock() - self.opened_at))
+
+    def snapshot(self):
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'rejected': self.rejected,
+            'retry_in': round(self.retry_in(), 1),
+        }
+
+
+class RetryBudget:
+    """
+    Orçamento de novas tentativas compartilhado por todas as chamadas
+
+    Cada requisição deposita `ratio` e cada nova tentativa consome 1, com uma
+    reposição mínima de min_per_second. Com o backend degradado as novas
+    tentativas ficam limitadas a uma fração do tráfego em vez de multiplicá-lo.
+    """
+
+    def __init__(self, ratio=0.2, min_per_second=1.0, max_balance=10.0, clock=time.monotonic):
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_balance = max_balance
+        self.clock = clock
+        self.balance = max_balance
+        self.exhausted = 0
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self.balance = min(self.max_balance, self.balance + (now - self._updated) * self.min_per_second)
+        self._updated = now
+
+    def deposit(self):
+        """Registra uma requisição nova"""
+        with self._lock:
+            self._refill()
+            self.balance = min(self.max_balance, self.balance + self.ratio)
+
+    def withdraw(self):
+        """Consome uma nova tentativa; False se o orçamento acabou"""
+        with self._lock:
+            self._refill()
+            if self.balance >= 1:
+                self.balance -= 1
+                return True
+            self.exhausted += 1
+            return False
+
+    def available(self):
+        with self._lock:
+            self._refill()
+            return self.balance
@@ -0,0 +1,143 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from hashlib import sha256
+
+from api_client import api_client
+from config_manager import app_config
+
+
+class ResponseCache:
+    """
+    Cache em disco das respostas do backend que mudam pouco (tenant, símbolos)
+
+    Cada endpoint é gravado com o corpo JSON, ETag, Last-Modified e o hash do
+    conteúdo. Quando existe cópia local ela é usada imediatamente e o endpoint
+    é revalidado depois em segundo plano com requisições condicionais
+    (stale-while-revalidate), de forma que uma inicialização com cache não
+    depende de ida e volta à rede.
+
+    O nome do arquivo inclui um hash da URL da API e do token do tenant: se
+    algum dos dois mudar, as respostas do tenant anterior não são reaproveitadas.
+    """
+
+    def __init__(self, cache_dir="cache"):
+        self.cache_dir = cache_dir
+        self.stale = set()
+        self._lock = threading.Lock()
+
+    def _path(self, endpoint):
+        name = endpoint.strip('/').replace('/', '_') or 'root'
+        tenant = sha256(f"{app_config.api_url}\n{app_config.token}".encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{name}-{tenant}.json")
+
+    def load(self, endpoint):
+        """Retorna a entrada em cache do endpoint ou None"""
+        try:
+            with open(self._path(endpoint), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, endpoint, entry):
+        """Grava a entrada de forma atômica (arquivo temporário + rename)"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix='.cache-', suffix='.tmp', dir=self.cache_dir)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(endpoint))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, endpoint):
+        """
+        Retorna o corpo do endpoint, priorizando a cópia local
+
+        Se houver cache, o endpoint é marcado para revalidação posterior
+        (ver revalidate_stale); caso contrário a busca é feita na hora.
+        """
+        entry = self.load(endpoint)
+        if entry is not None:
+            with self._lock:
+                self.stale.add(endpoint)
+            return entry['body']
+        body, _ = self.fetch(endpoint)
+        return body
+
+    def fetch(self, endpoint):
+        """
+        Busca o endpoint com requisição condicional
+
+        Retorna (corpo, mudou). Um 304 ou um corpo com o mesmo hash do cache
+        contam como "não mudou".
+        """
+        entry = self.load(endpoint)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = api_client.get(endpoint, headers=headers)
+        if response.status_code == 304 and entry:
+            entry['checked_at'] = time.time()
+            self._store(endpoint, entry)
+            return entry['body'], False
+        response.raise_for_status()
+
+        content_hash = sha256(response.content).hexdigest()
+        if entry and entry.get('hash') == content_hash:
+            entry.update(etag=response.headers.get('ETag'),
+                         last_modified=response.headers.get('Last-Modified'),
+                         checked_at=time.time())
+            self._store(endpoint, entry)
+            return entry['body'], False
+
+        body = response.json()
+        self._store(endpoint, {
+            'body': body,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'hash': content_hash,
+            'checked_at': time.time(),
+        })
+        return body, True
+
+    def revalidate_stale(self, on_change=None):
+        """
+        Revalida em segundo plano os endpoints servidos do cache
+
+        Parâmetros:
+        - on_change: callback(endpoints_alterados) chamado se algum conteúdo mudou
+        """
+        with self._lock:
+            endpoints = sorted(self.stale)
+            self.stale.clear()
+        if not endpoints:
+            return None
+
+        def worker():
+            changed = []
+            for endpoint in endpoints:
+                try:
+                    _, did_change = self.fetch(endpoint)
+                    if did_change:
+                        changed.append(endpoint)
+                except Exception as e:
+                    print(f"Erro ao revalidar {endpoint}: {e}")
+            if changed and on_change:
+                on_change(changed)
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        return thread
+
+
+# Variável global para acesso fácil
+response_cache = ResponseCache()
@@ -0,0 +1,1190 @@
+"""
+Telas exibidas depois do carregamento: login, tela principal e importação de sinais
+
+Este módulo concentra as dependências pesadas da interface (requests, fila de
+envio, histórico, cotações) e é importado em segundo plano enquanto a tela de
+carregamento já está visível (ver robo.py).
+"""
+import os
+import tkinter as tk
+import uuid
+from datetime import datetime, timedelta
+from tkinter import ttk, messagebox, filedialog
+
+import requests
+
+import bootstrap
+import symbol_index
+from api_client import api_client
+from config_manager import app_config
+from history_store import HistoryStore
+from operation import DATETIME_FORMAT, TIME_OPTIONS, Operation
+from order_queue import (STATUS_QUEUED, STATUS_REJECTED, STATUS_SENT, STATUS_SETTLED, OrderQueue, order_payload,
+                         spool_path_for)
+from perf import metrics
+from quote_feed import QuoteFeed
+from resilience import STATE_OPEN
+from settlement import DEFAULT_PAYOUT, QuoteOrBackendResolver, SettlementEngine
+from signal_import import SignalValidator, check_entry_time, parse_signals
+from stats_panel import StatsPanel
+from theme import DARK_BG, DARK_BUTTON, DARK_ENTRY, DARK_FG, DARK_HOVER
+from trade_stats import TradeStats
+from ui_worker import UiWorker
+from user_poller import UserInfoPoller
+from virtual_tree import VirtualTreeview
+
+# Quantidade de mercados sugeridos na busca do formulário
+MARKET_SUGGESTIONS = 20
+
+# Intervalo de atualização da cotação exibida (ms)
+QUOTE_REFRESH_MS = 500
+
+# Quantidade de operações carregadas por página do histórico
+HISTORY_PAGE_SIZE = 200
+
+# Intervalo de atualização do estado da conexão com o servidor (ms)
+SERVER_STATUS_MS = 1000
+
+
+class LoginScreen:
+    def __init__(self, shell):
+        self.shell = shell
+        self.root = shell.root
+        self.frame = tk.Frame(self.root, bg=DARK_BG)
+
+        self.worker = UiWorker(self.root)
+        self.attempt = 0
+        self.main_app = None
+        
+        self.create_widgets()
+        self.shell.show(self, "Login - " + app_config.get('name'), 400, 500)
+    
+    def create_widgets(self):
+        # Frame principal
+        main_frame = tk.Frame(self.frame, bg=DARK_BG, padx=20, pady=20)
+        main_frame.pack(expand=True, fill=tk.BOTH)
+        
+        # Logo: miniatura já no tamanho final, carregada sem reamostragem
+        thumb = app_config.get('local_logo_thumb')
+        if not (thumb and os.path.exists(thumb)):
+            source = app_config.get('local_logo')
+            if not (source and os.path.exists(source)):
+                source = 'logo_local.png'
+            # PIL só é carregado quando a miniatura ainda não existe
+            import asset_pipeline
+            thumb = asset_pipeline.thumbnail_for(source, 'login_logo')
+        logo_img = tk.PhotoImage(file=thumb)
+        logo_label = tk.Label(main_frame, image=logo_img, bg=DARK_BG)
+        logo_label.image = logo_img
+        logo_label.pack(pady=(0, 30))
+        
+        # Label do título
+        title_label = tk.Label(
+            main_frame, 
+            text=app_config.get('name'), 
+            font=("Arial", 18, "bold"), 
+            fg=DARK_FG, 
+            bg=DARK_BG
+        )
+        title_label.pack(pady=(0, 20))
+        
+        # Frame dos campos de entrada
+        entry_frame = tk.Frame(main_frame, bg=DARK_BG)
+        entry_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        # Campo de email
+        email_label = tk.Label(
+            entry_frame, 
+            text="Email:", 
+            font=("Arial", 10), 
+            fg=DARK_FG, 
+            bg=DARK_BG,
+            anchor='w'
+        )
+        email_label.pack(fill=tk.X)
+        
+        self.email_entry = tk.Entry(
+            entry_frame, 
+            font=("Arial", 12), 
+            bg=DARK_ENTRY, 
+            fg=DARK_FG, 
+            insertbackground=DARK_FG,
+            relief=tk.FLAT
+        )
+        self.email_entry.pack(fill=tk.X, pady=(0, 10), ipady=5)
+        
+        # Campo de senha
+        password_label = tk.Label(
+            entry_frame, 
+            text="Senha:", 
+            font=("Arial", 10), 
+            fg=DARK_FG, 
+            bg=DARK_BG,
+            anchor='w'
+        )
+        password_label.pack(fill=tk.X)
+        
+        self.password_entry = tk.Entry(
+            entry_frame, 
+            font=("Arial", 12), 
+            bg=DARK_ENTRY, 
+            fg=DARK_FG, 
+            show="*",
+            insertbackground=DARK_FG,
+            relief=tk.FLAT
+        )
+        self.password_entry.pack(fill=tk.X, pady=(0, 20), ipady=5)
+        
+        # Botão de login
+        self.login_button = tk.Button(
+            main_frame, 
+            text="Acessar", 
+            font=("Arial", 12, "bold"), 
+            bg=DARK_BUTTON, 
+            fg=DARK_FG,
+            activebackground=DARK_HOVER,
+            activeforeground=DARK_FG,
+            relief=tk.FLAT,
+            command=self.login
+        )
+        self.login_button.pack(fill=tk.X, ipady=8)
+        
+        # Configurar estilo para quando o mouse passa sobre o botão
+        self.login_button.bind("<Enter>", lambda e: self.login_button.config(bg=DARK_HOVER))
+        self.login_button.bind("<Leave>", lambda e: self.login_button.config(bg=DARK_BUTTON))
+
+        # Indicador de progresso e cancelamento (exibidos durante o login)
+        self.busy_frame = tk.Frame(main_frame, bg=DARK_BG)
+        self.spinner = ttk.Progressbar(self.busy_frame, orient='horizontal', mode='indeterminate')
+        self.spinner.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        cancel_button = tk.Button(
+            self.busy_frame,
+            text="Cancelar",
+            font=("Arial", 9),
+            bg=DARK_BUTTON,
+            fg=DARK_FG,
+            activebackground=DARK_HOVER,
+            activeforeground=DARK_FG,
+            relief=tk.FLAT,
+            command=self.cancel_login
+        )
+        cancel_button.pack(side=tk.RIGHT)
+    
+    def login(self):
+        email = self.email_entry.get()
+        password = self.password_entry.get()
+        
+        if not email or not password:
+            messagebox.showerror("Erro", "Por favor, preencha todos os campos!")
+            return
+
+        # Cada tentativa tem um número; respostas de tentativas canceladas são ignoradas
+        self.attempt += 1
+        attempt = self.attempt
+        self.set_busy(True)
+        self.worker.submit(
+            f'auth-{attempt}',
+            bootstrap.authenticate,
+            lambda data: self.on_login_success(attempt, data),
+            lambda error: self.on_login_error(attempt, error),
+            args=(email, password)
+        )
+
+        # Monta a tela principal enquanto a autenticação está em andamento
+        self.prepare_main_window()
+
+    def prepare_main_window(self):
+        """Constrói a tela principal (ainda não exibida), sem carregar dados do usuário"""
+        if self.main_app is not None:
+            return
+        self.main_app = ForexTradingApp(self.shell, autoload=False)
+
+    def on_login_success(self, attempt, data):
+        if attempt != self.attempt:
+            return
+        self.set_busy(False)
+        app_config.set_config('user', data)
+
+        # Troca a tela de login pela tela principal já construída
+        self.prepare_main_window()
+        self.main_app.show()
+        self.main_app.start()
+
+    def on_login_error(self, attempt, error):
+        if attempt != self.attempt:
+            return
+        self.set_busy(False)
+        if isinstance(error, requests.exceptions.Timeout):
+            messagebox.showerror("Erro", "O servidor demorou para responder. Tente novamente.")
+        elif isinstance(error, requests.exceptions.RequestException):
+            messagebox.showerror("Erro", f"Não foi possível conectar ao servidor: {error}")
+        else:
+            messagebox.showerror("Erro", str(error))
+
+    def cancel_login(self):
+        """Cancela a tentativa de login em andamento"""
+        self.attempt += 1
+        self.set_busy(False)
+
+    def set_busy(self, busy):
+        """Alterna entre o estado de login em andamento e o formulário livre"""
+        state = tk.DISABLED if busy else tk.NORMAL
+        self.login_button.config(state=state)
+        self.email_entry.config(state=state)
+        self.password_entry.config(state=state)
+        if busy:
+            self.busy_frame.pack(fill=tk.X, pady=(10, 0))
+            self.spinner.start(10)
+        else:
+            self.spinner.stop()
+            self.busy_frame.pack_forget()
+
+class ForexTradingApp:      
+    def __init__(self, shell, autoload=True):
+        self.shell = shell
+        self.root = shell.root
+        self.frame = tk.Frame(self.root, bg=DARK_BG)
+        
+        self.user_data = {
+            "saldo": 0.00,
+            "nome": "Carregando...",
+            "sobrenome": "",
+            "telefone": ""
+        }
+
+        self.worker = UiWorker(self.root)
+        self.worker.keep_alive()
+        self.history_store = HistoryStore()
+        self.history_cursor = None
+        self.history_exhausted = False
+        self.quote_feed = QuoteFeed()
+        self.quote_job = None
+        payout = float(app_config.get('payout', DEFAULT_PAYOUT))
+        self.settlement = SettlementEngine(
+            QuoteOrBackendResolver(self.quote_feed.latest, payout),
+            self.on_settlement,
+            price_source=self.quote_feed.latest
+        )
+        self.order_queue = OrderQueue(on_status=self.on_order_status)
+        # Operações ainda sem confirmação de envio: só entram na liquidação local como STATUS_SENT
+        self.unsent = {}
+        self.user_poller = UserInfoPoller()
+        self.poll_job = None
+        self.server_job = None
+        self.user_texts = {}
+        self.stats = TradeStats()
+        self.stats_pending = None
+        self.frame.bind("<Destroy>", self.on_destroy, add="+")
+        self.create_widgets()
+        self.generate_sample_data()
+        if autoload:
+            self.show()
+            self.start()
+
+    def show(self):
+        """Exibe a tela principal na janela da aplicação"""
+        self.shell.show(self, app_config.get('name'), 1000, 700)
+
+    def start(self):
+        """Carrega os dados do usuário e inicia o envio de operações; chamado quando já existe um usuário autenticado"""
+        self.load_user_data()
+        self.load_history_page()
+        self.reload_stats()
+        self.refresh_server_status()
+        # Antes do start: o reenvio do spool precisa encontrar as operações em self.unsent
+        self.order_queue.spool_path = spool_path_for(app_config.user_uuid)
+        self.schedule_open_operations()
+        self.order_queue.start()
+
+    def schedule_open_operations(self):
+        """
+        Coloca na agenda de liquidação as operações do histórico já enviadas e
+        ainda sem resultado; as que estão no spool esperam a confirmação
+
+        As que estavam na fila ou em envio quando o programa foi encerrado e não
+        chegaram ao spool nunca mais mudariam de estado: saem como rejeitadas.
+        """
+        spooled = self.order_queue.spooled_ids()
+        lost = []
+        for op in self.history_store.open_operations(app_config.user_uuid, exclude_status=(STATUS_REJECTED,)):
+            if op['status'] == STATUS_SENT:
+                self.settlement.add(op)
+            else:
+                self.unsent[op['id']] = op
+                if op['id'] not in spooled:
+                    lost.append(op['id'])
+        for op_id in lost:
+            self.update_order_row(op_id, STATUS_REJECTED, "não enviada")
+        self.settlement.start()
+        self.update_quote_subscription()
+
+    def update_quote_subscription(self):
+        """Assina o mercado selecionado e os símbolos das operações abertas ou aguardando envio"""
+        codes = self.settlement.symbols()
+        codes.update(op['symbol'] for op in self.unsent.values())
+        selected = self.market_code_map.get(self.market_var.get())
+        if selected:
+            codes.add(selected)
+        if codes:
+            self.quote_feed.subscribe(codes)
+
+    def on_settlement(self, settled):
+        """Recebe um lote liquidado (thread do motor de liquidação)"""
+        self.worker.post(self.apply_settlement, settled)
+
+    @metrics.timed('ui.settlement')
+    def apply_settlement(self, settled):
+        """Aplica um lote liquidado: histórico, linhas da tabela e saldo numa única passada"""
+        self.history_store.settle_many([(op['id'], STATUS_SETTLED, result) for op, result in settled])
+        for op, result in settled:
+            self.update_row(op['id'], STATUS_SETTLED, result)
+            self.record_result(op, result)
+        self.add_to_balance(sum(result for _, result in settled))
+        self.update_quote_subscription()
+
+    def add_to_balance(self, amount):
+        """
+        Soma resultados liquidados ao saldo exibido até a próxima consulta do
+        servidor; vale tanto para a liquidação local quanto para a do backend
+        """
+        self.user_data['saldo'] = (self.user_data['saldo'] or 0) + amount
+        self.update_user_display()
+
+    @metrics.timed('ui.history_page')
+    def load_history_page(self):
+        """Carrega a próxima página (mais antiga) do histórico local"""
+        if self.history_exhausted:
+            return
+        operations, self.history_cursor = self.history_store.page(
+            user=app_config.user_uuid, cursor=self.history_cursor, limit=HISTORY_PAGE_SIZE
+        )
+        self.history_exhausted = self.history_cursor is None
+        self.tree.extend_older([(op['id'], Operation.from_dict(op)) for op in operations])
+
+    def reload_stats(self):
+        """Recalcula as estatísticas a partir do histórico completo, em segundo plano"""
+        self.stats_pending = []
+        self.worker.submit('stats', self.compute_stats, self.on_stats_loaded, self.on_stats_error,
+                           args=(app_config.user_uuid,))
+
+    def compute_stats(self, user):
+        """Roda fora da thread do Tk"""
+        ids, symbols, minutes, results = self.history_store.settled(user)
+        stats = TradeStats()
+        stats.reload(symbols, minutes, results)
+        return stats, set(ids)
+
+    def on_stats_loaded(self, loaded):
+        stats, ids = loaded
+        # Liquidações que chegaram durante a recarga e não estavam na leitura do histórico
+        for op, result in self.stats_pending:
+            if op['id'] not in ids:
+                stats.add(op['symbol'], op['time_minutes'], result)
+        self.stats = stats
+        self.stats_pending = None
+
+    def on_stats_error(self, error):
+        print(f"Erro ao calcular as estatísticas: {error}")
+        self.stats_pending = None
+
+    def record_result(self, op, result):
+        """Soma uma operação liquidada às estatísticas (O(1))"""
+        self.stats.add(op['symbol'], op['time_minutes'], result)
+        if self.stats_pending is not None:
+            self.stats_pending.append((op, result))
+
+    def open_stats(self):
+        """Abre a janela de estatísticas"""
+        StatsPanel(self)
+
+    def update_row(self, op_id, status, result=None):
+        """Atualiza o registro da operação na tabela; a linha só é redesenhada se estiver visível"""
+        if self.tree.exists(op_id):
+            op = self.tree.row(op_id)
+            op.status = status
+            if result is not None:
+                op.result = float(result)
+            self.tree.refresh(op_id)
+    
+    def create_widgets(self):
+        # Frame principal
+        main_frame = tk.Frame(self.frame, bg=DARK_BG)
+        main_frame.pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+
+        # Frame superior (formulário + dados do usuário)
+        top_frame = tk.Frame(main_frame, bg=DARK_BG)
+        top_frame.pack(fill=tk.BOTH, expand=False)
+
+        # ========== Frame do formulário (esquerda) ==========
+        form_frame = tk.Frame(top_frame, bg=DARK_BG)
+        form_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 20))
+        
+        # Título do formulário
+        title_label = tk.Label(
+            form_frame, 
+            text="Nova Operação", 
+            font=("Arial", 14, "bold"), 
+            fg=DARK_FG, 
+            bg=DARK_BG,
+            anchor='w'
+        )
+        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 10), sticky='w')
+        
+        # Mercado (Forex symbols)
+        market_label = tk.Label(
+            form_frame, 
+            text="Mercado:", 
+            font=("Arial", 10), 
+            fg=DARK_FG, 
+            bg=DARK_BG,
+            anchor='w'
+        )
+        market_label.grid(row=1, column=0, pady=(0, 5), sticky='w')
+        
+        self.market_var = tk.StringVar()
+        # Mapa label→code; o índice de busca é pedido a cada consulta (market_suggestions)
+        self.market_code_map = symbol_index.index_for(app_config.symbols).code_by_label
+        self.market_select = ttk.Combobox(
+            form_frame, 
+            textvariable=self.market_var, 
+            values=self.market_suggestions(''),
+            font=("Arial", 10),
+            height=10
+        )
+        self.market_select.grid(row=1, column=1, pady=(0, 5), sticky='ew', padx=(0, 10))
+        # Busca conforme digita: a lista mostra só os melhores resultados
+        self.market_select.bind("<KeyRelease>", self.on_market_typed)
+        self.market_select.bind("<<ComboboxSelected>>", self.on_market_selected)
+
+        # Última cotação do mercado selecionado
+        self.quote_label = tk.Label(
+            form_frame,
+            text="Cotação: -",
+            font=("Arial", 10),
+            fg="#4CAF50",
+            bg=DARK_BG,
+            anchor='w',
+            width=18
+        )
+        self.quote_label.grid(row=1, column=2, pady=(0, 5), sticky='w')
+        
+        # Tipo (Put/Call)
+        type_label = tk.Label(
+            form_frame, 
+            text="Tipo:", 
+            font=("Arial", 10), 
+            fg=DARK_FG, 
+            bg=DARK_BG,
+            anchor='w'
+        )
+        type_label.grid(row=2, column=0, pady=(0, 5), sticky='w')
+        
+        self.type_var = tk.StringVar()
+        type_options = ["CALL", "PUT"]
+        self.type_select = ttk.Combobox(
+            form_frame, 
+            textvariable=self.type_var, 
+            values=type_options,
+            state="readonly",
+            font=("Arial", 10),
+            height=10
+        )
+        self.type_select.grid(row=2, column=1, pady=(0, 5), sticky='ew', padx=(0, 10))
+        
+        # Tempo de expiração
+        time_label = tk.Label(
+            form_frame, 
+            text="Tempo:", 
+            font=("Arial", 10), 
+            fg=DARK_FG, 
+            bg=DARK_BG,
+            anchor='w'
+        )
+        time_label.grid(row=3, column=0, pady=(0, 5), sticky='w')
+        
+        self.time_var = tk.StringVar()
+        time_options = list(TIME_OPTIONS)
+        self.time_select = ttk.Combobox(
+            form_frame, 
+            textvariable=self.time_var, 
+            values=time_options,
+            state="readonly",
+            font=("Arial", 10),
+            height=10
+        )
+        self.time_select.grid(row=3, column=1, pady=(0, 5), sticky='ew', padx=(0, 10))
+        
+        # Data e Hora de Entrada
+        entry_time_label = tk.Label(
+            form_frame, 
+            text="Data/Hora Entrada:", 
+            font=("Arial", 10), 
+            fg=DARK_FG, 
+            bg=DARK_BG,
+            anchor='w'
+        )
+        entry_time_label.grid(row=4, column=0, pady=(0, 5), sticky='w')
+        
+        self.entry_time_var = tk.StringVar()
+        # Definir valor padrão como agora + 1 minuto
+        default_time = (datetime.now() + timedelta(minutes=1)).strftime("%d/%m/%Y %H:%M")
+        self.entry_time_var.set(default_time)
+        
+        self.entry_time_entry = tk.Entry(
+            form_frame, 
+            textvariable=self.entry_time_var,
+            font=("Arial", 10), 
+            bg=DARK_ENTRY, 
+            fg=DARK_FG, 
+            insertbackground=DARK_FG,
+            relief=tk.FLAT
+        )
+        self.entry_time_entry.grid(row=4, column=1, pady=(0, 5), sticky='ew', padx=(0, 10), ipady=3)
+        
+        # Valor da operação
+        value_label = tk.Label(
+            form_frame, 
+            text="Valor ($):", 
+            font=("Arial", 10), 
+            fg=DARK_FG, 
+            bg=DARK_BG,
+            anchor='w'
+        )
+        value_label.grid(row=5, column=0, pady=(0, 5), sticky='w')
+        
+        self.value_entry = tk.Entry(
+            form_frame, 
+            font=("Arial", 10), 
+            bg=DARK_ENTRY, 
+            fg=DARK_FG, 
+            insertbackground=DARK_FG,
+            relief=tk.FLAT
+        )
+        self.value_entry.grid(row=5, column=1, pady=(0, 10), sticky='ew', padx=(0, 10), ipady=3)
+        
+        # Botão de enviar
+        submit_button = tk.Button(
+            form_frame, 
+            text="Enviar Operação", 
+            font=("Arial", 10, "bold"), 
+            bg=DARK_BUTTON, 
+            fg=DARK_FG,
+            activebackground=DARK_HOVER,
+            activeforeground=DARK_FG,
+            relief=tk.FLAT,
+            command=self.submit_operation
+        )
+        submit_button.grid(row=6, column=0, columnspan=2, pady=(10, 0), sticky='ew')
+        
+        # Configurar estilo para quando o mouse passa sobre o botão
+        submit_button.bind("<Enter>", lambda e: submit_button.config(bg=DARK_HOVER))
+        submit_button.bind("<Leave>", lambda e: submit_button.config(bg=DARK_BUTTON))
+
+        # Botão de importação de lista de sinais
+        import_button = tk.Button(
+            form_frame, 
+            text="Importar Sinais", 
+            font=("Arial", 10), 
+            bg=DARK_BUTTON, 
+            fg=DARK_FG,
+            activebackground=DARK_HOVER,
+            activeforeground=DARK_FG,
+            relief=tk.FLAT,
+            command=self.open_signal_import
+        )
+        import_button.grid(row=7, column=0, columnspan=2, pady=(5, 0), sticky='ew')
+        import_button.bind("<Enter>", lambda e: import_button.config(bg=DARK_HOVER))
+        import_button.bind("<Leave>", lambda e: import_button.config(bg=DARK_BUTTON))
+
+        # Botão das estatísticas de resultado
+        stats_button = tk.Button(
+            form_frame, 
+            text="Estatísticas", 
+            font=("Arial", 10), 
+            bg=DARK_BUTTON, 
+            fg=DARK_FG,
+            activebackground=DARK_HOVER,
+            activeforeground=DARK_FG,
+            relief=tk.FLAT,
+            command=self.open_stats
+        )
+        stats_button.grid(row=8, column=0, columnspan=2, pady=(5, 0), sticky='ew')
+        stats_button.bind("<Enter>", lambda e: stats_button.config(bg=DARK_HOVER))
+        stats_button.bind("<Leave>", lambda e: stats_button.config(bg=DARK_BUTTON))
+
+        # ========== Frame direito (informações do usuário) ==========
+        right_frame = tk.Frame(top_frame, bg=DARK_BG, width=300, relief=tk.RAISED, bd=1)
+        right_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(20, 0))
+        right_frame.pack_propagate(False)  # Mantém a largura fixa
+        
+        # Painel do Usuário
+        user_panel = tk.Frame(right_frame, bg=DARK_BG, padx=10, pady=20)
+        user_panel.pack(fill=tk.BOTH, expand=True)
+        
+        # Título do painel
+        user_title = tk.Label(
+            user_panel, 
+            text="Informações do Usuário", 
+            font=("Arial", 12, "bold"), 
+            fg=DARK_FG, 
+            bg=DARK_BG
+        )
+        user_title.pack(pady=(0, 20))
+        
+        # Container para os dados
+        data_frame = tk.Frame(user_panel, bg=DARK_BG)
+        data_frame.pack(fill=tk.X, pady=5)
+        
+        # Saldo
+        self.saldo_label = tk.Label(
+            data_frame, 
+            text=f"Saldo: $0.00", 
+            font=("Arial", 11), 
+            fg="#4CAF50",  # Verde para saldo
+            bg=DARK_BG,
+            anchor='w'
+        )
+        self.saldo_label.pack(fill=tk.X, pady=5)
+        
+        # Nome
+        self.nome_label = tk.Label(
+            data_frame, 
+            text="Nome: ", 
+            font=("Arial", 10), 
+            fg=DARK_FG, 
+            bg=DARK_BG,
+            anchor='w'
+        )
+        self.nome_label.pack(fill=tk.X, pady=5)
+        
+        # Telefone
+        self.telefone_label = tk.Label(
+            data_frame, 
+            text="Telefone: ", 
+            font=("Arial", 10), 
+            fg=DARK_FG, 
+            bg=DARK_BG,
+            anchor='w'
+        )
+        self.telefone_label.pack(fill=tk.X, pady=5)
+
+        # Estado da conexão com o servidor (disjuntores do ApiClient)
+        self.server_label = tk.Label(
+            data_frame, 
+            text="Servidor: conectado", 
+            font=("Arial", 9), 
+            fg="#4CAF50", 
+            bg=DARK_BG,
+            anchor='w',
+            wraplength=270,
+            justify='left'
+        )
+        self.server_label.pack(fill=tk.X, pady=5)
+        
+        # Botão de atualizar
+        self.update_btn = tk.Button(
+            user_panel, 
+            text="Atualizar Dados", 
+            font=("Arial", 10, "bold"), 
+            bg=DARK_BUTTON, 
+            fg=DARK_FG,
+            activebackground=DARK_HOVER,
+            activeforeground=DARK_FG,
+            relief=tk.FLAT,
+            command=self.load_user_data
+        )
+        self.update_btn.pack(fill=tk.X, pady=(20, 0), ipady=5)
+        
+        # Efeito hover no botão
+        self.update_btn.bind("<Enter>", lambda e: self.update_btn.config(bg=DARK_HOVER))
+        self.update_btn.bind("<Leave>", lambda e: self.update_btn.config(bg=DARK_BUTTON))
+
+        # ========== Frame do histórico (parte inferior) ==========
+        history_frame = tk.Frame(main_frame, bg=DARK_BG)
+        history_frame.pack(fill=tk.BOTH, expand=True, pady=(20, 0))
+        
+        # Título do histórico
+        history_label = tk.Label(
+            history_frame, 
+            text="Histórico de Operações", 
+            font=("Arial", 14, "bold"), 
+            fg=DARK_FG, 
+            bg=DARK_BG,
+            anchor='w'
+        )
+        history_label.pack(fill=tk.X, pady=(0, 10))
+        
+        # Tabela virtualizada: só as linhas visíveis existem no Treeview
+        self.tree = VirtualTreeview(
+            history_frame,
+            columns=("market", "type", "time", "value", "result", "entry_time", "date"),
+            rowheight=25,
+            bg=DARK_BG,
+            on_need_more=self.load_history_page,
+            formatter=Operation.row_values
+        )
+        
+        # Configurar cabeçalhos
+        self.tree.heading("market", text="Mercado")
+        self.tree.heading("type", text="Tipo")
+        self.tree.heading("time", text="Tempo")
+        self.tree.heading("value", text="Valor ($)")
+        self.tree.heading("result", text="Resultado ($)")
+        self.tree.heading("entry_time", text="Entrada")
+        self.tree.heading("date", text="Data Operação")
+        
+        # Configurar largura das colunas
+        self.tree.column("market", width=100, anchor='center')
+        self.tree.column("type", width=80, anchor='center')
+        self.tree.column("time", width=100, anchor='center')
+        self.tree.column("value", width=100, anchor='center')
+        self.tree.column("result", width=120, anchor='center')
+        self.tree.column("entry_time", width=150, anchor='center')
+        self.tree.column("date", width=150, anchor='center')
+        
+        self.tree.pack(expand=True, fill=tk.BOTH)
+        
+        # Configurar estilo da Treeview para tema dark
+        style = ttk.Style()
+        style.theme_use("default")
+        style.configure("Treeview", 
+                        background=DARK_ENTRY,
+                        foreground=DARK_FG,
+                        rowheight=25,
+                        fieldbackground=DARK_ENTRY,
+                        bordercolor=DARK_BG,
+                        borderwidth=0)
+        style.map('Treeview', background=[('selected', DARK_HOVER)])
+        
+        style.configure("Treeview.Heading", 
+                        background=DARK_BUTTON,
+                        foreground=DARK_FG,
+                        relief="flat")
+        style.map("Treeview.Heading", 
+                background=[('active', DARK_HOVER)])
+    
+    def market_suggestions(self, text, limit=MARKET_SUGGESTIONS):
+        """
+        Rótulos dos símbolos que melhor combinam com o texto digitado
+
+        index_for não bloqueia: enquanto a trie é montada em segundo plano a
+        busca usa a varredura linear e passa para a trie quando ela fica pronta.
+        """
+        index = symbol_index.index_for(app_config.symbols)
+        return [item["label"] for item in index.search(text, limit)]
+
+    def on_market_selected(self, event=None):
+        """Assina as cotações do mercado escolhido"""
+        if self.market_code_map.get(self.market_var.get()):
+            self.update_quote_subscription()
+            self.refresh_quote()
+
+    @metrics.timed('ui.quote')
+    def refresh_quote(self):
+        """Atualiza a cotação exibida; lê o buffer do feed em vez de receber cada tick"""
+        if self.quote_job:
+            self.root.after_cancel(self.quote_job)
+        code = self.market_code_map.get(self.market_var.get())
+        tick = self.quote_feed.latest(code) if code else None
+        self.quote_label.config(text=f"Cotação: {tick[1]:.5f}" if tick else "Cotação: -")
+        self.quote_job = self.root.after(QUOTE_REFRESH_MS, self.refresh_quote) if code else None
+
+    @metrics.timed('ui.market_search')
+    def on_market_typed(self, event):
+        if event.keysym in ("Up", "Down", "Return", "Escape", "Tab"):
+            return
+        self.market_select.config(values=self.market_suggestions(self.market_var.get()))
+
+    def load_user_data(self):
+        """Atualização manual (botão): busca o corpo completo e mostra erros"""
+        self.user_poller.invalidate()
+        self.poll_user_data(manual=True)
+
+    def poll_user_data(self, manual=False):
+        """Dispara a consulta dos dados do usuário em segundo plano"""
+        if self.poll_job is not None:
+            self.root.after_cancel(self.poll_job)
+            self.poll_job = None
+        started = self.worker.submit(
+            'user-info', self.user_poller.fetch,
+            lambda data: self.on_user_data_loaded(data, manual),
+            lambda error: self.on_user_data_error(error, manual),
+            args=(app_config.user_uuid,)
+        )
+        if started and manual:
+            self.set_loading(True)
+
+    def schedule_user_poll(self, changed=False, error=False):
+        """Agenda a próxima consulta: rápida com operações abertas, espaçada quando ocioso"""
+        if self.poll_job is not None:
+            self.root.after_cancel(self.poll_job)
+        delay = self.user_poller.next_delay(self.has_open_operations(), changed=changed, error=error)
+        self.poll_job = self.root.after(int(delay * 1000), self.poll_user_data)
+
+    def has_open_operations(self):
+        """Há operações aguardando envio ou liquidação"""
+        return bool(self.unsent or self.settlement.pending)
+
+    def hurry_user_poll(self):
+        """
+        Operações abertas: antecipa a próxima consulta para o intervalo rápido
+
+        Não é resultado de consulta, então não passa por next_delay (que
+        dobraria o intervalo). Uma consulta em andamento reagenda sozinha.
+        """
+        # Já no intervalo rápido: reagendar só adiaria a consulta
+        if self.poll_job is None or self.user_poller.interval <= self.user_poller.active_interval:
+            return
+        self.root.after_cancel(self.poll_job)
+        delay = self.user_poller.force_active()
+        self.poll_job = self.root.after(int(delay * 1000), self.poll_user_data)
+
+    def on_user_data_loaded(self, data, manual=False):
+        if manual:
+            self.set_loading(False)
+        self.schedule_user_poll(changed=data is not None)
+        if data is None:
+            # 304 ou corpo idêntico: nada a atualizar
+            return
+        # Só em memória: a cada consulta não vale gravar o config.json (com
+        # fsync) na thread da interface; o usuário é persistido no login
+        app_config.set_config('user', data, auto_save=False)
+
+        self.user_data.update({
+            "saldo": app_config.get('user.wallet.balance'),
+            "nome": app_config.get('user.name'),
+            "sobrenome": app_config.get('user.last_name'),
+            "telefone": f"({app_config.get('user.phone_code')}) {app_config.get('user.phone_number')}"
+        })
+
+        # Atualiza a interface
+        self.update_user_display()
+
+    def on_user_data_error(self, error, manual=False):
+        self.schedule_user_poll(error=True)
+        if manual:
+            self.set_loading(False)
+            messagebox.showerror("Erro", f"Não foi possível carregar os dados: {str(error)}")
+        else:
+            print(f"Erro ao atualizar os dados do usuário: {error}")
+
+    def refresh_server_status(self):
+        """Mostra os endpoints com o disjuntor aberto ou em teste; só repinta se mudou"""
+        states = api_client.breaker_states()
+        down = sorted(name for name, state in states.items() if state == STATE_OPEN)
+        testing = sorted(name for name, state in states.items() if state != STATE_OPEN)
+        if down:
+            text, color = f"Servidor: indisponível ({', '.join(down)})", "#F44336"
+        elif testing:
+            text, color = f"Servidor: reconectando ({', '.join(testing)})", "#FF9800"
+        else:
+            text, color = "Servidor: conectado", "#4CAF50"
+        if self.user_texts.get(self.server_label) != text:
+            self.server_label.config(text=text, fg=color)
+            self.user_texts[self.server_label] = text
+        self.server_job = self.root.after(SERVER_STATUS_MS, self.refresh_server_status)
+
+    def set_loading(self, loading):
+        """Mostra/oculta o estado de carregamento do painel do usuário"""
+        if loading:
+            self.update_btn.config(text="Atualizando...", state=tk.DISABLED)
+        else:
+            self.update_btn.config(text="Atualizar Dados", state=tk.NORMAL)
+    
+    @metrics.timed('ui.user_panel')
+    def update_user_display(self):
+        """Atualiza os labels com os dados do usuário, só os que mudaram"""
+        texts = {
+            self.saldo_label: f"Saldo: ${self.user_data['saldo'] or 0:,.2f}",
+            self.nome_label: f"Nome: {self.user_data['nome']} {self.user_data['sobrenome']}",
+            self.telefone_label: f"Telefone: {self.user_data['telefone']}",
+        }
+        for label, text in texts.items():
+            if self.user_texts.get(label) != text:
+                label.config(text=text)
+                self.user_texts[label] = text
+
+    def generate_sample_data(self):
+        """Gera dados de exemplo para a tabela"""
+        '''
+        markets = ["EUR/USD", "GBP/USD", "USD/JPY", "AUD/USD", "USD/CAD"]
+        types = ["CALL", "PUT"]
+        times = ["1 minuto", "5 minutos", "10 minutos", "15 minutos", "30 minutos", "1 hora"]
+        
+        for _ in range(20):
+            market = random.choice(markets)
+            op_type = random.choice(types)
+            time = random.choice(times)
+            value = round(random.uniform(10, 1000), 2)
+            
+            # Data de entrada aleatória (no passado)
+            entry_time = datetime.now() - timedelta(days=random.randint(0, 7), 
+                                                 hours=random.randint(0, 23),
+                                                 minutes=random.randint(1, 59))
+            entry_time_str = entry_time.strftime("%d/%m/%Y %H:%M")
+            
+            # 70% de chance de ganho, 30% de perda
+            if random.random() < 0.7:
+                result = round(value * random.uniform(1.1, 2.5), 2)
+                result_text = f"+{result}"
+            else:
+                result = round(value * random.uniform(0.2, 0.9), 2)
+                result_text = f"-{result}"
+            
+            # Data da operação (pode ser igual ou posterior à entrada)
+            op_date = entry_time + timedelta(minutes=random.randint(1, int(time.split()[0]) if time != "1 hora" else 60))
+            date_str = op_date.strftime("%d/%m/%Y %H:%M")
+            
+            self.tree.insert("", "end", values=(
+                market, 
+                op_type, 
+                time, 
+                f"${value:.2f}", 
+                result_text, 
+                entry_time_str,
+                date_str
+            ))
+        '''
+    
+    def validate_datetime(self, datetime_str):
+        """Valida se a data/hora é válida e pelo menos 1 minuto à frente"""
+        try:
+            input_dt = datetime.strptime(datetime_str, DATETIME_FORMAT)
+            error = check_entry_time(input_dt)
+            if error:
+                return False, error
+            return True, ""
+        except ValueError:
+            return False, "Formato de data/hora inválido. Use DD/MM/AAAA HH:MM"
+    
+    def submit_operation(self):
+        """Valida e envia uma nova operação"""
+        market = self.market_var.get()
+        op_type = self.type_var.get()
+        time = self.time_var.get()
+        value = self.value_entry.get()
+        entry_time = self.entry_time_var.get()
+        
+        if not all([market, op_type, time, value, entry_time]):
+            messagebox.showerror("Erro", "Por favor, preencha todos os campos!")
+            return
+        
+        if market not in self.market_code_map:
+            messagebox.showerror("Erro", "Selecione um mercado da lista!")
+            return
+
+        # Validar data/hora de entrada
+        is_valid, error_msg = self.validate_datetime(entry_time)
+        if not is_valid:
+            messagebox.showerror("Erro", error_msg)
+            return
+        
+        try:
+            value = float(value)
+            if value <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Erro", "Por favor, insira um valor numérico válido maior que zero!")
+            return
+        
+        # Data da operação (expiração)
+        time_minutes = TIME_OPTIONS[time]
+        entry_ts = int(datetime.strptime(entry_time, DATETIME_FORMAT).timestamp())
+        self.enqueue_operations([{
+            'symbol': self.market_code_map[market],
+            'market': market,
+            'type': op_type,
+            'time_minutes': time_minutes,
+            'value': value,
+            'entry_time': entry_ts,
+            'expiry_time': entry_ts + time_minutes * 60,
+        }])
+        
+        # Limpar campos (exceto data/hora que é definida para agora + 1 minuto)
+        self.market_var.set('')
+        self.type_var.set('')
+        self.time_var.set('')
+        self.value_entry.delete(0, tk.END)
+        default_time = (datetime.now() + timedelta(minutes=1)).strftime("%d/%m/%Y %H:%M")
+        self.entry_time_var.set(default_time)
+        
+        messagebox.showinfo("Sucesso", "Operação adicionada à fila de envio!")
+
+    @metrics.timed('ui.enqueue')
+    def enqueue_operations(self, signals):
+        """
+        Registra e enfileira operações já validadas de uma só vez
+
+        Uma transação no histórico, uma renderização da tabela e uma entrada
+        na fila de envio para todo o lote.
+        """
+        # from_dict ignora chaves extras dos sinais (ex.: 'line' da importação)
+        operations = [Operation.from_dict(dict(signal, id=uuid.uuid4().hex, user=app_config.user_uuid,
+                                               status=STATUS_QUEUED))
+                      for signal in signals]
+        self.history_store.add_many(operations)
+        self.tree.extend([(op.id, op) for op in operations])
+        for op in operations:
+            self.unsent[op.id] = op
+        self.update_quote_subscription()
+        # Operações abertas: passa a consultar o saldo no intervalo rápido
+        self.hurry_user_poll()
+
+        # Enfileira o envio; as linhas da tabela acompanham o estado de cada operação
+        self.order_queue.submit_many([order_payload(op) for op in operations])
+        return operations
+
+    def open_signal_import(self):
+        """Abre a janela de importação de lista de sinais"""
+        SignalImportDialog(self)
+
+    def on_order_status(self, op_id, status, detail):
+        """Recebe mudanças de estado do OrderQueue (thread de envio)"""
+        self.worker.post(self.update_order_row, op_id, status, detail)
+
+    @metrics.timed('ui.order_status')
+    def update_order_row(self, op_id, status, detail):
+        """Atualiza o histórico local e a coluna de resultado da operação na tabela"""
+        result = None
+        if status == STATUS_SENT and isinstance(detail, dict) and detail.get('result') is not None:
+            result = float(detail['result'])
+        op = self.unsent.get(op_id) or self.settlement.pending.get(op_id)
+        if op is None:
+            # Já liquidada localmente: o estado do envio não substitui o resultado
+            return
+        self.history_store.update_status(op_id, status, result)
+        if result is not None or status == STATUS_REJECTED:
+            # Já liquidada pelo backend ou recusada: sai da agenda local
+            self.unsent.pop(op_id, None)
+            self.settlement.cancel(op_id)
+            if result is not None:
+                self.record_result(op, result)
+                self.add_to_balance(result)
+        elif status == STATUS_SENT and self.unsent.pop(op_id, None) is not None:
+            # Confirmada pelo backend: a partir daqui pode ser liquidada pelas cotações
+            self.settlement.add(op)
+            self.update_quote_subscription()
+            self.hurry_user_poll()
+        self.update_row(op_id, status, result)
+
+    def on_destroy(self, event):
+        """Grava no spool as operações não enviadas ao fechar a janela"""
+        if event.widget is self.frame:
+            if self.poll_job is not None:
+                self.root.after_cancel(self.poll_job)
+                self.poll_job = None
+            if self.server_job is not None:
+                self.root.after_cancel(self.server_job)
+                self.server_job = None
+            self.settlement.stop()
+            self.quote_feed.stop()
+            self.order_queue.stop()
+            self.history_store.close()
+
+class SignalImportDialog:
+    """Janela para colar ou abrir uma lista de sinais e enviá-la de uma vez"""
+
+    def __init__(self, app):
+        self.app = app
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Importar Sinais")
+        self.window.geometry("640x520")
+        self.window.configure(bg=DARK_BG)
+        self.window.transient(app.root)
+        self.create_widgets()
+
+    def create_widgets(self):
+        main_frame = tk.Frame(self.window, bg=DARK_BG, padx=15, pady=15)
+        main_frame.pack(expand=True, fill=tk.BOTH)
+
+        help_label = tk.Label(
+            main_frame,
+            text="Cole a lista (mercado;tipo;tempo;entrada;valor) ou abra um arquivo CSV:",
+            font=("Arial", 10),
+            fg=DARK_FG,
+            bg=DARK_BG,
+            anchor='w'
+        )
+        help_label.pack(fill=tk.X, pady=(0, 5))
+
+        self.text = tk.Text(
+            main_frame,
+            height=14,
+            font=("Courier", 10),
+            bg=DARK_ENTRY,
+            fg=DARK_FG,
+            insertbackground=DARK_FG,
+            relief=tk.FLAT
+        )
+        self.text.pack(fill=tk.BOTH, expand=True)
+
+        buttons_frame = tk.Frame(main_frame, bg=DARK_BG)
+        buttons_frame.pack(fill=tk.X, pady=10)
+        for text, command in (("Abrir arquivo...", self.open_file), ("Validar e Enviar", self.submit)):
+            button = tk.Button(
+                buttons_frame,
+                text=text,
+                font=("Arial", 10, "bold"),
+                bg=DARK_BUTTON,
+                fg=DARK_FG,
+                activebackground=DARK_HOVER,
+                activeforeground=DARK_FG,
+                relief=tk.FLAT,
+                command=command
+            )
+            button.pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 5), ipady=4)
+
+        self.summary_label = tk.Label(main_frame, text="", font=("Arial", 10), fg=DARK_FG, bg=DARK_BG, anchor='w')
+        self.summary_label.pack(fill=tk.X)
+
+        self.errors_text = tk.Text(
+            main_frame,
+            height=8,
+            font=("Courier", 9),
+            bg=DARK_ENTRY,
+            fg="#ff5555",
+            relief=tk.FLAT,
+            state=tk.DISABLED
+        )
+        self.errors_text.pack(fill=tk.BOTH, expand=True)
+
+    def open_file(self):
+        path = filedialog.askopenfilename(
+            parent=self.window,
+            filetypes=[("Listas de sinais", "*.csv *.txt"), ("Todos os arquivos", "*.*")]
+        )
+        if not path:
+            return
+        with open(path, encoding='utf-8') as f:
+            content = f.read()
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", content)
+
+    def submit(self):
+        """Valida todas as linhas e enfileira as válidas num único lote"""
+        validator = SignalValidator(app_config.symbols, app_config.min_bet, app_config.max_bet)
+        lines = self.text.get("1.0", "end-1c").splitlines()
+        valid, errors = parse_signals(lines, validator)
+
+        if valid:
+            self.app.enqueue_operations(valid)
+
+        self.errors_text.config(state=tk.NORMAL)
+        self.errors_text.delete("1.0", tk.END)
+        self.errors_text.insert("1.0", "\n".join(f"Linha {line}: {message}" for line, message in errors))
+        self.errors_text.config(state=tk.DISABLED)
+
+        error_lines = len({line for line, _ in errors})
+        self.summary_label.config(
+            text=f"{len(valid)} operações enviadas para a fila, {error_lines} linhas com erro."
+        )
+        if valid and not errors:
+            self.window.destroy()
+            messagebox.showinfo("Sucesso", f"{len(valid)} operações adicionadas à fila de envio!")
+        elif valid:
+            # Remove do texto as linhas já enviadas, deixando o cabeçalho e as com erro
+            sent = {signal['line'] for signal in valid}
+            self.text.delete("1.0", tk.END)
+            self.text.insert("1.0", "\n".join(
+                line for number, line in enumerate(lines, 1) if number not in sent
+            ))
@@ -0,0 +1,206 @@
+import heapq
+import itertools
+import threading
+import time
+
+import requests
+
+from api_client import api_client
+
+RESULTS_ENDPOINT = 'operations/results'
+DEFAULT_PAYOUT = 0.8
+RETRY_DELAY = 15.0
+
+# Distância máxima (s) entre o tick e o horário de entrada/vencimento para usar a cotação local
+MAX_TICK_AGE = 5.0
+
+EVENT_ENTRY = 0
+EVENT_EXPIRY = 1
+
+
+def price_at(tick, moment, max_age=MAX_TICK_AGE):
+    """
+    Preço do tick (horário, preço) se ele for próximo de `moment`; None se
+    não houver tick ou se o feed estiver parado (tick antigo demais)
+    """
+    if not tick or abs(tick[0] - moment) > max_age:
+        return None
+    return tick[1]
+
+
+class SettlementEngine:
+    """
+    Agenda de liquidação das operações abertas
+
+    Os eventos (captura do preço de entrada e vencimento) ficam num min-heap
+    ordenado pelo horário. Uma única thread dorme até o próximo horário,
+    acorda, retira de uma vez todos os eventos já vencidos e resolve os
+    vencimentos em lote — não existe uma thread ou after() por operação.
+
+    resolver(lote) recebe uma lista de operações vencidas e retorna
+    {id: resultado}; as que ficarem sem resultado são tentadas de novo depois
+    de RETRY_DELAY segundos. on_settled(lista de (operação, resultado)) é
+    chamado uma vez por lote, na thread do motor.
+    """
+
+    def __init__(self, resolver, on_settled, price_source=None, clock=time.time):
+        self.resolver = resolver
+        self.on_settled = on_settled
+        self.price_source = price_source
+        self.clock = clock
+        self.pending = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stop = False
+        self._thread = None
+
+    def __len__(self):
+        return len(self.pending)
+
+    def add(self, operation):
+        """
+        Agenda uma operação (dicionário com id, symbol, type, value,
+        entry_time e expiry_time em epoch)
+        """
+        op = dict(operation)
+        with self._cond:
+            self.pending[op['id']] = op
+            if op.get('entry_price') is None:
+                heapq.heappush(self._heap, (op['entry_time'], next(self._seq), EVENT_ENTRY, op['id']))
+            heapq.heappush(self._heap, (op['expiry_time'], next(self._seq), EVENT_EXPIRY, op['id']))
+            self._cond.notify()
+
+    def cancel(self, op_id):
+        """Remove uma operação da agenda (os eventos no heap são descartados ao vencer)"""
+        with self._cond:
+            self.pending.pop(op_id, None)
+
+    def symbols(self):
+        """Códigos dos símbolos com operações abertas"""
+        with self._cond:
+            return {op['symbol'] for op in self.pending.values()}
+
+    def start(self):
+        if self._thread is None:
+            self._stop = False
+            self._thread = threading.Thread(target=self._run, name="settlement", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stop = True
+            self._cond.notify()
+
+    def _next_batch(self):
+        """Dorme até haver eventos vencidos e retorna todos eles de uma vez"""
+        with self._cond:
+            while not self._stop:
+                now = self.clock()
+                if self._heap and self._heap[0][0] <= now:
+                    due = []
+                    while self._heap and self._heap[0][0] <= now:
+                        _, _, kind, op_id = heapq.heappop(self._heap)
+                        op = self.pending.get(op_id)
+                        if op is not None:
+                            due.append((kind, op))
+                    if due:
+                        return due
+                    continue
+                timeout = self._heap[0][0] - now if self._heap else None
+                self._cond.wait(timeout)
+            return None
+
+    def _run(self):
+        while True:
+            due = self._next_batch()
+            if due is None:
+                return
+
+            expired = []
+            for kind, op in due:
+                if kind == EVENT_ENTRY:
+                    op['entry_price'] = self._price(op['symbol'], op['entry_time'])
+                else:
+                    expired.append(op)
+            if not expired:
+                continue
+
+            try:
+                results = self.resolver(expired) or {}
+            except Exception as e:
+                print(f"Erro ao liquidar operações: {e}")
+                results = {}
+
+            settled = []
+            with self._cond:
+                for op in expired:
+                    result = results.get(op['id'])
+                    if result is None:
+                        heapq.heappush(self._heap, (self.clock() + RETRY_DELAY, next(self._seq),
+                                                    EVENT_EXPIRY, op['id']))
+                    elif self.pending.pop(op['id'], None) is not None:
+                        settled.append((op, result))
+            if settled:
+                try:
+                    self.on_settled(settled)
+                except Exception as e:
+                    print(f"Erro ao aplicar liquidação: {e}")
+
+    def _price(self, symbol, moment):
+        if self.price_source is None:
+            return None
+        return price_at(self.price_source(symbol), moment)
+
+
+def quote_result(op, exit_price, payout=DEFAULT_PAYOUT):
+    """
+    Resultado de uma operação pelas cotações de entrada e saída
+
+    CALL ganha se o preço subiu, PUT se caiu; empate devolve 0.
+    Retorna None se faltar alguma cotação.
+    """
+    entry_price = op.get('entry_price')
+    if entry_price is None or exit_price is None:
+        return None
+    if exit_price == entry_price:
+        return 0.0
+    won = (exit_price > entry_price) == (op['type'] == "CALL")
+    return round(op['value'] * payout, 2) if won else -round(op['value'], 2)
+
+
+class QuoteOrBackendResolver:
+    """
+    Resolve um lote de vencimentos pelas cotações locais e consulta o
+    backend, numa única requisição, apenas para as operações sem cotação
+    (ou com cotação de entrada/saída distante do horário, feed parado)
+    """
+
+    def __init__(self, price_source, payout=DEFAULT_PAYOUT):
+        self.price_source = price_source
+        self.payout = payout
+
+    def __call__(self, batch):
+        results = {}
+        missing = []
+        for op in batch:
+            exit_price = price_at(self.price_source(op['symbol']), op['expiry_time'])
+            result = quote_result(op, exit_price, self.payout)
+            if result is None:
+                missing.append(op['id'])
+            else:
+                results[op['id']] = result
+        if missing:
+            results.update(self._from_backend(missing))
+        return results
+
+    @staticmethod
+    def _from_backend(ids):
+        try:
+            response = api_client.post(RESULTS_ENDPOINT, json={'ids': ids})
+            response.raise_for_status()
+            return {item['id']: float(item['result']) for item in response.json().get('data', [])
+                    if item.get('result') is not None}
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            print(f"Erro ao consultar resultados no servidor: {e}")
+            return {}
@@ -0,0 +1,187 @@
+"""
+Importação de listas de sinais (CSV ou texto colado)
+
+O texto inteiro é lido numa passada e cada linha é validada com as mesmas
+regras do formulário: data/hora de entrada pelo menos 1 minuto à frente,
+valor entre min_bet e max_bet do tenant, mercado conhecido e tempo de
+expiração entre as opções disponíveis. Todos os erros são devolvidos juntos.
+
+Formato: market,type,expiry,entry_time,value (ou mercado,tipo,tempo,entrada,valor),
+com ou sem cabeçalho, separado por vírgula, ponto e vírgula ou tab.
+"""
+import csv
+from datetime import datetime, timedelta
+
+from operation import DATETIME_FORMAT, OPERATION_TYPES, TIME_LABELS, TIME_OPTIONS
+
+FIELDS = ('market', 'type', 'expiry', 'entry_time', 'value')
+HEADER_ALIASES = {
+    'market': 'market', 'mercado': 'market', 'symbol': 'market', 'simbolo': 'market',
+    'type': 'type', 'tipo': 'type', 'direction': 'type',
+    'expiry': 'expiry', 'tempo': 'expiry', 'time': 'expiry', 'expiracao': 'expiry',
+    'entry_time': 'entry_time', 'entrada': 'entry_time', 'data': 'entry_time',
+    'value': 'value', 'valor': 'value',
+}
+DELIMITERS = (',', ';', '\t')
+ENTRY_FORMATS = (DATETIME_FORMAT, "%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S")
+
+ENTRY_TOO_SOON = "A data/hora de entrada deve ser pelo menos {lead} à frente do horário atual"
+
+
+def parse_entry_time(text):
+    """Converte a data/hora de entrada (DD/MM/AAAA HH:MM ou ISO) em datetime"""
+    text = (text or '').strip()
+    for fmt in ENTRY_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    raise ValueError("Formato de data/hora inválido. Use DD/MM/AAAA HH:MM")
+
+
+def parse_expiry(text):
+    """Converte o tempo de expiração ('5', '5 minutos', '1 hora', 'M5') em minutos"""
+    text = (text or '').strip()
+    if text in TIME_OPTIONS:
+        return TIME_OPTIONS[text]
+    digits = text[1:] if text[:1] in ('M', 'm') else text
+    try:
+        minutes = int(digits)
+    except ValueError:
+        minutes = None
+    if minutes not in TIME_LABELS:
+        raise ValueError(f"Tempo de expiração inválido: {text!r}")
+    return minutes
+
+
+def lead_text(seconds):
+    """Antecedência por extenso ('1 minuto', '5 minutos', '90 segundos')"""
+    seconds = int(seconds)
+    if seconds % 60:
+        return f"{seconds} segundo" + ("s" if seconds != 1 else "")
+    minutes = seconds // 60
+    return f"{minutes} minuto" + ("s" if minutes != 1 else "")
+
+
+def check_entry_time(entry_dt, now=None, min_lead=60):
+    """Retorna a mensagem de erro se a entrada não estiver min_lead segundos à frente, senão None"""
+    now = now or datetime.now()
+    if entry_dt < now + timedelta(seconds=min_lead):
+        return ENTRY_TOO_SOON.format(lead=lead_text(min_lead))
+    return None
+
+
+def read_rows(lines):
+    """
+    Lê as linhas (texto colado ou arquivo) e gera (número_da_linha, dicionário)
+
+    O separador é detectado pela primeira linha não vazia; se ela tiver nomes
+    de colunas conhecidos, é usada como cabeçalho, senão vale a ordem FIELDS.
+    """
+    lines = iter(lines)
+    first, line_number = None, 0
+    for first in lines:
+        line_number += 1
+        if first.strip():
+            break
+    else:
+        return
+
+    delimiter = max(DELIMITERS, key=first.count)
+    cells = [c.strip() for c in next(csv.reader([first], delimiter=delimiter))]
+    normalized = [HEADER_ALIASES.get(c.lower().replace('/', '_').replace(' ', '_')) for c in cells]
+    if sum(1 for name in normalized if name) >= 3:
+        header = normalized
+    else:
+        header = list(FIELDS)
+        yield line_number, dict(zip(header, cells))
+
+    for cells in csv.reader(lines, delimiter=delimiter):
+        line_number += 1
+        if not any(c.strip() for c in cells):
+            continue
+        yield line_number, {name: cell.strip() for name, cell in zip(header, cells) if name}
+
+
+class SignalValidator:
+    """Valida linhas de sinais contra o catálogo e os limites do tenant"""
+
+    def __init__(self, symbols, min_bet=0.0, max_bet=0.0, min_lead=60, now=None):
+        self.min_bet = float(min_bet or 0)
+        self.max_bet = float(max_bet or 0)
+        self.min_lead = min_lead
+        self.now = now or datetime.now()
+        # Aceita o código ou o rótulo do mercado
+        self.markets = {}
+        for item in symbols:
+            self.markets[item['code'].upper()] = (item['code'], item['label'])
+            self.markets[item['label'].upper()] = (item['code'], item['label'])
+
+    def validate(self, row):
+        """Retorna (sinal, erros); sinal é None se houver qualquer erro na linha"""
+        errors = []
+
+        market = self.markets.get((row.get('market') or '').strip().upper())
+        if market is None:
+            errors.append(f"Mercado desconhecido: {row.get('market')!r}")
+
+        op_type = (row.get('type') or '').strip().upper()
+        if op_type not in OPERATION_TYPES:
+            errors.append(f"Tipo inválido: {row.get('type')!r} (use CALL ou PUT)")
+
+        minutes = None
+        try:
+            minutes = parse_expiry(row.get('expiry'))
+        except ValueError as e:
+            errors.append(str(e))
+
+        entry_dt = None
+        try:
+            entry_dt = parse_entry_time(row.get('entry_time'))
+            error = check_entry_time(entry_dt, self.now, self.min_lead)
+            if error:
+                errors.append(error)
+        except ValueError as e:
+            errors.append(str(e))
+
+        value = None
+        try:
+            value = float(str(row.get('value') or '').replace(',', '.'))
+            if value <= 0:
+                errors.append("O valor deve ser maior que zero")
+            elif self.min_bet and value < self.min_bet:
+                errors.append(f"Valor abaixo do mínimo de ${self.min_bet:.2f}")
+            elif self.max_bet and value > self.max_bet:
+                errors.append(f"Valor acima do máximo de ${self.max_bet:.2f}")
+        except ValueError:
+            errors.append(f"Valor inválido: {row.get('value')!r}")
+
+        if errors:
+            return None, errors
+        entry_time = int(entry_dt.timestamp())
+        return {
+            'symbol': market[0],
+            'market': market[1],
+            'type': op_type,
+            'time_minutes': minutes,
+            'value': value,
+            'entry_time': entry_time,
+            'expiry_time': entry_time + minutes * 60,
+        }, []
+
+
+def parse_signals(lines, validator):
+    """
+    Valida a lista inteira de uma vez
+
+    Retorna (sinais_válidos, erros) onde erros é uma lista de (linha, mensagem).
+    """
+    valid, errors = [], []
+    for line_number, row in read_rows(lines):
+        signal, row_errors = validator.validate(row)
+        if signal is None:
+            errors.extend((line_number, message) for message in row_errors)
+        else:
+            signal['line'] = line_number
+            valid.append(signal)
+    return valid, errors
@@ -0,0 +1,95 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from perf import metrics
+
+
+class PipelineError(Exception):
+    """Falha de uma tarefa do pipeline de inicialização"""
+
+    def __init__(self, task, error):
+        super().__init__(f"{task}: {error}")
+        self.task = task
+        self.error = error
+
+
+class Task:
+    """Tarefa do pipeline: função, dependências e texto exibido na tela"""
+
+    def __init__(self, name, func, deps=(), label=None):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.label = label or name
+
+
+class StartupPipeline:
+    """
+    Grafo de tarefas executado em paralelo onde as dependências permitem
+
+    Cada tarefa recebe como argumentos os resultados das suas dependências, na
+    ordem em que foram declaradas. Uma tarefa só é disparada quando todas as
+    dependências terminaram; tarefas independentes rodam ao mesmo tempo.
+    """
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.tasks = {}
+        self.durations = {}
+
+    def add(self, name, func, deps=(), label=None):
+        """Registra uma tarefa no grafo"""
+        self.tasks[name] = Task(name, func, deps, label)
+        return self
+
+    def run(self, on_progress=None):
+        """
+        Executa o grafo e retorna um dicionário {nome: resultado}
+
+        Parâmetros:
+        - on_progress: callback(concluidas, total, tarefa) chamado a cada tarefa concluída
+
+        Lança PipelineError na primeira tarefa que falhar.
+        """
+        for task in self.tasks.values():
+            missing = [d for d in task.deps if d not in self.tasks]
+            if missing:
+                raise ValueError(f"Tarefa '{task.name}' depende de tarefas inexistentes: {missing}")
+
+        results = {}
+        pending = dict(self.tasks)
+        running = {}
+        total = len(self.tasks)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for name, task in list(pending.items()):
+                    if all(d in results for d in task.deps):
+                        args = [results[d] for d in task.deps]
+                        running[executor.submit(self._timed, task, args)] = task
+                        del pending[name]
+
+                if not running:
+                    raise ValueError(f"Dependência circular entre as tarefas: {list(pending)}")
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    try:
+                        results[task.name] = future.result()
+                    except Exception as e:
+                        for other in running:
+                            other.cancel()
+                        raise PipelineError(task.name, e) from e
+                    if on_progress:
+                        on_progress(len(results), total, task)
+
+        return results
+
+    def _timed(self, task, args):
+        start = time.perf_counter()
+        try:
+            return task.func(*args)
+        finally:
+            self.durations[task.name] = time.perf_counter() - start
+            metrics.record(f'startup.{task.name}', self.durations[task.name])
@@ -0,0 +1,147 @@
+import tkinter as tk
+from tkinter import ttk
+
+from theme import DARK_BG, DARK_ENTRY, DARK_FG
+
+# Intervalo de verificação de novas liquidações (ms)
+REFRESH_MS = 1000
+
+CURVE_HEIGHT = 160
+CURVE_PADDING = 8
+GAIN_COLOR = "#4CAF50"
+LOSS_COLOR = "#F44336"
+
+BREAKDOWN_COLUMNS = ('key', 'count', 'win_rate', 'net')
+
+
+def money(value):
+    return f"{value:+,.2f}"
+
+
+class StatsPanel:
+    """
+    Janela de estatísticas das operações liquidadas
+
+    Lê os agregados mantidos pela tela principal (app.stats); a cada
+    REFRESH_MS só redesenha se houve liquidação nova, e a curva de capital é
+    desenhada já reduzida à largura do gráfico.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.root = app.root
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Estatísticas")
+        self.window.geometry("760x560")
+        self.window.configure(bg=DARK_BG)
+        self.window.transient(app.root)
+        self.job = None
+        self.shown = None
+        self.summary_labels = {}
+        self.create_widgets()
+        self.window.bind("<Destroy>", self.on_destroy)
+        self.refresh()
+
+    def create_widgets(self):
+        main_frame = tk.Frame(self.window, bg=DARK_BG, padx=15, pady=15)
+        main_frame.pack(expand=True, fill=tk.BOTH)
+
+        summary_frame = tk.Frame(main_frame, bg=DARK_BG)
+        summary_frame.pack(fill=tk.X)
+        fields = (
+            ('count', "Operações"),
+            ('win_rate', "Taxa de acerto"),
+            ('net', "Resultado líquido"),
+            ('profit_factor', "Fator de lucro"),
+            ('max_drawdown', "Drawdown máximo"),
+            ('drawdown', "Drawdown atual"),
+        )
+        for column, (name, text) in enumerate(fields):
+            tk.Label(summary_frame, text=text, font=("Arial", 9), fg=DARK_FG, bg=DARK_BG).grid(
+                row=0, column=column, padx=8, sticky='w')
+            label = tk.Label(summary_frame, text="-", font=("Arial", 12, "bold"), fg=DARK_FG, bg=DARK_BG)
+            label.grid(row=1, column=column, padx=8, sticky='w')
+            self.summary_labels[name] = label
+
+        tk.Label(main_frame, text="Curva de capital", font=("Arial", 10, "bold"), fg=DARK_FG,
+                 bg=DARK_BG, anchor='w').pack(fill=tk.X, pady=(15, 5))
+        self.canvas = tk.Canvas(main_frame, height=CURVE_HEIGHT, bg=DARK_ENTRY, highlightthickness=0)
+        self.canvas.pack(fill=tk.X)
+        self.canvas.bind("<Configure>", lambda e: self.draw_curve())
+
+        tables = tk.Frame(main_frame, bg=DARK_BG)
+        tables.pack(expand=True, fill=tk.BOTH, pady=(15, 0))
+        self.symbol_tree = self.breakdown_table(tables, "Por mercado", "Mercado")
+        self.expiry_tree = self.breakdown_table(tables, "Por expiração", "Expiração")
+
+    def breakdown_table(self, parent, title, key_heading):
+        frame = tk.Frame(parent, bg=DARK_BG)
+        frame.pack(side=tk.LEFT, expand=True, fill=tk.BOTH, padx=(0, 10))
+        tk.Label(frame, text=title, font=("Arial", 10, "bold"), fg=DARK_FG, bg=DARK_BG,
+                 anchor='w').pack(fill=tk.X, pady=(0, 5))
+        tree = ttk.Treeview(frame, columns=BREAKDOWN_COLUMNS, show="headings", height=8)
+        for column, heading, width in zip(BREAKDOWN_COLUMNS, (key_heading, "N", "Acerto", "Resultado ($)"),
+                                          (110, 60, 70, 100)):
+            tree.heading(column, text=heading)
+            tree.column(column, width=width, anchor='w' if column == 'key' else 'e')
+        tree.pack(expand=True, fill=tk.BOTH)
+        return tree
+
+    def refresh(self):
+        stats = self.app.stats
+        if self.shown != (stats, stats.version):
+            self.shown = (stats, stats.version)
+            self.update_summary(stats)
+            self.fill_breakdown(self.symbol_tree, stats.breakdown(stats.by_symbol), str)
+            self.fill_breakdown(self.expiry_tree, stats.breakdown(stats.by_expiry), lambda m: f"{m} min")
+            self.draw_curve()
+        self.job = self.root.after(REFRESH_MS, self.refresh)
+
+    def update_summary(self, stats):
+        summary = stats.summary()
+        texts = {
+            'count': f"{summary['count']} ({summary['wins']}/{summary['losses']})",
+            'win_rate': f"{summary['win_rate'] * 100:.1f}%",
+            'net': money(summary['net']),
+            'profit_factor': f"{summary['profit_factor']:.2f}" if summary['profit_factor'] is not None else "-",
+            'max_drawdown': f"{summary['max_drawdown']:,.2f}",
+            'drawdown': f"{summary['drawdown']:,.2f}",
+        }
+        for name, text in texts.items():
+            self.summary_labels[name].config(text=text)
+        self.summary_labels['net'].config(fg=GAIN_COLOR if summary['net'] >= 0 else LOSS_COLOR)
+
+    @staticmethod
+    def fill_breakdown(tree, rows, key_text):
+        tree.delete(*tree.get_children())
+        for key, count, win_rate, net in rows:
+            tree.insert('', tk.END, values=(key_text(key), count, f"{win_rate * 100:.1f}%", money(net)))
+
+    def draw_curve(self):
+        self.canvas.delete("all")
+        width = self.canvas.winfo_width()
+        height = self.canvas.winfo_height()
+        points = self.app.stats.curve(max(2, width))
+        if width <= 1 or len(points) < 2:
+            return
+
+        values = [0.0] + points
+        low, high = min(values), max(values)
+        span = (high - low) or 1.0
+        usable = height - 2 * CURVE_PADDING
+
+        def y(value):
+            return CURVE_PADDING + (high - value) / span * usable
+
+        zero = y(0.0)
+        self.canvas.create_line(0, zero, width, zero, fill=DARK_FG, dash=(2, 4))
+        step = width / (len(values) - 1)
+        coords = []
+        for index, value in enumerate(values):
+            coords.extend((index * step, y(value)))
+        self.canvas.create_line(*coords, fill=GAIN_COLOR if values[-1] >= 0 else LOSS_COLOR, width=2)
+
+    def on_destroy(self, event):
+        if event.widget is self.window and self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
@@ -0,0 +1,227 @@
+import re
+import threading
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+# Prioridade das formas indexadas de cada símbolo (menor = melhor)
+RANK_FULL = 0
+RANK_WORD = 1
+
+
+def normalize(text):
+    """Minúsculas, apenas letras e números ('EUR/USD' -> 'eurusd')"""
+    return _NON_ALNUM.sub('', str(text).lower())
+
+
+def words(text):
+    """Palavras normalizadas do texto, separadas por qualquer não alfanumérico ('EUR/USD' -> ['eur', 'usd'])"""
+    return [word for word in _NON_ALNUM.split(str(text).lower()) if word]
+
+
+def symbol_keys(label, code):
+    """Formas pesquisáveis de um símbolo: (chave, rank)"""
+    yield normalize(code), RANK_FULL
+    yield normalize(label), RANK_FULL
+    label_words = words(label)
+    if len(label_words) > 1:
+        for word in label_words:
+            yield word, RANK_WORD
+
+
+class SymbolIndex:
+    """
+    Índice de busca sobre o catálogo de símbolos (rótulo e código)
+
+    Cada rótulo, código e palavra do rótulo é inserido numa trie de prefixos.
+    Cada nó guarda já ordenados os melhores símbolos da sua subárvore
+    (limitados a NODE_LIMIT), então uma busca por prefixo custa apenas o
+    percurso do texto digitado. Quando os prefixos não bastam, uma busca
+    aproximada aceita uma edição (troca, inserção, remoção ou transposição).
+    """
+
+    NODE_LIMIT = 32
+    FUZZY_MIN_LENGTH = 3
+
+    def __init__(self, symbols):
+        self.symbols = [(item["label"], item["code"]) for item in symbols]
+        self.code_by_label = {label: code for label, code in self.symbols}
+        self._root = self._build()
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def code_for(self, label):
+        """Retorna o código do símbolo a partir do rótulo (None se desconhecido)"""
+        return self.code_by_label.get(label)
+
+    def _build(self):
+        # Nó: [filhos, entradas]; entrada: (rank, tamanho do rótulo, id)
+        entries = []
+        for symbol_id, (label, code) in enumerate(self.symbols):
+            for key, rank in symbol_keys(label, code):
+                if key:
+                    entries.append((rank, len(label), label, symbol_id, key))
+        # Inserindo na ordem de prioridade, os primeiros NODE_LIMIT símbolos
+        # de cada nó já são os melhores da sua subárvore
+        entries.sort()
+
+        limit = self.NODE_LIMIT
+        root = [{}, []]
+        for rank, length, _, symbol_id, key in entries:
+            entry = (rank, length, symbol_id)
+            node = root
+            for char in key:
+                if len(node[1]) < limit and all(e[2] != symbol_id for e in node[1]):
+                    node[1].append(entry)
+                child = node[0].get(char)
+                if child is None:
+                    child = node[0][char] = [{}, []]
+                node = child
+            if len(node[1]) < limit and all(e[2] != symbol_id for e in node[1]):
+                node[1].append(entry)
+        return root
+
+    def search(self, query, limit=10):
+        """
+        Retorna até `limit` símbolos ({'label', 'code'}) que combinam com o texto
+
+        Ordem: correspondência de prefixo antes da aproximada; em seguida
+        rótulo/código completo antes de palavra isolada; por fim rótulos
+        mais curtos.
+        """
+        q = normalize(query)
+        if not q:
+            return [{"label": label, "code": code} for label, code in self.symbols[:limit]]
+
+        scores = {}
+        node = self._root
+        for char in q:
+            node = node[0].get(char)
+            if node is None:
+                break
+        else:
+            for rank, length, symbol_id in node[1]:
+                scores[symbol_id] = (0, rank, length)
+
+        if len(scores) < limit and len(q) >= self.FUZZY_MIN_LENGTH:
+            for rank, length, symbol_id in self._fuzzy(q):
+                score = (1, rank, length)
+                if score < scores.get(symbol_id, (99,)):
+                    scores[symbol_id] = score
+
+        ranked = sorted(scores.items(), key=lambda item: (item[1], self.symbols[item[0]][0]))
+        return [{"label": self.symbols[i][0], "code": self.symbols[i][1]} for i, _ in ranked[:limit]]
+
+    def _fuzzy(self, q):
+        """
+        Entradas cujo prefixo está a uma edição de q
+
+        Percorre o caminho exato de q e, em cada posição, gasta a única edição
+        permitida (troca, inserção, remoção ou transposição) seguindo depois
+        apenas caminhos exatos. O custo é proporcional ao tamanho do texto e
+        ao número de filhos por nó, não ao tamanho do catálogo.
+        """
+        results = []
+        node = self._root
+        for i, wanted in enumerate(q):
+            for char, child in node[0].items():
+                if char != wanted:
+                    # Troca de um caractere
+                    self._collect(child, q, i + 1, results)
+                # Caractere a mais na chave
+                self._collect(child, q, i, results)
+            # Caractere a mais no texto digitado
+            self._collect(node, q, i + 1, results)
+            # Dois caracteres trocados de lugar
+            if i + 1 < len(q) and q[i + 1] != wanted:
+                swapped = node[0].get(q[i + 1])
+                if swapped is not None:
+                    swapped = swapped[0].get(wanted)
+                    if swapped is not None:
+                        self._collect(swapped, q, i + 2, results)
+            node = node[0].get(wanted)
+            if node is None:
+                break
+        return results
+
+    @staticmethod
+    def _collect(node, q, start, results):
+        """Segue q[start:] exatamente a partir do nó e guarda as entradas alcançadas"""
+        for char in q[start:]:
+            node = node[0].get(char)
+            if node is None:
+                return
+        results.extend(node[1])
+
+
+class LinearIndex:
+    """
+    Busca por varredura do catálogo, usada enquanto a trie do SymbolIndex é
+    montada em segundo plano
+
+    Mesma interface e mesma ordem dos resultados de prefixo do SymbolIndex,
+    sem a busca aproximada; custa O(n) por busca, mas não tem montagem.
+    """
+
+    def __init__(self, symbols):
+        self.symbols = [(item["label"], item["code"]) for item in symbols]
+        self.code_by_label = {label: code for label, code in self.symbols}
+        self._keys = None
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def code_for(self, label):
+        """Retorna o código do símbolo a partir do rótulo (None se desconhecido)"""
+        return self.code_by_label.get(label)
+
+    def search(self, query, limit=10):
+        """Retorna até `limit` símbolos ({'label', 'code'}) cujo código, rótulo ou palavra começa pelo texto"""
+        q = normalize(query)
+        if not q:
+            return [{"label": label, "code": code} for label, code in self.symbols[:limit]]
+        if self._keys is None:
+            self._keys = [list(symbol_keys(label, code)) for label, code in self.symbols]
+
+        scores = []
+        for symbol_id, keys in enumerate(self._keys):
+            ranks = [rank for key, rank in keys if key.startswith(q)]
+            if ranks:
+                label = self.symbols[symbol_id][0]
+                scores.append((min(ranks), len(label), label, symbol_id))
+        scores.sort()
+        return [{"label": self.symbols[i][0], "code": self.symbols[i][1]} for *_, i in scores[:limit]]
+
+
+_cache = (None, None)
+_pending = (None, None)
+_cache_lock = threading.Lock()
+
+
+def index_for(symbols):
+    """
+    Retorna o índice do catálogo, reaproveitando-o enquanto a lista não mudar
+
+    Nunca espera pela montagem da trie: se ela ainda não existe, é montada
+    numa thread e até lá é retornado um LinearIndex. Quem guarda o índice deve
+    chamar index_for de novo para passar a usar a trie quando ela ficar pronta.
+    """
+    global _pending
+    with _cache_lock:
+        if _cache[0] is symbols:
+            return _cache[1]
+        if _pending[0] is symbols:
+            return _pending[1]
+        _pending = (symbols, LinearIndex(symbols))
+        fallback = _pending[1]
+    threading.Thread(target=_build, args=(symbols,), name="symbol-index", daemon=True).start()
+    return fallback
+
+
+def _build(symbols):
+    global _cache, _pending
+    index = SymbolIndex(symbols)
+    with _cache_lock:
+        _cache = (symbols, index)
+        if _pending[0] is symbols:
+            _pending = (None, None)
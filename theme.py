@@ -0,0 +1,7 @@
+# Configuração do tema dark
+DARK_BG = "#2a2a2a"
+DARK_FG = "#ffffff"
+DARK_ENTRY = "#3a3a3a"
+DARK_BUTTON = "#3a3a3a"
+DARK_SELECT = "#4a4a4a"
+DARK_HOVER = "#5a5a5a"
@@ -0,0 +1,172 @@
+"""
+Estatísticas de resultado das operações liquidadas
+
+Os agregados (taxa de acerto, resultado líquido, quebras por mercado e por
+expiração, drawdown e curva de capital) são mantidos incrementalmente: cada
+operação liquidada custa O(1). Só a recarga completa do histórico recalcula
+tudo de uma vez, com NumPy quando estiver instalado.
+"""
+from array import array
+
+_numpy = None
+
+
+def numpy():
+    """Importa o NumPy na primeira recarga; None se não estiver instalado"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy as np
+        except ImportError:
+            np = False
+        _numpy = np
+    return _numpy or None
+
+
+class TradeStats:
+    """
+    Agregados das operações liquidadas de um usuário
+
+    add() é chamado para cada operação liquidada, na ordem de liquidação;
+    reload() substitui tudo a partir do histórico completo. version muda a
+    cada alteração, para a interface saber quando redesenhar.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self.wins = 0
+        self.losses = 0
+        self.net = 0.0
+        self.gross_win = 0.0
+        self.gross_loss = 0.0
+        self.peak = 0.0
+        self.max_drawdown = 0.0
+        self.by_symbol = {}    # símbolo -> [operações, ganhos, resultado]
+        self.by_expiry = {}    # minutos -> [operações, ganhos, resultado]
+        self.equity = array('d')
+        self.version = getattr(self, 'version', 0) + 1
+
+    def add(self, symbol, time_minutes, result):
+        """Soma uma operação liquidada"""
+        result = float(result)
+        win = result > 0
+        self.count += 1
+        if win:
+            self.wins += 1
+            self.gross_win += result
+        elif result < 0:
+            self.losses += 1
+            self.gross_loss -= result
+        self.net += result
+        self.equity.append(self.net)
+        if self.net > self.peak:
+            self.peak = self.net
+        elif self.peak - self.net > self.max_drawdown:
+            self.max_drawdown = self.peak - self.net
+        for groups, key in ((self.by_symbol, symbol), (self.by_expiry, time_minutes)):
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = [0, 0, 0.0]
+            group[0] += 1
+            group[1] += win
+            group[2] += result
+        self.version += 1
+
+    def reload(self, symbols, minutes, results):
+        """
+        Recalcula tudo a partir do histórico completo
+
+        Recebe três sequências alinhadas (símbolo, minutos de expiração e
+        resultado), na ordem de liquidação.
+        """
+        np = numpy()
+        if np is None or not len(results):
+            self.reset()
+            for symbol, time_minutes, result in zip(symbols, minutes, results):
+                self.add(symbol, time_minutes, result)
+            return
+
+        values = np.asarray(results, dtype=float)
+        equity = np.cumsum(values)
+        peak = np.maximum.accumulate(np.maximum(equity, 0.0))
+        wins = values > 0
+        losses = values < 0
+
+        self.reset()
+        self.count = len(values)
+        self.wins = int(wins.sum())
+        self.losses = int(losses.sum())
+        self.gross_win = float(values[wins].sum())
+        self.gross_loss = float(-values[losses].sum())
+        self.net = float(equity[-1])
+        self.peak = float(peak[-1])
+        self.max_drawdown = float((peak - equity).max())
+        self.equity.frombytes(equity.astype('d').tobytes())
+        self.by_symbol = self._grouped(np, symbols, values, wins)
+        self.by_expiry = self._grouped(np, minutes, values, wins)
+        self.version += 1
+
+    @staticmethod
+    def _grouped(np, keys, values, wins):
+        labels, inverse = np.unique(np.asarray(keys), return_inverse=True)
+        size = len(labels)
+        counts = np.bincount(inverse, minlength=size)
+        win_counts = np.bincount(inverse, weights=wins, minlength=size)
+        nets = np.bincount(inverse, weights=values, minlength=size)
+        return {label.item(): [int(c), int(w), float(n)]
+                for label, c, w, n in zip(labels, counts, win_counts, nets)}
+
+    # ---- Leitura ----
+
+    @property
+    def win_rate(self):
+        return self.wins / self.count if self.count else 0.0
+
+    @property
+    def drawdown(self):
+        """Distância atual do pico da curva de capital"""
+        return self.peak - self.net
+
+    @property
+    def profit_factor(self):
+        return self.gross_win / self.gross_loss if self.gross_loss else None
+
+    @staticmethod
+    def breakdown(groups):
+        """Linhas (chave, operações, taxa de acerto, resultado), do maior resultado para o menor"""
+        rows = [(key, count, wins / count if count else 0.0, net) for key, (count, wins, net) in groups.items()]
+        rows.sort(key=lambda row: row[3], reverse=True)
+        return rows
+
+    def curve(self, points=600):
+        """
+        Curva de capital reduzida a no máximo ~points valores
+
+        Cada trecho contribui com o seu mínimo e máximo, para que quedas
+        curtas continuem visíveis mesmo com centenas de milhares de operações.
+        """
+        equity = self.equity
+        if len(equity) <= points:
+            return list(equity)
+        step = -(-len(equity) // (points // 2))
+        reduced = []
+        for start in range(0, len(equity), step):
+            chunk = equity[start:start + step]
+            low, high = min(chunk), max(chunk)
+            reduced.extend((high, low) if chunk.index(low) > chunk.index(high) else (low, high))
+        return reduced
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'wins': self.wins,
+            'losses': self.losses,
+            'win_rate': self.win_rate,
+            'net': self.net,
+            'profit_factor': self.profit_factor,
+            'max_drawdown': self.max_drawdown,
+            'drawdown': self.drawdown,
+        }
@@ -0,0 +1,95 @@
+import queue
+import threading
+
+POLL_INTERVAL_MS = 50
+
+
+class UiWorker:
+    """
+    Executa trabalho bloqueante (rede, disco) fora da thread do Tk
+
+    Cada tarefa roda numa thread daemon e o resultado volta para a thread da
+    interface por uma fila consumida com root.after, já que widgets Tk só
+    podem ser tocados pela thread principal.
+
+    As tarefas são identificadas por uma chave (single-flight): enquanto uma
+    tarefa com a mesma chave estiver em andamento, novos pedidos não disparam
+    outra requisição.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._results = queue.Queue()
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        self._polling = False
+        self._persistent = False
+
+    def keep_alive(self):
+        """
+        Mantém a fila sendo consumida continuamente
+
+        Necessário quando outras threads usam post() sem uma tarefa submetida,
+        pois elas não podem agendar o consumo (root.after) por conta própria.
+        """
+        self._persistent = True
+        self._schedule_poll()
+
+    def post(self, callback, *args):
+        """Agenda callback(*args) para rodar na thread do Tk (seguro a partir de qualquer thread)"""
+        self._results.put((None, lambda value: callback(*value), args))
+
+    def is_running(self, key):
+        """Indica se há uma tarefa com a chave em andamento"""
+        with self._lock:
+            return key in self._in_flight
+
+    def submit(self, key, func, on_success=None, on_error=None, args=()):
+        """
+        Dispara func(*args) em segundo plano
+
+        on_success(resultado) ou on_error(exceção) são chamados na thread do Tk.
+        Retorna False se já havia uma tarefa com a mesma chave em andamento.
+        """
+        with self._lock:
+            if key in self._in_flight:
+                return False
+            self._in_flight.add(key)
+
+        def run():
+            try:
+                result = func(*args)
+            except Exception as e:
+                self._results.put((key, on_error, e))
+            else:
+                self._results.put((key, on_success, result))
+
+        threading.Thread(target=run, daemon=True).start()
+        self._schedule_poll()
+        return True
+
+    def _schedule_poll(self):
+        if not self._polling:
+            self._polling = True
+            self.root.after(POLL_INTERVAL_MS, self._drain)
+
+    def _drain(self):
+        """Entrega os resultados prontos na thread do Tk"""
+        self._polling = False
+        while True:
+            try:
+                key, callback, value = self._results.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._in_flight.discard(key)
+            if callback:
+                try:
+                    callback(value)
+                except Exception as e:
+                    print(f"Erro ao processar resultado de '{key}': {e}")
+
+        with self._lock:
+            pending = bool(self._in_flight)
+        if pending or self._persistent:
+            self._schedule_poll()
@@ -0,0 +1,110 @@
+import random
+from hashlib import sha256
+
+from api_client import api_client
+
+USER_INFO_ENDPOINT = 'user-info/'
+
+# Intervalos de atualização dos dados do usuário (s)
+ACTIVE_INTERVAL = 3      # com operações abertas o saldo muda a cada liquidação
+IDLE_INTERVAL = 30       # sem operações abertas
+MAX_INTERVAL = 300       # teto do backoff (ocioso sem mudanças ou com erros)
+BACKOFF_FACTOR = 2
+JITTER = 0.1
+
+
+class UserInfoPoller:
+    """
+    Atualização adaptativa de 'user-info/<uuid>'
+
+    Com operações abertas o endpoint é consultado a cada ACTIVE_INTERVAL
+    segundos. Sem operações o intervalo começa em IDLE_INTERVAL e dobra a cada
+    consulta sem mudança, até MAX_INTERVAL; erros também dobram o intervalo.
+    As requisições são condicionais (ETag/Last-Modified) e, se o servidor não
+    suportar, o hash do corpo evita reprocessar uma resposta idêntica.
+
+    Não toca na interface: quem agenda as consultas é a tela (root.after) e a
+    requisição roda no UiWorker.
+    """
+
+    def __init__(self, active_interval=ACTIVE_INTERVAL, idle_interval=IDLE_INTERVAL,
+                 max_interval=MAX_INTERVAL):
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.max_interval = max_interval
+        self.interval = idle_interval
+        self.failures = 0
+        self._etag = None
+        self._last_modified = None
+        self._hash = None
+
+    def fetch(self, user_uuid):
+        """
+        Busca os dados do usuário (roda fora da thread do Tk)
+
+        Retorna os dados novos ou None quando nada mudou desde a última consulta.
+        """
+        headers = {}
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified
+
+        response = api_client.get(USER_INFO_ENDPOINT + user_uuid, headers=headers)
+        if response.status_code == 304:
+            return None
+        if response.status_code != 200:
+            raise ValueError("Erro ao carregar os dados do usuário, informações nao atualizadas.")
+
+        self._etag = response.headers.get('ETag')
+        self._last_modified = response.headers.get('Last-Modified')
+        content_hash = sha256(response.content).hexdigest()
+        if content_hash == self._hash:
+            return None
+        data = response.json()['data']
+        self._hash = content_hash
+        return data
+
+    def invalidate(self):
+        """Força a próxima consulta a trazer o corpo completo (ex.: atualização manual)"""
+        self._etag = self._last_modified = self._hash = None
+
+    def next_delay(self, active, changed=False, error=False):
+        """
+        Calcula o intervalo até a próxima consulta (s)
+
+        Parâmetros:
+        - active: há operações abertas aguardando liquidação
+        - changed: a última consulta trouxe dados novos
+        - error: a última consulta falhou
+        """
+        if error:
+            self.failures += 1
+            base = self.active_interval if active else self.idle_interval
+            self.interval = min(self.max_interval, base * BACKOFF_FACTOR ** self.failures)
+        else:
+            self.failures = 0
+            if active:
+                self.interval = self.active_interval
+            elif changed or self.interval < self.idle_interval:
+                self.interval = self.idle_interval
+            else:
+                self.interval = min(self.max_interval, self.interval * BACKOFF_FACTOR)
+        return self._jittered(self.interval)
+
+    def force_active(self):
+        """
+        Volta ao intervalo rápido quando operações são abertas e retorna o
+        atraso (s) da próxima consulta
+
+        Diferente de next_delay, não conta como resultado de consulta: não
+        dobra o intervalo nem zera o backoff de erros.
+        """
+        if not self.failures:
+            self.interval = self.active_interval
+        return self._jittered(self.interval)
+
+    @staticmethod
+    def _jittered(interval):
+        # Espalha as consultas para não sincronizar várias instâncias
+        return interval * random.uniform(1 - JITTER, 1 + JITTER)
@@ -0,0 +1,282 @@
+import tkinter as tk
+from tkinter import ttk
+
+from perf import metrics
+
+
+class VirtualTreeview(tk.Frame):
+    """
+    Tabela virtualizada sobre um ttk.Treeview
+
+    Os dados ficam numa lista Python e o Treeview só possui as linhas que
+    cabem na área visível. Ao rolar, essas mesmas linhas são reaproveitadas
+    com os valores da nova janela, então o custo de inserir e rolar não cresce
+    com o tamanho do histórico.
+
+    Cada linha tem uma chave (retornada por insert) usada para atualizar ou
+    consultar a linha depois. Com newest_first=True as linhas inseridas por
+    último aparecem no topo, sem custo de inserção no início da lista.
+
+    Linhas mais antigas podem ser acrescentadas depois com extend_older (ex.:
+    páginas seguintes de um histórico paginado); on_need_more é chamado
+    quando a rolagem chega ao fim dos dados carregados.
+
+    Com formatter, cada linha é um registro qualquer (ex.: Operation) e
+    formatter(registro) gera os valores das colunas só quando a linha é
+    desenhada; depois de alterar o registro basta chamar refresh(chave).
+    """
+
+    def __init__(self, master, columns, newest_first=True, rowheight=25, bg=None, on_need_more=None,
+                 formatter=None):
+        super().__init__(master, bg=bg)
+        self.columns = tuple(columns)
+        self.newest_first = newest_first
+        self.rowheight = rowheight
+        self.formatter = formatter
+
+        self.on_need_more = on_need_more
+
+        # As linhas ficam em duas listas para permitir acrescentar nas duas
+        # pontas em O(1): _back recebe as novas (sequência 0, 1, 2...) e
+        # _front as mais antigas (sequência -1, -2...), guardadas ao contrário.
+        self._back_rows = []
+        self._back_keys = []
+        self._front_rows = []
+        self._front_keys = []
+        self._index = {}     # chave -> sequência
+        self._next_key = 0
+        self._top = 0
+        self._pool = []
+        self._selected_key = None
+        self._rendering = False
+
+        self.tree = ttk.Treeview(self, columns=self.columns, show="headings",
+                                 selectmode="browse", height=1)
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+        self.tree.pack(expand=True, fill=tk.BOTH)
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        self.tree.bind("<MouseWheel>", self._on_wheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(3))
+        self.tree.bind("<Prior>", lambda e: self.scroll(-len(self._pool)) or "break")
+        self.tree.bind("<Next>", lambda e: self.scroll(len(self._pool)) or "break")
+
+    # ---- Delegação das configurações de colunas ----
+
+    def heading(self, column, **kwargs):
+        return self.tree.heading(column, **kwargs)
+
+    def column(self, column, **kwargs):
+        return self.tree.column(column, **kwargs)
+
+    # ---- Dados ----
+
+    def __len__(self):
+        return len(self._front_rows) + len(self._back_rows)
+
+    def _new_key(self, key):
+        if key is None:
+            key = self._next_key
+            self._next_key += 1
+        return key
+
+    def _row(self, physical):
+        seq = physical - len(self._front_rows)
+        if seq >= 0:
+            return self._back_rows[seq]
+        return self._front_rows[-seq - 1]
+
+    def _key(self, physical):
+        seq = physical - len(self._front_rows)
+        if seq >= 0:
+            return self._back_keys[seq]
+        return self._front_keys[-seq - 1]
+
+    def _physical_of(self, key):
+        return self._index[key] + len(self._front_rows)
+
+    def _stored(self, values):
+        # Sem formatter as linhas são listas mutáveis (ver set)
+        return values if self.formatter else list(values)
+
+    def _values(self, row):
+        return self.formatter(row) if self.formatter else row
+
+    def insert(self, values, key=None):
+        """Adiciona uma linha (a mais recente) e retorna a sua chave"""
+        key = self._new_key(key)
+        self._index[key] = len(self._back_rows)
+        self._back_rows.append(self._stored(values))
+        self._back_keys.append(key)
+        # Mantém a janela visível parada quando o usuário rolou para baixo
+        if self.newest_first and self._top:
+            self._top += 1
+        self._render()
+        return key
+
+    def extend(self, rows):
+        """Adiciona várias linhas recentes (pares (chave, valores), da mais antiga para a mais nova)"""
+        added = 0
+        for key, values in rows:
+            key = self._new_key(key)
+            self._index[key] = len(self._back_rows)
+            self._back_rows.append(self._stored(values))
+            self._back_keys.append(key)
+            added += 1
+        # Mantém a janela visível parada quando o usuário rolou para baixo (como em insert)
+        if self.newest_first and self._top:
+            self._top += added
+        self._render()
+
+    def extend_older(self, rows):
+        """Adiciona linhas mais antigas (pares (chave, valores), da mais nova para a mais antiga)"""
+        for key, values in rows:
+            key = self._new_key(key)
+            self._front_rows.append(self._stored(values))
+            self._front_keys.append(key)
+            self._index[key] = -len(self._front_rows)
+        if not self.newest_first:
+            self._top += len(rows)
+        self._render()
+
+    def clear(self):
+        """Remove todas as linhas"""
+        for rows in (self._back_rows, self._back_keys, self._front_rows, self._front_keys):
+            rows.clear()
+        self._index.clear()
+        self._top = 0
+        self._selected_key = None
+        self._render()
+
+    def exists(self, key):
+        return key in self._index
+
+    def item_values(self, key):
+        """Retorna os valores de uma linha"""
+        return tuple(self._values(self._row(self._physical_of(key))))
+
+    def row(self, key):
+        """Retorna o registro (ou a lista de valores) guardado para a chave"""
+        return self._row(self._physical_of(key))
+
+    def _slot(self, physical):
+        slot = self._display_index(physical) - self._top
+        return self._pool[slot] if 0 <= slot < len(self._pool) else None
+
+    def set(self, key, column, value):
+        """Atualiza uma coluna de uma linha; só toca o Treeview se a linha estiver visível"""
+        physical = self._physical_of(key)
+        self._row(physical)[self.columns.index(column)] = value
+        iid = self._slot(physical)
+        if iid is not None:
+            self.tree.set(iid, column, value)
+
+    def refresh(self, key):
+        """Redesenha uma linha cujo registro mudou, se estiver visível"""
+        physical = self._physical_of(key)
+        iid = self._slot(physical)
+        if iid is not None:
+            self.tree.item(iid, values=self._values(self._row(physical)))
+
+    def selected_key(self):
+        return self._selected_key
+
+    # ---- Rolagem e renderização ----
+
+    def _physical_index(self, display_index):
+        if self.newest_first:
+            return len(self) - 1 - display_index
+        return display_index
+
+    def _display_index(self, physical_index):
+        # A conversão é simétrica: a mesma fórmula serve nos dois sentidos
+        return self._physical_index(physical_index)
+
+    def _visible_count(self):
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return 1
+        # Desconta a linha do cabeçalho
+        return max(1, height // self.rowheight - 1)
+
+    def _resize_pool(self):
+        wanted = self._visible_count()
+        while len(self._pool) < wanted:
+            self._pool.append(self.tree.insert("", "end", values=()))
+        while len(self._pool) > wanted:
+            self.tree.delete(self._pool.pop())
+
+    def scroll_to(self, top):
+        max_top = max(0, len(self) - len(self._pool))
+        top = min(max(0, int(top)), max_top)
+        if top != self._top:
+            self._top = top
+            self._render()
+        # Chegou ao fim do que está carregado: pede a próxima página
+        if self.on_need_more and len(self) and top >= max_top:
+            self.on_need_more()
+
+    def scroll(self, delta):
+        self.scroll_to(self._top + delta)
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self.scroll_to(float(args[0]) * len(self))
+        elif action == "scroll":
+            amount = int(args[0])
+            if args[1] == "pages":
+                amount *= len(self._pool)
+            self.scroll(amount)
+
+    def _on_wheel(self, event):
+        self.scroll(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def _on_configure(self, event):
+        self._resize_pool()
+        self.scroll_to(self._top)
+        self._render()
+
+    def _on_select(self, event):
+        if self._rendering:
+            return
+        selection = self.tree.selection()
+        if not selection or selection[0] not in self._pool:
+            self._selected_key = None
+            return
+        display = self._top + self._pool.index(selection[0])
+        if display < len(self):
+            self._selected_key = self._key(self._physical_index(display))
+
+    @metrics.timed('ui.tree_render')
+    def _render(self):
+        """Preenche as linhas do pool com a janela atual dos dados"""
+        self._rendering = True
+        try:
+            total = len(self)
+            selected_iid = None
+            for slot, iid in enumerate(self._pool):
+                display = self._top + slot
+                if display < total:
+                    physical = self._physical_index(display)
+                    self.tree.item(iid, values=self._values(self._row(physical)))
+                    if self._key(physical) == self._selected_key:
+                        selected_iid = iid
+                else:
+                    self.tree.item(iid, values=())
+            if selected_iid:
+                self.tree.selection_set(selected_iid)
+            elif self.tree.selection():
+                self.tree.selection_remove(self.tree.selection())
+
+            if total:
+                first = self._top / total
+                last = min(1.0, (self._top + len(self._pool)) / total)
+                self.scrollbar.set(first, last)
+            else:
+                self.scrollbar.set(0, 1)
+        finally:
+            self._rendering = False